@@ -0,0 +1,47 @@
+import numpy as np
+
+
+class BlockAccumulator:
+    """
+    Découpe au fil de l'eau un flux de samples en blocs de block_size samples et résume chaque bloc complet avec
+    summarize (fonction recevant un tableau 2-D de blocs et retournant une ligne de columns valeurs par bloc).
+    Seul le dernier bloc incomplet est conservé entre deux appels à write ; il est résumé à la fermeture.
+    """
+
+    def __init__(self, block_size, summarize, columns):
+        self.block_size = block_size
+        self.num_samples = 0
+        self._summarize = summarize
+        self._columns = columns
+        self._carried = np.empty(0)
+        self._rows = []
+
+    def write(self, samples):
+        """Ajoute des samples au flux résumé."""
+        samples = np.asarray(samples).reshape(-1)
+        self.num_samples += samples.size
+        if self._carried.size:
+            # Compléter le bloc en attente sans recopier tout le chunk
+            missing = self.block_size - self._carried.size
+            head = np.concatenate((self._carried, samples[:missing]))
+            samples = samples[missing:]
+            if head.size < self.block_size:
+                self._carried = head
+                return
+            self._rows.append(self._summarize(head.reshape(1, -1)))
+        full = samples.size - samples.size % self.block_size
+        if full:
+            self._rows.append(self._summarize(samples[:full].reshape(-1, self.block_size)))
+        self._carried = samples[full:].copy()
+
+    def close(self):
+        """
+        Résume le dernier bloc incomplet.
+        :return: Tableau (n_blocs, columns) des résumés de tous les blocs.
+        """
+        if self._carried.size:
+            self._rows.append(self._summarize(self._carried.reshape(1, -1)))
+            self._carried = np.empty(0)
+        rows = np.concatenate(self._rows) if self._rows else np.empty((0, self._columns))
+        self._rows = []
+        return rows
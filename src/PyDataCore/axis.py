@@ -0,0 +1,79 @@
+import math
+
+import numpy as np
+
+_INDEX_TOLERANCE = 1e-9  # Tolérance (en fraction de pas) sur les bornes, pour absorber les arrondis flottants
+
+
+class LinearAxis:
+    """
+    Axe régulier (temps ou fréquence) d'un signal : la valeur du sample i vaut start + i * step.
+    L'axe est généré à la demande, sans matérialiser de tableau : indexation, tranches (qui restent des axes),
+    itération et conversion en indices. np.asarray(axis) le matérialise si nécessaire.
+    """
+
+    __slots__ = ('start', 'step', 'length')
+
+    def __init__(self, start, step, length):
+        """
+        :param start: Valeur du premier sample (tmin ou fmin).
+        :param step: Pas entre deux samples (dt ou df), strictement positif.
+        :param length: Nombre de samples.
+        """
+        if step <= 0:
+            raise ValueError("Axis step must be strictly positive.")
+        self.start = start
+        self.step = step
+        self.length = int(length or 0)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            first, stop, stride = index.indices(self.length)
+            if stride < 0:
+                raise ValueError("Axis slices must have a positive step.")
+            return LinearAxis(self.start + first * self.step, self.step * stride, len(range(first, stop, stride)))
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Axis index out of range.")
+        return self.start + index * self.step
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield self.start + i * self.step
+
+    def __array__(self, dtype=None, copy=None):
+        return (self.start + self.step * np.arange(self.length, dtype=np.float64)).astype(dtype or np.float64)
+
+    def __eq__(self, other):
+        return (isinstance(other, LinearAxis)
+                and (self.start, self.step, self.length) == (other.start, other.step, other.length))
+
+    def __repr__(self):
+        return f"LinearAxis(start={self.start!r}, step={self.step!r}, length={self.length!r})"
+
+    @property
+    def stop(self):
+        """Valeur de l'axe juste après le dernier sample (start + length * step)."""
+        return self.start + self.length * self.step
+
+    def index_range(self, low, high):
+        """
+        Retourne la plage d'indices [start, stop) des samples dont la valeur est comprise entre low et high
+        (bornes incluses), tronquée aux limites de l'axe.
+        """
+        if low > high:
+            raise ValueError("Range start must be less than or equal to range end.")
+        start = math.ceil((low - self.start) / self.step - _INDEX_TOLERANCE)
+        stop = math.floor((high - self.start) / self.step + _INDEX_TOLERANCE) + 1
+        start = min(max(start, 0), self.length)
+        return start, max(start, min(stop, self.length))
+
+    def nearest_index(self, value):
+        """Retourne l'indice du sample le plus proche de value (borné à l'axe)."""
+        if self.length == 0:
+            raise IndexError("Axis is empty.")
+        return min(max(int(round((value - self.start) / self.step)), 0), self.length - 1)
@@ -0,0 +1,102 @@
+import numpy as np
+
+from .accumulator import BlockAccumulator
+
+# Colonnes de l'index des statistiques par bloc (tableau float64 de forme (n_blocs, 4))
+STATS_MIN, STATS_MAX, STATS_SUM, STATS_SUMSQ = range(4)
+
+
+class BlockStats:
+    """
+    Index des statistiques d'un signal par blocs de block_size samples (le dernier bloc peut être partiel).
+    Chaque attribut est un tableau NumPy avec un élément par bloc : les prédicats s'écrivent de façon vectorisée,
+    par exemple lambda stats: stats.max > 5.0 ou lambda stats: stats.rms > 0.1.
+    """
+
+    def __init__(self, rows, block_size, num_samples):
+        """
+        :param rows: Tableau (n_blocs, 4) : min, max, somme et somme des carrés de chaque bloc.
+        :param block_size: Nombre de samples par bloc.
+        :param num_samples: Nombre total de samples du signal.
+        """
+        self.rows = np.asarray(rows, dtype=np.float64).reshape(-1, 4)
+        self.block_size = int(block_size)
+        self.num_samples = int(num_samples)
+        self.min = self.rows[:, STATS_MIN]
+        self.max = self.rows[:, STATS_MAX]
+        self.sum = self.rows[:, STATS_SUM]
+        self.sumsq = self.rows[:, STATS_SUMSQ]
+        self.count = np.full(len(self.rows), self.block_size, dtype=np.int64)
+        if len(self.count):
+            self.count[-1] = self.num_samples - (len(self.count) - 1) * self.block_size
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def mean(self):
+        return self.sum / self.count
+
+    @property
+    def rms(self):
+        return np.sqrt(self.sumsq / self.count)
+
+    @property
+    def std(self):
+        return np.sqrt(np.maximum(self.sumsq / self.count - self.mean ** 2, 0.0))
+
+    def block_range(self, index):
+        """Retourne la plage de samples [start, stop) du bloc index."""
+        start = int(index) * self.block_size
+        return start, min(start + self.block_size, self.num_samples)
+
+    def totals(self):
+        """Statistiques globales du signal, combinées à partir des blocs (None si le signal est vide)."""
+        if not len(self.rows):
+            return {'count': 0, 'min': None, 'max': None, 'sum': 0.0, 'sumsq': 0.0, 'mean': None, 'rms': None,
+                    'std': None}
+        total, total_sq = float(self.sum.sum()), float(self.sumsq.sum())
+        mean = total / self.num_samples
+        return {
+            'count': self.num_samples,
+            'min': float(self.min.min()),
+            'max': float(self.max.max()),
+            'sum': total,
+            'sumsq': total_sq,
+            'mean': mean,
+            'rms': float(np.sqrt(total_sq / self.num_samples)),
+            'std': float(np.sqrt(max(total_sq / self.num_samples - mean ** 2, 0.0))),
+        }
+
+
+class BlockStatsBuilder:
+    """Calcule au fil de l'eau l'index des statistiques par bloc ; seul le dernier bloc incomplet est conservé."""
+
+    def __init__(self, block_size):
+        self.block_size = block_size
+        self._blocks = BlockAccumulator(block_size, _block_rows, 4)
+
+    @property
+    def num_samples(self):
+        return self._blocks.num_samples
+
+    def write(self, samples):
+        """Ajoute des samples au signal indexé."""
+        self._blocks.write(samples)
+
+    def close(self):
+        """Indexe le dernier bloc incomplet. :return: BlockStats du signal."""
+        return BlockStats(self._blocks.close(), self.block_size, self.num_samples)
+
+
+def _block_rows(blocks):
+    """
+    Statistiques (min, max, somme, somme des carrés) de chaque ligne d'un tableau 2-D de samples, accumulées en
+    float64 sans copie en float64 du bloc (la conversion est faite à la volée par la réduction).
+    """
+    rows = np.empty((len(blocks), 4))
+    rows[:, STATS_MIN] = blocks.min(axis=1)
+    rows[:, STATS_MAX] = blocks.max(axis=1)
+    rows[:, STATS_SUM] = blocks.sum(axis=1, dtype=np.float64)
+    rows[:, STATS_SUMSQ] = np.einsum('ij,ij->i', blocks, blocks, dtype=np.float64)
+    return rows
@@ -0,0 +1,273 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .axis import _INDEX_TOLERANCE, LinearAxis
+from .streaming import ordered_map
+
+DEFAULT_FRAME_BATCH = 64  # Nombre de spectres comparés ensemble (un bloc 2-D) par tâche
+
+# Table des résultats : une ligne par spectre
+COMPLIANCE_DTYPE = np.dtype([
+    ('frame', np.int64),  # Indice du spectre dans la liste
+    ('timestamp', np.float64),  # Timestamp du spectre
+    ('worst_margin', np.float64),  # Plus petite marge (limite - niveau), NaN si le spectre est vide
+    ('worst_frequency', np.float64),  # Fréquence de la plus petite marge
+    ('violations', np.int64),  # Nombre de bins au-dessus de la limite
+])
+
+
+class ComplianceResult:
+    """
+    Résultat de la vérification d'une suite de spectres par rapport à une limite : table compacte (tableau NumPy
+    structuré, une ligne par spectre) et fréquences en dépassement de chaque spectre.
+    """
+
+    def __init__(self, table, exceeding):
+        self.table = table
+        self.exceeding = exceeding  # Liste (un tableau de fréquences par spectre)
+
+    def __len__(self):
+        return len(self.table)
+
+    @property
+    def passed(self):
+        """True si aucun spectre ne dépasse la limite."""
+        return not self.table['violations'].any()
+
+    def failed_frames(self):
+        """Indices des spectres dépassant la limite."""
+        return self.table['frame'][self.table['violations'] > 0]
+
+    def to_dataframe(self):
+        """Retourne une vue DataFrame (copie) de la table pour l'inspection."""
+        return pd.DataFrame(self.table)
+
+
+def check_frames(limit, frames, fmin, df, batch_size=DEFAULT_FRAME_BATCH, workers=None):
+    """
+    Vérifie une suite de spectres partageant la même grille fréquentielle (fmin + i * df) par rapport à une limite.
+    La limite est interpolée une seule fois sur la grille ; les spectres sont ensuite comparés par lots de
+    batch_size sous forme de blocs 2-D, les lots étant lus et évalués en parallèle sur un pool de threads.
+    :param limit: Limite fréquentielle (FreqLimitsData).
+    :param frames: Liste des spectres (FreqSignalData).
+    :param fmin: Fréquence du premier bin de la grille commune.
+    :param df: Pas fréquentiel de la grille commune.
+    :param batch_size: Nombre de spectres par lot.
+    :param workers: Nombre de threads (nombre de CPU par défaut).
+    :return: ComplianceResult.
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1.")
+    for frame in frames:
+        if not (np.isclose(frame.df, df) and np.isclose(frame.fmin, fmin)):
+            raise ValueError(f"Frame {frame.data_id} does not share the frequency grid (fmin={fmin}, df={df}).")
+
+    # Limite évaluée une seule fois sur la grille du plus long spectre
+    axis = LinearAxis(fmin, df, max((frame.num_samples or 0 for frame in frames), default=0))
+    frequencies = np.asarray(axis)
+    limit_levels = limit.interpolate(frequencies) if len(axis) else np.empty(0)
+
+    table = np.zeros(len(frames), dtype=COMPLIANCE_DTYPE)
+    exceeding = []
+    batches = [frames[i:i + batch_size] for i in range(0, len(frames), batch_size)]
+    workers = max(1, min(len(batches), workers or os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        tasks = ((_check_batch, batch, limit_levels, frequencies) for batch in batches)
+        for first, (rows, batch_exceeding) in zip(range(0, len(frames), batch_size),
+                                                  ordered_map(executor, tasks, 2 * workers)):
+            rows['frame'] += first
+            table[first:first + len(rows)] = rows
+            exceeding.extend(batch_exceeding)
+    return ComplianceResult(table, exceeding)
+
+
+def _check_batch(batch, limit_levels, frequencies):
+    """
+    Compare un lot de spectres à la limite : les spectres sont empilés dans un bloc 2-D (complété par -inf pour les
+    spectres plus courts, qui ne dépassent donc jamais) et toutes les marges sont calculées en une opération.
+    """
+    length = max(frame.num_samples or 0 for frame in batch)
+    block = np.full((len(batch), length), -np.inf)
+    rows = np.zeros(len(batch), dtype=COMPLIANCE_DTYPE)
+    rows['frame'] = np.arange(len(batch))
+    for i, frame in enumerate(batch):
+        rows['timestamp'][i] = frame.timestamp
+        if frame.num_samples:
+            spectrum = np.asarray(frame.read_data())
+            # Spectres complexes (FFT brute) : comparaison des modules
+            block[i, :len(spectrum)] = np.abs(spectrum) if np.iscomplexobj(spectrum) else spectrum
+    margins = limit_levels[:length] - block
+    violations = margins < 0
+    rows['violations'] = violations.sum(axis=1)
+    if length:
+        worst = margins.argmin(axis=1)
+        rows['worst_margin'] = margins[np.arange(len(batch)), worst]
+        rows['worst_frequency'] = frequencies[worst]
+    empty = ~np.isfinite(rows['worst_margin']) | (length == 0)
+    rows['worst_margin'][empty] = np.nan
+    rows['worst_frequency'][empty] = np.nan
+    return rows, [frequencies[:length][row] for row in violations]
+
+
+DEFAULT_EVALUATION_CHUNK = 1 << 20  # Nombre de samples évalués par chunk lors du parcours d'un signal temporel
+
+# Table des intervalles de dépassement d'une limite temporelle : une ligne par intervalle
+VIOLATION_DTYPE = np.dtype([
+    ('start_time', np.float64),  # Temps du premier sample en dépassement
+    ('end_time', np.float64),  # Temps du dernier sample en dépassement
+    ('samples', np.int64),  # Nombre de samples de l'intervalle
+    ('worst_time', np.float64),  # Temps du plus grand dépassement
+    ('worst_value', np.float64),  # Valeur du signal au plus grand dépassement
+    ('limit', np.float64),  # Niveau limite au plus grand dépassement
+    ('excess', np.float64),  # Plus grand dépassement (valeur - limite), strictement positif
+])
+
+
+class ViolationIntervals:
+    """Intervalles de dépassement d'une limite temporelle par un signal (tableau NumPy structuré)."""
+
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return len(self.table)
+
+    @property
+    def passed(self):
+        """True si le signal ne dépasse jamais la limite."""
+        return not len(self.table)
+
+    def to_dataframe(self):
+        """Retourne une vue DataFrame (copie) de la table pour l'inspection."""
+        return pd.DataFrame(self.table)
+
+
+class TempLimitEvaluator:
+    """
+    Évalue au fil de l'eau un signal temporel (tmin + i * dt) par rapport aux fenêtres d'une limite temporelle
+    (TempLimitsData) : pendant chaque fenêtre [transparency_time, release_time], le signal doit rester inférieur ou
+    égal au niveau de la fenêtre (le plus strict si plusieurs fenêtres se chevauchent). Chaque chunk est évalué de
+    façon vectorisée ; seul l'intervalle de dépassement en cours est conservé d'un chunk au suivant.
+    """
+
+    def __init__(self, limits, tmin, dt):
+        if dt <= 0:
+            raise ValueError("Time step must be strictly positive.")
+        self.limits = limits
+        self.tmin = tmin
+        self.dt = dt
+        self.num_samples = 0
+        self._pending = None  # Intervalle ouvert à la fin du dernier chunk (ligne VIOLATION_DTYPE)
+        self._rows = []
+
+    def write(self, samples):
+        """Évalue les samples suivants du signal."""
+        samples = np.asarray(samples).reshape(-1)
+        first, self.num_samples = self.num_samples, self.num_samples + samples.size
+        if not samples.size:
+            return
+        limit = self._chunk_limit(first, samples.size)
+        excess = samples - limit
+        exceeding = excess > 0
+
+        # Intervalles [starts, stops) de samples consécutifs en dépassement
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], exceeding.view(np.int8), [0]))))
+        starts, stops = edges[::2], edges[1::2]
+        if not starts.size:
+            self._close_pending()
+            return
+        # Plus grand dépassement de chaque intervalle (premier sample en cas d'égalité)
+        worst_excess = np.maximum.reduceat(excess, starts)
+        lengths = stops - starts
+        inside = np.flatnonzero(exceeding)
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        hits = np.flatnonzero(excess[inside] == np.repeat(worst_excess, lengths))
+        worst = inside[hits[np.searchsorted(hits, offsets[:-1])]]
+
+        rows = np.empty(starts.size, dtype=VIOLATION_DTYPE)
+        rows['start_time'] = self.tmin + (first + starts) * self.dt
+        rows['end_time'] = self.tmin + (first + stops - 1) * self.dt
+        rows['samples'] = lengths
+        rows['worst_time'] = self.tmin + (first + worst) * self.dt
+        rows['worst_value'] = samples[worst]
+        rows['limit'] = limit[worst]
+        rows['excess'] = worst_excess
+
+        if self._pending is not None:
+            if starts[0] == 0:
+                # L'intervalle du chunk précédent se poursuit dans ce chunk
+                rows[0] = self._merge(self._pending, rows[0])
+                self._pending = None
+            else:
+                self._close_pending()
+        if stops[-1] == samples.size:
+            # Le dernier intervalle peut se poursuivre dans le chunk suivant
+            self._pending, rows = rows[-1].copy(), rows[:-1]
+        if rows.size:
+            self._rows.append(rows)
+
+    def close(self):
+        """Clôture l'intervalle en cours. :return: ViolationIntervals du signal."""
+        self._close_pending()
+        table = np.concatenate(self._rows) if self._rows else np.empty(0, dtype=VIOLATION_DTYPE)
+        self._rows = []
+        return ViolationIntervals(table)
+
+    def _close_pending(self):
+        if self._pending is not None:
+            self._rows.append(np.array([self._pending], dtype=VIOLATION_DTYPE))
+            self._pending = None
+
+    @staticmethod
+    def _merge(head, tail):
+        """Réunit un intervalle et sa suite dans le chunk suivant."""
+        merged = (tail if tail['excess'] > head['excess'] else head).copy()
+        merged['start_time'] = head['start_time']
+        merged['end_time'] = tail['end_time']
+        merged['samples'] = head['samples'] + tail['samples']
+        return merged
+
+    def _chunk_limit(self, first, count):
+        """
+        Niveau limite de chaque sample [first, first + count) du signal (+inf hors des fenêtres). Chaque fenêtre
+        est convertie en plage de samples (bornes incluses, comme LinearAxis.index_range) ; chaque sample prend le
+        niveau de la dernière fenêtre commencée avant lui si elle est encore active, ce qui se construit en une
+        seule répétition vectorisée. Seules les fenêtres chevauchant la suivante, qui peuvent rester actives sous
+        une autre, sont ensuite appliquées une à une.
+        """
+        margin = _INDEX_TOLERANCE * self.dt
+        t0 = self.tmin + first * self.dt
+        _, indices = self.limits.windows_overlapping(t0 - margin, t0 + (count - 1) * self.dt + margin)
+        if not indices.size:
+            return np.full(count, np.inf)
+        levels, transparency_times, release_times = (column[indices] for column in self.limits.limit_columns())
+        starts = np.ceil((transparency_times - self.tmin) / self.dt - _INDEX_TOLERANCE).astype(np.int64) - first
+        stops = np.floor((release_times - self.tmin) / self.dt + _INDEX_TOLERANCE).astype(np.int64) + 1 - first
+        starts, stops = np.clip(starts, 0, count), np.clip(stops, 0, count)
+        # Portion de chaque fenêtre avant le début de la suivante, puis segments alternés trou / fenêtre
+        ends = np.maximum(starts, np.minimum(stops, np.append(starts[1:], count)))
+        gaps = starts - np.concatenate(([0], ends[:-1]))
+        values = np.column_stack((np.full(levels.size, np.inf), levels)).reshape(-1)
+        counts = np.column_stack((gaps, ends - starts)).reshape(-1)
+        limit = np.append(np.repeat(values, counts), np.full(count - ends[-1], np.inf))
+        for i in np.flatnonzero(stops[:-1] > starts[1:]):
+            np.minimum(limit[starts[i]:stops[i]], levels[i], out=limit[starts[i]:stops[i]])
+        return limit
+
+
+def check_temporal_signal(limits, signal, chunk_size=DEFAULT_EVALUATION_CHUNK):
+    """
+    Parcourt un signal temporel chunk par chunk (en fichier ou en RAM, mémoire constante) et retourne ses
+    intervalles de dépassement de la limite temporelle (voir TempLimitEvaluator).
+    :param limits: Limite temporelle (TempLimitsData).
+    :param signal: Signal temporel (TemporalSignalData).
+    :param chunk_size: Nombre de samples évalués par chunk.
+    :return: ViolationIntervals.
+    """
+    evaluator = TempLimitEvaluator(limits, signal.tmin, signal.dt)
+    for chunk in signal.read_chunked_data(chunk_size):
+        evaluator.write(chunk)
+    return evaluator.close()
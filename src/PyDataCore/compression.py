@@ -0,0 +1,69 @@
+import lzma
+import zlib
+
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 65536  # Nombre de samples par bloc compressé
+
+# Codecs disponibles : nom -> (compress(bytes) -> bytes, decompress(bytes) -> bytes)
+CODECS = {
+    'zlib': (zlib.compress, zlib.decompress),
+    'lzma': (lzma.compress, lzma.decompress),
+}
+
+
+def register_codec(name, compress, decompress):
+    """
+    Ajoute (ou remplace) un codec de compression utilisable pour le stockage en fichier.
+    Le nom du codec est enregistré dans l'en-tête des fichiers : il doit être enregistré avant leur relecture.
+    :param name: Nom du codec.
+    :param compress: Fonction bytes -> bytes.
+    :param decompress: Fonction bytes -> bytes.
+    """
+    CODECS[name] = (compress, decompress)
+
+
+def get_codec(name):
+    """Retourne le tuple (compress, decompress) du codec ; lève ValueError s'il est inconnu."""
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown compression codec {name!r}. Available codecs: {sorted(CODECS)}.")
+
+
+class CompressedBlockWriter:
+    """
+    Découpe un flux de samples en blocs de block_size samples, compresse chaque bloc et l'écrit à la suite
+    dans le fichier en relevant sa position : offsets[i] est la position du bloc i, offsets[-1] la fin du dernier.
+    """
+
+    def __init__(self, f, dtype, codec, block_size=DEFAULT_BLOCK_SIZE):
+        self._f = f
+        self._compress = get_codec(codec)[0]
+        self._block = np.empty(block_size, dtype=dtype)
+        self._filled = 0
+        self.offsets = [f.tell()]
+
+    def write(self, samples):
+        """Ajoute des samples au flux ; les blocs complets sont compressés et écrits."""
+        samples = np.asarray(samples, dtype=self._block.dtype).reshape(-1)
+        position = 0
+        while position < samples.size:
+            count = min(self._block.size - self._filled, samples.size - position)
+            self._block[self._filled:self._filled + count] = samples[position:position + count]
+            self._filled += count
+            position += count
+            if self._filled == self._block.size:
+                self._flush()
+        return samples.size
+
+    def _flush(self):
+        if self._filled:
+            self._f.write(self._compress(self._block[:self._filled].tobytes()))
+            self.offsets.append(self._f.tell())
+            self._filled = 0
+
+    def close(self):
+        """Écrit le dernier bloc (partiel) et retourne l'index des offsets (int64, n_blocs + 1 valeurs)."""
+        self._flush()
+        return np.asarray(self.offsets, dtype=np.int64)
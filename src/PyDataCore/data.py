@@ -1,12 +1,69 @@
 import asyncio
-import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 import numpy as np
 import os
+import sys
 from termcolor import colored
 
+from .axis import LinearAxis
+from .blockstats import BlockStats, BlockStatsBuilder
+from .compliance import DEFAULT_EVALUATION_CHUNK, DEFAULT_FRAME_BATCH, check_frames, check_temporal_signal
+from .compression import DEFAULT_BLOCK_SIZE, CompressedBlockWriter, get_codec
+from .envelope import DEFAULT_ENVELOPE_BASE, DEFAULT_ENVELOPE_FACTOR, ENVELOPE_MAX, ENVELOPE_MEAN, ENVELOPE_MIN, \
+    EnvelopeBuilder, bucket_counts, merge_points
+from .fileformat import HEADER_SIZE, append_section, read_file_header, read_section, write_header
+from .quantization import BlockQuantizer, dequantize, get_quantization_range, quantize
+from .shared import SharedArrayDescriptor, create_segment, unlink_segment
+from .streaming import WriteBehindWriter, ordered_map
+
+_BLOCK_CACHE_SIZE = 4  # Nombre minimal de blocs décompressés conservés par donnée (lectures directes successives)
+
+
+class GrowableBuffer:
+    """
+    Buffer NumPy typé pour l'ingestion chunk par chunk : préalloué à la capacité attendue si elle est connue,
+    agrandi géométriquement sinon, puis réduit à la taille utile en fin d'ingestion.
+    """
+
+    def __init__(self, dtype, capacity=0):
+        """
+        :param dtype: dtype NumPy des éléments.
+        :param capacity: Nombre d'éléments attendu (0 si inconnu).
+        """
+        self._buffer = np.empty(max(int(capacity or 0), 0), dtype=dtype)
+        self.size = 0
+
+    def extend(self, chunk):
+        """Copie un chunk (tableau, liste ou scalaire) à la suite des données, en agrandissant si nécessaire."""
+        chunk = np.asarray(chunk, dtype=self._buffer.dtype).reshape(-1)
+        end = self.size + chunk.size
+        if end > len(self._buffer):
+            # Croissance géométrique : coût amorti O(1) par élément
+            grown = np.empty(max(end, 2 * len(self._buffer), 1024), dtype=self._buffer.dtype)
+            grown[:self.size] = self._buffer[:self.size]
+            self._buffer = grown
+        self._buffer[self.size:end] = chunk
+        self.size = end
+
+    def finalize(self):
+        """Réduit le buffer à la taille utile (sans copie si possible) et le retourne."""
+        buffer = self._buffer
+        if len(buffer) != self.size:
+            try:
+                buffer.resize((self.size,), refcheck=False)
+            except ValueError:
+                buffer = buffer[:self.size].copy()
+        self._buffer = buffer
+        return buffer
+
 
 class Data:
+    self_describing = False  # Si True, les fichiers numériques commencent par un en-tête de métadonnées (fileformat)
+    block_stats = False  # Si True, un index des statistiques par bloc est construit au stockage (find_blocks)
+
     def __init__(self, data_id, data_type, data_name, data_size_in_bytes, number_of_elements=None, in_file=False,
                  sample_type='float32'):
         """
@@ -28,17 +85,52 @@ class Data:
         self.sample_type = sample_type
         self.data = None
         self.file_path = None
-        self.data_ready = asyncio.Event()  # État de disponibilité de la donnée
+        self.data_ready = threading.Event()  # État de disponibilité de la donnée (utilisable depuis tout thread)
+        self._ready_waiters = []  # Futures asyncio en attente de disponibilité (boucle, future)
+        self._ready_lock = threading.Lock()
         self.sample_format, self.sample_size = self._get_sample_format_and_size(sample_type)
+        self.dtype = None if sample_type == 'str' else np.dtype(sample_type)  # dtype NumPy des samples numériques
+        self.use_mmap = False  # Si True, les fichiers numériques sont lus via une projection mémoire (np.memmap)
+        self._memmap = None
+        self._shm = None  # Segment de mémoire partagée contenant les données (stockage 'shm')
+        self.compression = None  # Codec des fichiers compressés par blocs (voir compression.CODECS), None : brut
+        self.block_size = DEFAULT_BLOCK_SIZE  # Nombre de samples par bloc compressé
+        self.quantization = None  # Type entier de stockage des samples quantifiés ('int16', 'int8'), None : brut
+        self._quant_params = None  # (scales, offsets) des blocs quantifiés
+        self._quantizer = None
+        self._block_writer = None
+        self.envelope = False  # Si True, une pyramide d'enveloppes min/max/moyenne est construite au stockage
+        self._envelope = None  # Niveaux de la pyramide (données en RAM, ou en attente d'écriture dans le fichier)
+        self._block_stats = None  # Index des statistiques par bloc (BlockStats), gardé en cache
+        self._summary_builders = {}  # Résumés construits pendant l'écriture du fichier (attribut -> builder)
+        self._block_offsets = None  # Index des blocs compressés (offsets en bytes), lu une fois depuis le fichier
+        self._block_cache = OrderedDict()  # Derniers blocs décompressés (LRU), pour read_range/read_specific_chunk
+        self._block_cache_lock = threading.Lock()
         self.mark_data_unready()
 
     def mark_data_ready(self):
-        """Marque la donnée comme prête."""
-        self.data_ready.set()
+        """Marque la donnée comme prête et réveille les coroutines en attente, quelle que soit leur boucle."""
+        with self._ready_lock:
+            self.data_ready.set()
+            waiters, self._ready_waiters = self._ready_waiters, []
+        for loop, future in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_resolve_future, future)
 
     def mark_data_unready(self):
         """Réinitialise l'état de disponibilité de la donnée."""
-        self.data_ready.clear()
+        with self._ready_lock:
+            self.data_ready.clear()
+
+    async def wait_ready(self):
+        """Attend (sans bloquer la boucle asyncio) que la donnée soit marquée comme prête."""
+        with self._ready_lock:
+            if self.data_ready.is_set():
+                return
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._ready_waiters.append((loop, future))
+        await future
     def _get_sample_format_and_size(self, sample_type):
         """
         Retourne le format struct et la taille en octets en fonction du type de sample.
@@ -58,36 +150,436 @@ class Data:
         else:
             raise ValueError(f"Unsupported sample type: {sample_type}")
 
-    def store_data_from_data_generator(self, data_generator, folder=None):
+    def ram_footprint(self):
+        """
+        Retourne l'occupation mémoire réelle (en bytes) des données résidentes en RAM, 0 si elles sont en fichier.
+        Pour les listes, la taille des éléments Python est comptée en plus de celle du conteneur.
+        """
+        if self.in_file or self.data is None:
+            return 0
+        if isinstance(self.data, np.ndarray):
+            if self.quantization and self._quant_params is not None:
+                return self.data.nbytes + sum(params.nbytes for params in self._quant_params)
+            return self.data.nbytes
+        if isinstance(self.data, list):
+            return sys.getsizeof(self.data) + sum(sys.getsizeof(item) for item in self.data)
+        return sys.getsizeof(self.data)
+
+    def _has_header(self):
+        """Indique si le fichier de données commence par un en-tête auto-descriptif."""
+        return self.self_describing and self.sample_type != 'str'
+
+    def _payload_offset(self):
+        """Position en bytes du premier sample dans le fichier de données."""
+        return HEADER_SIZE if self._has_header() else 0
+
+    def _stored_samples(self):
+        """Nombre de samples de la charge utile du fichier (hors en-tête et sections)."""
+        if self._has_header():
+            return self.num_samples or 0
+        return os.path.getsize(self.file_path) // self.sample_size
+
+    def _is_compressed(self):
+        """Indique si la charge utile du fichier est stockée en blocs compressés."""
+        return bool(self.compression) and self._has_header()
+
+    def _is_encoded(self):
+        """
+        Indique si la charge utile du fichier ne contient pas directement les samples (compression et/ou
+        quantification) : ils sont alors lus par blocs décodés, jamais par projection mémoire.
+        """
+        return bool(self.compression or self.quantization) and self._has_header()
+
+    def _storage_dtype(self):
+        """dtype des samples tels qu'ils sont stockés (entier si quantifiés)."""
+        return np.dtype(self.quantization) if self.quantization else self.dtype
+
+    def _file_metadata(self):
+        """Métadonnées écrites dans l'en-tête du fichier ; complétées par les sous-classes."""
+        metadata = {
+            'data_type': self.data_type.name,
+            'data_id': self.data_id,
+            'data_name': self.data_name,
+            'dtype': self.dtype.str,
+            'num_samples': int(self.num_samples or 0),
+        }
+        if self._is_compressed():
+            metadata['compression'] = {'codec': self.compression, 'block_size': int(self.block_size)}
+        if self.quantization and self._has_header():
+            metadata['quantization'] = {'dtype': self.quantization, 'block_size': int(self.block_size)}
+        if self.envelope and self._has_header():
+            metadata['envelope'] = {'base': DEFAULT_ENVELOPE_BASE, 'factor': DEFAULT_ENVELOPE_FACTOR}
+        return metadata
+
+    def _open_data_file(self, quantize=True):
+        """
+        Ouvre le fichier de données en écriture ; la place du préfixe d'en-tête est réservée pour _finalize_data_file.
+        :param quantize: Si False, les samples écrits sont des codes déjà quantifiés (paramètres dans _quant_params).
+        """
+        f = open(self.file_path, 'wb')
+        self._block_offsets = None
+        with self._block_cache_lock:
+            self._block_cache.clear()
+        if self._has_header():
+            f.seek(HEADER_SIZE)
+            if self._is_compressed():
+                self._block_writer = CompressedBlockWriter(f, self._storage_dtype(), self.compression,
+                                                           self.block_size)
+            if self.quantization and quantize:
+                self._quantizer = BlockQuantizer(self.quantization, self.block_size,
+                                                 lambda codes: self._write_stored(f, codes), self.dtype)
+            if quantize:
+                self._summary_builders = self._new_summary_builders()
+        return f
+
+    def _finalize_data_file(self, f, chunk_starts=None):
+        """
+        Écrit l'index des chunks (indices de début des chunks stockés) puis l'en-tête, une fois num_samples connu.
+        L'en-tête est écrit en dernier : un fichier interrompu pendant l'écriture n'est pas reconnu comme valide.
+        """
+        if not self._has_header():
+            return
+        if self._quantizer is not None:
+            # Dernier bloc partiel quantifié (transmis au compresseur) et paramètres de tous les blocs
+            self._quant_params, self._quantizer = self._quantizer.close(), None
+        metadata = self._file_metadata()
+        if self._block_writer is not None:
+            # Dernier bloc partiel puis index des blocs (n_blocs + 1 offsets), avant les autres sections
+            block_offsets, self._block_writer = self._block_writer.close(), None
+            append_section(f, metadata, 'block_index', block_offsets)
+        if self.quantization:
+            scales, offsets = self._quant_params
+            append_section(f, metadata, 'quant_scale', scales)
+            append_section(f, metadata, 'quant_offset', offsets)
+        self._close_summary_builders(self._summary_builders)
+        self._summary_builders = {}
+        if self.block_stats and self._block_stats is not None:
+            append_section(f, metadata, 'block_stats', self._block_stats.rows)
+            metadata['block_stats'] = {'block_size': self._block_stats.block_size}
+        if self.envelope and self._envelope is not None:
+            # Un niveau de la pyramide par section ; ils sont ensuite relus par tranches depuis le fichier
+            for level, rows in enumerate(self._envelope):
+                append_section(f, metadata, f'envelope_{level}', rows)
+            metadata['envelope']['levels'] = len(self._envelope)
+        self._envelope = None
+        if chunk_starts is not None:
+            append_section(f, metadata, 'chunk_index', np.asarray(chunk_starts, dtype=np.int64))
+        write_header(f, metadata)
+
+    def _read_file(self, decode=True):
+        """
+        Lit toute la charge utile numérique du fichier dans un tableau NumPy.
+        :param decode: Si False, les samples quantifiés sont retournés sous forme de codes entiers.
+        """
+        if self._is_encoded():
+            blocks = list(self._iter_blocks(decode=decode))
+            dtype = self.dtype if decode else self._storage_dtype()
+            return np.concatenate(blocks) if blocks else np.empty(0, dtype=dtype)
+        count = self.num_samples if self._has_header() else -1
+        return np.fromfile(self.file_path, dtype=self.dtype, count=count, offset=self._payload_offset())
+
+    def _read_samples(self, f, count, dtype=None):
+        """
+        Lit jusqu'à count samples à la position courante du fichier directement dans un tableau NumPy (readinto).
+        :param dtype: dtype des samples lus (self.dtype par défaut).
+        :return: Tableau NumPy des samples lus (éventuellement plus court en fin de fichier).
+        """
+        buffer = np.empty(count, dtype=dtype or self.dtype)
+        bytes_read = f.readinto(memoryview(buffer).cast('B'))
+        return buffer[:bytes_read // buffer.itemsize]
+
+    def _uses_mmap(self):
+        """Indique si les lectures doivent passer par la projection mémoire du fichier (jamais s'il est encodé)."""
+        return (self.use_mmap and self.in_file and self.file_path and self.sample_type != 'str'
+                and not self._is_encoded())
+
+    def _block_index(self):
+        """Retourne l'index des blocs compressés (offsets en bytes, n_blocs + 1 valeurs), lu une seule fois."""
+        block_offsets = self._block_offsets
+        if block_offsets is None:
+            block_offsets = read_section(self.file_path, read_file_header(self.file_path), 'block_index')
+            if block_offsets is None:
+                raise ValueError(f"File {self.file_path} has no block index.")
+            self._block_offsets = block_offsets
+        return block_offsets
+
+    def _quantization_params(self):
+        """Retourne les tuples (scales, offsets) des blocs quantifiés, lus une seule fois depuis le fichier."""
+        quant_params = self._quant_params
+        if quant_params is None:
+            metadata = read_file_header(self.file_path)
+            quant_params = (read_section(self.file_path, metadata, 'quant_scale'),
+                            read_section(self.file_path, metadata, 'quant_offset'))
+            if quant_params[0] is None or quant_params[1] is None:
+                raise ValueError(f"File {self.file_path} has no quantization parameters.")
+            self._quant_params = quant_params
+        return quant_params
+
+    def _dequantize(self, codes, start):
+        """Reconstitue (vectorisé) les samples flottants des codes [start, start + len(codes))."""
+        return dequantize(codes, *self._quantization_params(), self.block_size, start, self.dtype)
+
+    def _block_count(self):
+        """Nombre de blocs de la charge utile encodée."""
+        if self._is_compressed():
+            return len(self._block_index()) - 1
+        return -(-(self.num_samples or 0) // self.block_size)
+
+    def _decode_block(self, raw, index, decode=True):
+        """
+        Décode le bloc index : décompression (tableau en lecture seule, sans copie du buffer décompressé) puis,
+        si decode est True, déquantification.
+        """
+        block = raw
+        if self._is_compressed():
+            block = np.frombuffer(get_codec(self.compression)[1](raw), dtype=self._storage_dtype())
+        if self.quantization and decode:
+            block = self._dequantize(block, index * self.block_size)
+        return block
+
+    def _read_raw_blocks(self, f, first, stop):
+        """Lit les blocs stockés [first, stop) à la suite dans le fichier ouvert f."""
+        if not self._is_compressed():
+            # Blocs de taille fixe : lus directement à leur position
+            storage_dtype = self._storage_dtype()
+            f.seek(self._payload_offset() + first * self.block_size * storage_dtype.itemsize)
+            for i in range(first, stop):
+                yield self._read_samples(f, min(self.block_size, self.num_samples - i * self.block_size),
+                                         storage_dtype)
+            return
+        block_offsets = self._block_index()
+        f.seek(int(block_offsets[first]))
+        for i in range(first, stop):
+            yield f.read(int(block_offsets[i + 1] - block_offsets[i]))
+
+    def _iter_blocks(self, first=0, stop=None, decode=True):
+        """
+        Génère les blocs décodés [first, stop) dans l'ordre. Les lectures restent séquentielles dans le
+        thread appelant tandis que le décodage (décompression zlib/lzma et opérations NumPy, qui libèrent le GIL)
+        est réparti sur un pool de threads, avec au plus deux blocs d'avance par thread.
+        """
+        if stop is None:
+            stop = self._block_count()
+        if stop <= first:
+            return
+        workers = min(stop - first, os.cpu_count() or 1)
+        with open(self.file_path, 'rb') as f, ThreadPoolExecutor(max_workers=workers) as executor:
+            tasks = ((self._decode_block, raw, i, decode)
+                     for i, raw in enumerate(self._read_raw_blocks(f, first, stop), first))
+            yield from ordered_map(executor, tasks, 2 * workers)
+
+    def _get_block(self, f, index, capacity):
+        """Retourne le bloc décodé index, depuis le cache LRU des derniers blocs s'il y est."""
+        with self._block_cache_lock:
+            block = self._block_cache.get(index)
+            if block is not None:
+                self._block_cache.move_to_end(index)
+                return block
+        block = self._decode_block(next(self._read_raw_blocks(f, index, index + 1)), index)
+        with self._block_cache_lock:
+            self._block_cache[index] = block
+            while len(self._block_cache) > capacity:
+                self._block_cache.popitem(last=False)
+        return block
+
+    def _read_encoded_range(self, start, stop):
+        """Retourne les samples [start, stop) d'un fichier encodé en ne décodant que les blocs qui les contiennent."""
+        stop = min(stop, self.num_samples or 0)
+        if stop <= start:
+            return np.empty(0, dtype=self.dtype)
+        if not self._is_compressed():
+            # Codes quantifiés lus directement à leur position puis déquantifiés
+            storage_dtype = self._storage_dtype()
+            with open(self.file_path, 'rb') as f:
+                f.seek(self._payload_offset() + start * storage_dtype.itemsize)
+                return self._dequantize(self._read_samples(f, stop - start, storage_dtype), start)
+        first, last = start // self.block_size, (stop - 1) // self.block_size
+        capacity = max(_BLOCK_CACHE_SIZE, last - first + 2)
+        with open(self.file_path, 'rb') as f:
+            blocks = [self._get_block(f, i, capacity) for i in range(first, last + 1)]
+        offset = first * self.block_size
+        if len(blocks) == 1:
+            return blocks[0][start - offset:stop - offset]
+        return np.concatenate(blocks)[start - offset:stop - offset]
+
+    def _get_memmap(self):
+        """
+        Retourne la projection mémoire en lecture seule du fichier de données, créée une seule fois.
+        Les chunks et tranches renvoyés sont des vues sur cette projection (cache de pages partagé).
+        """
+        memmap = self._memmap
+        if memmap is None:
+            num_samples = self._stored_samples()
+            if num_samples == 0:
+                # np.memmap ne supporte pas les fichiers vides
+                memmap = np.empty(0, dtype=self.dtype)
+                memmap.flags.writeable = False
+            else:
+                memmap = np.memmap(self.file_path, dtype=self.dtype, mode='r', offset=self._payload_offset(),
+                                   shape=(num_samples,))
+            self._memmap = memmap
+        return memmap
+
+    def _release_memmap(self):
+        """
+        Abandonne la projection mémoire avant la réécriture du fichier. Le fichier projeté est supprimé (et non
+        tronqué), de sorte que les vues déjà distribuées restent valides jusqu'à leur libération.
+        """
+        if self._memmap is not None:
+            self._memmap = None
+            if self.file_path and os.path.exists(self.file_path):
+                os.remove(self.file_path)
+
+    def _new_summary_builders(self):
+        """Crée les résumés à construire au fil du stockage : {attribut de destination : builder}."""
+        self._envelope = self._block_stats = None
+        builders = {}
+        if self.envelope:
+            builders['_envelope'] = EnvelopeBuilder()
+        if self.block_stats and self.sample_type != 'str':
+            builders['_block_stats'] = BlockStatsBuilder(self.block_size)
+        return builders
+
+    def _close_summary_builders(self, builders):
+        """Termine les résumés construits au fil du stockage et les range dans leurs attributs."""
+        for name, builder in builders.items():
+            setattr(self, name, builder.close())
+
+    def _store_generator_in_ram(self, data_generator):
+        """
+        Agrège les chunks d'un générateur en RAM. Les données numériques sont copiées dans un buffer NumPy typé
+        préalloué à partir de num_samples (si connu) ; les chaînes restent dans une liste.
+        :return: Tuple (données agrégées, nombre total de samples).
+        """
+        if self.sample_type == 'str':
+            data = []
+            for chunk in data_generator:
+                data.extend(chunk)
+            return data, len(data)
+
+        builders = self._new_summary_builders()
+        if self.quantization:
+            # Quantification au fil de l'eau : seuls les codes entiers sont conservés
+            buffer = GrowableBuffer(self._storage_dtype(), capacity=self.num_samples)
+            quantizer = BlockQuantizer(self.quantization, self.block_size, buffer.extend, self.dtype)
+            for chunk in data_generator:
+                quantizer.write(chunk)
+                for builder in builders.values():
+                    builder.write(chunk)
+            self._quant_params = quantizer.close()
+            self._close_summary_builders(builders)
+            return buffer.finalize(), buffer.size
+
+        buffer = GrowableBuffer(self.dtype, capacity=self.num_samples)
+        chunks = iter(data_generator)
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                # Chunks non numériques : revenir à une liste d'éléments
+                data = buffer.finalize().tolist()
+                data.extend(chunk)
+                for chunk in chunks:
+                    data.extend(chunk)
+                return data, len(data)
+            buffer.extend(chunk)
+            for builder in builders.values():
+                builder.write(chunk)
+        self._close_summary_builders(builders)
+        return buffer.finalize(), buffer.size
+
+    def _write_samples(self, f, samples):
+        """
+        Écrit des samples numériques dans le fichier sans conversion en objets Python (tofile), ou les transmet
+        au compresseur par blocs si le fichier est compressé.
+        :return: Nombre de samples écrits.
+        """
+        for builder in self._summary_builders.values():
+            builder.write(samples)
+        if self._quantizer is not None:
+            return self._quantizer.write(samples)
+        return self._write_stored(f, samples)
+
+    def _write_stored(self, f, samples):
+        """Écrit des samples déjà au format de stockage (codes quantifiés éventuels), compressés si nécessaire."""
+        if self._block_writer is not None:
+            return self._block_writer.write(samples)
+        samples = np.asarray(samples, dtype=self._storage_dtype())
+        samples.tofile(f)
+        return samples.size
+
+    def _store_generator_write_behind(self, data_generator, depth=2):
+        """
+        Écrit les chunks d'un générateur dans le fichier via un thread d'écriture dédié (double buffer) :
+        le générateur est parcouru dans le thread appelant pendant que les chunks précédents sont écrits.
+        Chaque chunk est copié avant d'être remis au thread, le producteur peut donc réutiliser ses buffers.
+        :return: Future terminé lorsque le fichier est écrit et synchronisé sur le disque (résultat : num_samples).
+        """
+        f = self._open_data_file()
+        total_samples = 0
+        chunk_starts = []
+
+        def finish():
+            self.data_size_in_bytes = total_samples * self.sample_size
+            self.num_samples = total_samples
+            self._finalize_data_file(f, chunk_starts)
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+            return total_samples
+
+        # Les chunks numériques passent par _write_samples : la compression éventuelle a lieu dans le thread dédié
+        write = f.write if self.sample_type == 'str' else lambda buffer: self._write_samples(f, buffer)
+        writer = WriteBehindWriter(write, finish, abort=f.close, depth=depth)
+        try:
+            for chunk in data_generator:
+                if self.sample_type == 'str':
+                    buffer = ''.join(chunk).encode('utf-8')
+                else:
+                    buffer = np.array(chunk, dtype=self.dtype).reshape(-1)
+                    if buffer.size:
+                        chunk_starts.append(total_samples)
+                    total_samples += buffer.size
+                writer.submit(buffer)
+        except BaseException as e:
+            writer.abort(e)
+            raise
+        return writer.close()
+
+    def store_data_from_data_generator(self, data_generator, folder=None, write_behind=False):
+        """
+        Stocke les données depuis un générateur de chunks.
+        :param folder: Dossier où stocker le fichier (si data_is_in_file est True).
+        :param write_behind: En mode fichier, écrit via un thread dédié et retourne un Future.
+        """
         if self.in_file:
             if folder is None:
                 raise ValueError("Folder must be specified for file-based storage.")
             folder = os.path.abspath(folder)
+            self._release_memmap()
             self.file_path = os.path.join(folder, f"{self.data_id}.dat")
+            if write_behind:
+                return self._store_generator_write_behind(data_generator)
 
-            with open(self.file_path, 'wb') as f:
+            with self._open_data_file() as f:
                 total_samples = 0
+                chunk_starts = []
                 for chunk in data_generator:
                     if self.sample_type == 'str':
                         f.write(''.join(chunk).encode('utf-8'))
                     else:
-                        packed_chunk = struct.pack(f'{len(chunk)}{self.sample_format}', *chunk)
-                        f.write(packed_chunk)
-
-                        # Mettre à jour la taille des données et le nombre de samples
-                        total_samples += len(chunk)
+                        # Écrire le chunk tel quel (tableau NumPy) et mettre à jour le nombre de samples
+                        written = self._write_samples(f, chunk)
+                        if written:
+                            chunk_starts.append(total_samples)
+                        total_samples += written
 
                 # Définir la taille totale des données en bytes et le nombre total de samples
                 self.data_size_in_bytes = total_samples * self.sample_size
                 self.num_samples = total_samples
+                self._finalize_data_file(f, chunk_starts)
 
         else:
-            # Stockage en RAM
-            self.data = []
-            total_samples = 0
-            for chunk in data_generator:
-                self.data.extend(chunk)
-                total_samples += len(chunk)
+            # Stockage en RAM dans un buffer typé
+            self.data, total_samples = self._store_generator_in_ram(data_generator)
 
             # Mettre à jour les informations de taille
             self.data_size_in_bytes = total_samples * self.sample_size
@@ -102,21 +594,20 @@ class Data:
         if self.in_file:
             if folder is None:
                 raise ValueError("Folder must be specified for file-based storage.")
+            self._release_memmap()
             self.file_path = os.path.join(folder, f"{self.data_id}.dat")
-            with open(self.file_path, 'wb') as f:
+            with self._open_data_file() as f:
                 if self.sample_type == 'str':
                     # Pour les chaînes de caractères, stocker chaque chaîne telle qu'elle (pas par caractère)
                     f.write("\n".join(data_object).encode('utf-8'))
                     # Taille des données pour une chaîne de caractères
                     self.data_size_in_bytes = len("\n".join(data_object).encode('utf-8'))
                 else:
-                    packed_data = struct.pack(f'{len(data_object)}{self.sample_format}', *data_object)
-                    f.write(packed_data)
-                    # Définir la taille totale des données en bytes
-                    self.data_size_in_bytes = len(data_object) * self.sample_size
+                    # Définir le nombre total de samples et la taille totale des données en bytes
+                    self.num_samples = self._write_samples(f, data_object)
+                    self.data_size_in_bytes = self.num_samples * self.sample_size
+                    self._finalize_data_file(f, [0] if self.num_samples else [])
                     print(colored(f"self.data_size_in_bytes: {self.data_size_in_bytes}", "green"))
-                    # Définir le nombre total de samples
-                    self.num_samples = len(data_object)
                     print(colored(f"self.num_samples: {self.num_samples}", "green"))
         else:
             # Stockage en RAM
@@ -125,77 +616,120 @@ class Data:
                 # Calculer la taille des données en bytes pour les chaînes
                 self.data_size_in_bytes = len("\n".join(self.data).encode('utf-8'))
                 self.num_samples = len(self.data)  # Nombre de chaînes
-                print(colored(f"Data stored in RAM: {self.data}", "green"))
+                print(colored(f"Data stored in RAM: {self.num_samples} strings", "green"))
+            elif self.quantization:
+                self._envelope = self._block_stats = None
+                # Stockage des codes entiers et des paramètres de chaque bloc
+                self.data, *quant_params = quantize(data_object, self.quantization, self.block_size)
+                self._quant_params = tuple(quant_params)
+                self.num_samples = len(self.data)
+                self.data_size_in_bytes = self.num_samples * self.sample_size
+                print(colored(f"Data stored in RAM: {self.num_samples} quantized samples", "green"))
             else:
+                # Conserver l'objet tel quel (pas de copie, un tableau NumPy reste un tableau NumPy)
                 self.data = data_object
+                self._envelope = self._block_stats = None  # Résumés recalculés au besoin
                 # Calculer la taille des données en bytes pour les données numériques
                 self.num_samples = len(data_object)  # Nombre d'échantillons
                 self.data_size_in_bytes = self.num_samples * self.sample_size
-                print(colored(f"Data stored in RAM: {self.data}", "green"))
+                print(colored(f"Data stored in RAM: {self.num_samples} samples", "green"))
 
     def read_data(self):
         """
         Lit toutes les données stockées, soit en RAM, soit depuis un fichier.
         :return: Les données stockées.
         """
+        if self._uses_mmap():
+            # Vue en lecture seule sur la projection mémoire du fichier
+            return self._get_memmap()
         if self.in_file and self.file_path:
-            with open(self.file_path, 'rb') as f:
-                if self.sample_type == 'str':
+            if self.sample_type == 'str':
+                with open(self.file_path, 'rb') as f:
                     # Lire les chaînes de caractères comme des lignes complètes
-                    data = f.read().decode('utf-8').split("\n")
-                else:
-                    data = f.read()
-                    unpacked_data = struct.unpack(f'{len(data) // self.sample_size}{self.sample_format}', data)
-                    return unpacked_data
+                    return f.read().decode('utf-8').split("\n")
+            # Lecture directe du fichier dans un tableau NumPy
+            return self._read_file()
+        elif self.quantization and self.data is not None:
+            # Déquantification vectorisée des codes en RAM
+            return self._dequantize(self.data, 0)
         else:
-            if isinstance(self.data, list) and self.sample_type == 'str':
-                print(colored(f"Data read from RAM: {self.data}", "green"))
-                return self.data  # Renvoyer la liste de chaînes telle quelle
-
-            else:
-                print(colored(f"Data read from RAM: {self.data}", "green"))
-                return self.data
+            # Renvoyer les données telles qu'elles sont stockées (liste de chaînes, liste ou tableau NumPy)
+            return self.data
 
     def delete_data(self):
         """Supprime les données, soit en RAM, soit en supprimant le fichier sur le disque."""
         if self.in_file and self.file_path:
+            self._memmap = None
             os.remove(self.file_path)
+        self.release_shared_memory()
         del self.data
         self.data = None
 
+    def move_to_shared_memory(self):
+        """
+        Copie les données numériques résidentes en RAM dans un segment de mémoire partagée ; self.data devient
+        une vue NumPy sur ce segment, que d'autres processus peuvent attacher sans copie via shared_descriptor().
+        """
+        if self.in_file or self.sample_type == 'str' or self.data is None or self.quantization:
+            raise ValueError(f"Only numeric, non-quantized data stored in RAM can be moved to shared memory "
+                             f"({self.data_id}).")
+        data = np.asarray(self.data, dtype=self.dtype)
+        self.release_shared_memory()
+        segment = create_segment(data.nbytes)
+        shared = np.ndarray(data.shape, dtype=self.dtype, buffer=segment.buf)
+        shared[...] = data
+        self._shm = segment
+        self.data = shared
+
+    def shared_descriptor(self):
+        """Retourne le descripteur (picklable) du segment de mémoire partagée contenant les données."""
+        if self._shm is None:
+            raise ValueError(f"Data {self.data_id} is not stored in shared memory.")
+        return SharedArrayDescriptor(self._shm.name, self.dtype.str, self.data.shape, self.data_id)
+
+    def release_shared_memory(self):
+        """Supprime le segment de mémoire partagée (les processus encore attachés conservent leur projection)."""
+        if self._shm is None:
+            return
+        segment, self._shm = self._shm, None
+        self.data = None
+        unlink_segment(segment)
+
 
 class ChunkableMixin:
 
-    def store_data_from_data_generator(self, data_generator, folder=None):
+    def store_data_from_data_generator(self, data_generator, folder=None, write_behind=False):
         if self.in_file:
             if folder is None:
                 raise ValueError("Folder must be specified for file-based storage.")
+            self._release_memmap()
             self.file_path = os.path.join(folder, f"{self.data_id}.dat")
+            if write_behind:
+                # Écriture par un thread dédié : retourne un Future terminé lorsque le fichier est durable
+                return self._store_generator_write_behind(data_generator)
 
-            with open(self.file_path, 'wb') as f:
+            with self._open_data_file() as f:
                 total_samples = 0
+                chunk_starts = []
                 for chunk in data_generator:
                     if self.sample_type == 'str':
                         f.write(''.join(chunk).encode('utf-8'))
                     else:
-                        packed_chunk = struct.pack(f'{len(chunk)}{self.sample_format}', *chunk)
-                        f.write(packed_chunk)
-
-                        # Mettre à jour la taille des données et le nombre de samples
-                        total_samples += len(chunk)
+                        # Écrire le chunk tel quel (tableau NumPy) et mettre à jour le nombre de samples
+                        written = self._write_samples(f, chunk)
+                        if written:
+                            chunk_starts.append(total_samples)
+                        total_samples += written
 
                 # Définir la taille totale des données en bytes et le nombre total de samples
                 self.data_size_in_bytes = total_samples * self.sample_size
                 print(f"Data size in bytes: {self.data_size_in_bytes}")
                 self.num_samples = total_samples
                 print(f"Number of samples: {self.num_samples}")
+                self._finalize_data_file(f, chunk_starts)
         else:
-            # Stockage en RAM
-            self.data = []
-            total_samples = 0
-            for chunk in data_generator:
-                self.data.extend(chunk)
-                total_samples += len(chunk)
+            # Stockage en RAM dans un buffer typé
+            self.data, total_samples = self._store_generator_in_ram(data_generator)
 
             # Définir la taille totale des données en bytes et le nombre total de samples
             self.data_size_in_bytes = total_samples * self.sample_size
@@ -209,21 +743,35 @@ class ChunkableMixin:
         :param chunk_size: Nombre de samples par chunk pour la lecture.
         :yield: Un chunk de données à la fois.
         """
-        print(type(self))
         if self.data is None and not self.in_file:
             raise ValueError("Data is not loaded in RAM.")
 
-        if self.in_file and self.file_path:
+        if self._uses_mmap():
+            # Vues successives sur la projection mémoire, sans copie
+            memmap = self._get_memmap()
+            for i in range(0, len(memmap), chunk_size):
+                yield memmap[i:i + chunk_size]
+        elif self.in_file and self.file_path and self._is_encoded():
+            yield from self._read_encoded_chunks(chunk_size)
+        elif self.in_file and self.file_path:
             with open(self.file_path, 'rb') as f:
-                while True:
-                    chunk = f.read(chunk_size * self.sample_size)
-                    if not chunk:
-                        break
-                    if self.sample_type == 'str':
+                if self.sample_type == 'str':
+                    while True:
+                        chunk = f.read(chunk_size * self.sample_size)
+                        if not chunk:
+                            break
                         yield chunk.decode('utf-8')  # Décodage si type 'str'
-                    else:
-                        unpacked_chunk = struct.unpack(f'{len(chunk) // self.sample_size}{self.sample_format}', chunk)
-                        yield unpacked_chunk
+                else:
+                    # Lecture de la charge utile uniquement (après l'en-tête, avant les sections)
+                    f.seek(self._payload_offset())
+                    remaining = self._stored_samples()
+                    while remaining > 0:
+                        # Lecture directe dans un nouveau tableau NumPy (un buffer par chunk)
+                        chunk = self._read_samples(f, min(chunk_size, remaining))
+                        if chunk.size == 0:
+                            break
+                        remaining -= chunk.size
+                        yield chunk
         else:
             for i in range(0, len(self.data), chunk_size):
                 if self.sample_type == 'str':
@@ -231,31 +779,365 @@ class ChunkableMixin:
                     chunk = [item.decode('utf-8') if isinstance(item, bytes) else item for item in
                              self.data[i:i + chunk_size]]
                     yield ''.join(chunk)
+                elif self.quantization:
+                    yield self._dequantize(self.data[i:i + chunk_size], i)
                 else:
                     yield self.data[i:i + chunk_size]
 
-    def read_overlapped_chunked_data(self, chunk_size=1024, overlap=50):
+    def _read_encoded_chunks(self, chunk_size):
+        """Redécoupe en chunks de chunk_size samples les blocs décodés en parallèle (voir _iter_blocks)."""
+        carried = np.empty(0, dtype=self.dtype)
+        for block in self._iter_blocks():
+            if carried.size:
+                block = np.concatenate((carried, block))
+            full = block.size - block.size % chunk_size
+            for i in range(0, full, chunk_size):
+                yield block[i:i + chunk_size]
+            carried = block[full:]
+        if carried.size:
+            yield carried
+
+    @staticmethod
+    def _overlap_hop(chunk_size, overlap):
         """
-        Retourne un Générateur qui lit les données chunk par chunk avec un overlap.
-        :param chunk_size: Nombre de samples par chunk pour la lecture.
-        :param overlap: Nombre de samples pour
-        :yield: Un chunk de données à la fois.
+        Calcule le pas (en samples) entre deux fenêtres consécutives.
+        :param chunk_size: Taille des fenêtres en samples.
+        :param overlap: Pourcentage de chevauchement (0 <= overlap < 100).
+        """
+        if not 0 <= overlap < 100:
+            raise ValueError("Overlap must be a percentage in [0, 100).")
+        return max(1, chunk_size - int(round(chunk_size * overlap / 100)))
+
+    def read_overlapped_chunked_data(self, chunk_size=1024, overlap=50, batch_size=None):
+        """
+        Retourne un Générateur qui lit les données par fenêtres de chunk_size samples avec chevauchement.
+        Les fenêtres commencent tous les hop samples ; la dernière est la première qui atteint la fin des données
+        (elle peut être plus courte). En RAM ou en projection mémoire, les fenêtres sont des vues sans copie ; en
+        fichier, le recouvrement est recopié depuis la fenêtre précédente et chaque octet n'est lu qu'une fois.
+        :param chunk_size: Nombre de samples par fenêtre.
+        :param overlap: Pourcentage de chevauchement entre deux fenêtres consécutives (0 <= overlap < 100).
+        :param batch_size: Si fourni, produit des tableaux 2-D (n_fenêtres, chunk_size) d'au plus batch_size
+            fenêtres complètes (vues à pas sur un même buffer) ; la fenêtre partielle finale est alors omise.
+        :yield: Une fenêtre (ou un lot de fenêtres) à la fois.
+        """
+        hop = self._overlap_hop(chunk_size, overlap)
+        if self._uses_mmap():
+            source = self._get_memmap()
+        elif self.quantization or (self.in_file and self.file_path and self._is_encoded()):
+            # Fenêtres lues par accès direct (déquantifiées) : le cache de blocs évite de redécompresser le
+            # recouvrement
+            starts = self.window_starts(self.num_samples or 0, chunk_size, hop)
+            if batch_size is None:
+                for start in starts:
+                    yield self.read_range(start, start + chunk_size)
+                return
+            starts = [start for start in starts if start + chunk_size <= (self.num_samples or 0)]
+            for i in range(0, len(starts), batch_size):
+                yield np.stack([self.read_range(start, start + chunk_size) for start in starts[i:i + batch_size]])
+            return
+        elif self.in_file and self.file_path and self.sample_type != 'str':
+            if batch_size is None:
+                yield from self._read_overlapped_file(chunk_size, hop)
+            else:
+                yield from self._read_overlapped_file_batches(chunk_size, hop, batch_size)
+            return
+        elif self.sample_type == 'str':
+            # Chaînes : fenêtres de caractères
+            source = ''.join(self.read_chunked_data(chunk_size=max(chunk_size, 1)))
+        else:
+            # Une liste est convertie une seule fois en tableau, les fenêtres sont ensuite des vues
+            source = np.asarray(self.data)
+
+        n = len(source)
+        if batch_size is not None:
+            if n < chunk_size:
+                return
+            windows = np.lib.stride_tricks.sliding_window_view(source, chunk_size)[::hop]
+            for i in range(0, len(windows), batch_size):
+                yield windows[i:i + batch_size]
+            return
+        start = 0
+        while start < n:
+            yield source[start:start + chunk_size]
+            if start + chunk_size >= n:
+                break
+            start += hop
+
+    def _read_overlapped_file(self, chunk_size, hop):
+        """Fenêtres chevauchantes depuis le fichier : seul le pas (hop) est lu sur disque pour chaque fenêtre."""
+        kept = chunk_size - hop  # samples recopiés depuis la fenêtre précédente
+        with open(self.file_path, 'rb') as f:
+            f.seek(self._payload_offset())
+            remaining = self._stored_samples()
+            window = self._read_samples(f, min(chunk_size, remaining))
+            if window.size == 0:
+                return
+            remaining -= window.size
+            yield window
+            while window.size == chunk_size and remaining > 0:
+                next_window = np.empty(chunk_size, dtype=self.dtype)
+                next_window[:kept] = window[hop:]
+                fresh_count = min(hop, remaining)
+                bytes_read = f.readinto(memoryview(next_window[kept:kept + fresh_count]).cast('B'))
+                if bytes_read == 0:
+                    break
+                remaining -= bytes_read // self.sample_size
+                window = next_window[:kept + bytes_read // self.sample_size]
+                yield window
+
+    def _read_overlapped_file_batches(self, chunk_size, hop, batch_size):
+        """Lots 2-D de fenêtres complètes depuis le fichier, le recouvrement entre lots étant reporté en mémoire."""
+        span = (batch_size - 1) * hop + chunk_size  # samples couverts par un lot complet
+        with open(self.file_path, 'rb') as f:
+            f.seek(self._payload_offset())
+            remaining = self._stored_samples()
+            block = self._read_samples(f, min(span, remaining))
+            remaining -= block.size
+            while block.size >= chunk_size:
+                windows = np.lib.stride_tricks.sliding_window_view(block, chunk_size)[::hop]
+                yield windows
+                if block.size < span:
+                    break
+                # Reporter les samples déjà lus qui appartiennent aux fenêtres suivantes
+                carried = block[len(windows) * hop:]
+                next_block = np.empty(span, dtype=self.dtype)
+                next_block[:carried.size] = carried
+                fresh_count = min(span - carried.size, remaining)
+                bytes_read = f.readinto(memoryview(next_block[carried.size:carried.size + fresh_count]).cast('B'))
+                remaining -= bytes_read // self.sample_size
+                block = next_block[:carried.size + bytes_read // self.sample_size]
+
+    @staticmethod
+    def window_starts(num_samples, chunk_size, hop):
+        """
+        Retourne les indices de début des fenêtres de chunk_size samples espacées de hop samples, avec la même
+        convention que read_overlapped_chunked_data : la dernière fenêtre est la première qui atteint la fin.
         """
+        if num_samples <= 0:
+            return range(0)
+        if num_samples <= chunk_size:
+            return range(1)
+        return range(0, (-(-(num_samples - chunk_size) // hop)) * hop + 1, hop)
+
+    def _file_offset(self, start):
+        """Retourne la position en bytes du sample start dans le fichier de données."""
+        return self._payload_offset() + start * self.sample_size
+
+    def read_range(self, start, stop):
+        """
+        Retourne les samples numériques [start, stop) en accédant directement à leur position (tranche en RAM ou
+        en projection mémoire, lecture à l'offset correspondant dans le fichier). La plage est tronquée à la fin
+        des données ; chaque appel est indépendant et peut être exécuté en parallèle.
+        :param start: Index du premier sample.
+        :param stop: Index de fin (exclu).
+        :return: Tableau NumPy (ou tranche de la liste en RAM).
+        """
+        if self._uses_mmap():
+            return self._get_memmap()[start:stop]
+        if self.in_file and self.file_path and self._is_encoded():
+            return self._read_encoded_range(start, stop)
         if self.in_file and self.file_path:
+            count = max(0, min(stop, self.num_samples) - start)
             with open(self.file_path, 'rb') as f:
-                while True:
-                    chunk = f.read(chunk_size * self.sample_size)
-                    if not chunk:
-                        break
-                    else:
-                        unpacked_chunk = struct.unpack(f'{len(chunk) // self.sample_size}{self.sample_format}', chunk)
-                        yield unpacked_chunk
-        else:
-            for i in range(0, len(self.data), chunk_size):
-                if self.sample_type == 'str':
-                    yield ''.join(self.data[i:i + chunk_size])
-                else:
-                    yield self.data[i:i + chunk_size]
+                f.seek(self._file_offset(start))
+                return self._read_samples(f, count)
+        if self.data is None:
+            raise ValueError("Data is not loaded in RAM.")
+        if self.quantization:
+            return self._dequantize(self.data[start:stop], start)
+        return self.data[start:stop]
+
+    def block_statistics(self):
+        """
+        Retourne l'index des statistiques par bloc (BlockStats), construit au stockage et lu depuis le fichier
+        (section 'block_stats') ou, à défaut, calculé une fois en parcourant les données.
+        """
+        block_stats = self._block_stats
+        if block_stats is None:
+            if self.in_file and self.file_path and self._has_header():
+                metadata = read_file_header(self.file_path)
+                rows = read_section(self.file_path, metadata, 'block_stats')
+                if rows is not None:
+                    block_stats = BlockStats(rows, metadata['block_stats']['block_size'], self.num_samples)
+            if block_stats is None:
+                builder = BlockStatsBuilder(self.block_size)
+                for chunk in self.read_chunked_data(self.block_size):
+                    builder.write(chunk)
+                block_stats = builder.close()
+            self._block_stats = block_stats
+        return block_stats
+
+    def find_blocks(self, predicate):
+        """
+        Retourne les indices des blocs satisfaisant predicate, évalué sur l'index des statistiques sans lire les
+        données. Les plages de samples sont données par block_statistics().block_range(index) et les blocs
+        candidats peuvent être lus avec read_blocks.
+        :param predicate: Fonction recevant le BlockStats et retournant un masque booléen (un élément par bloc).
+        :return: Tableau des indices de blocs, dans l'ordre.
+        """
+        block_stats = self.block_statistics()
+        mask = np.asarray(predicate(block_stats), dtype=bool)
+        if mask.shape != (len(block_stats),):
+            raise ValueError("Block predicate must return one boolean per block.")
+        return np.flatnonzero(mask)
+
+    def read_blocks(self, block_indices):
+        """
+        Lit uniquement les blocs demandés (accès direct, voir read_range).
+        :yield: Tuples (indice du bloc, samples du bloc).
+        """
+        block_stats = self.block_statistics()
+        for index in block_indices:
+            yield int(index), self.read_range(*block_stats.block_range(index))
+
+    def global_stats(self):
+        """
+        Retourne les statistiques globales du signal (count, min, max, sum, sumsq, mean, rms, std), combinées à
+        partir de l'index des statistiques par bloc sans relire les données.
+        """
+        return self.block_statistics().totals()
+
+    def _envelope_levels(self):
+        """Retourne les niveaux de la pyramide d'enveloppes des données en RAM, calculés au besoin."""
+        if self._envelope is None:
+            builder = EnvelopeBuilder()
+            builder.write(self.read_data())
+            self._envelope = builder.close()
+        return self._envelope
+
+    def _envelope_source(self):
+        """
+        Retourne (base, factor, nombre de niveaux, lecteur) de la pyramide d'enveloppes, ou None si elle n'est pas
+        disponible. Le lecteur retourne les points [first, stop) d'un niveau (lecture positionnée en fichier).
+        """
+        if not self.envelope:
+            return None
+        if self.in_file and self.file_path:
+            metadata = read_file_header(self.file_path)
+            info = metadata.get('envelope')
+            if not info or 'levels' not in info:
+                return None
+
+            def read_level(level, first, stop):
+                return read_section(self.file_path, metadata, f'envelope_{level}', first * 3, stop * 3).reshape(-1, 3)
+
+            return info['base'], info['factor'], info['levels'], read_level
+        if self.data is None:
+            return None
+        levels = self._envelope_levels()
+        return DEFAULT_ENVELOPE_BASE, DEFAULT_ENVELOPE_FACTOR, len(levels), \
+            lambda level, first, stop: levels[level][first:stop]
+
+    def _read_envelope(self, start, stop, n_points):
+        """
+        Résume les samples [start, stop) en au plus n_points points (min, max, moyenne) dont chacun couvre exactement
+        sa plage de samples [edges[i], edges[i + 1]). Le niveau de pyramide lu est le plus grossier dont chaque point
+        demandé contient au moins factor ** 2 points entiers : ces points sont agrégés, et les points de pyramide
+        coupés par une borne sont remplacés par les samples correspondants (lus directement, au plus 2 / factor ** 2
+        de la plage). Sans pyramide, ou pour une plage trop courte, la plage est lue et résumée directement.
+        :return: Tuple (indices de début des points, tableau (n, 3) min/max/moyenne).
+        """
+        if n_points < 1:
+            raise ValueError("Number of envelope points must be at least 1.")
+        count = stop - start
+        if count <= 0:
+            return np.empty(0, dtype=np.int64), np.empty((0, 3))
+        n = min(n_points, count)
+        edges = start + (np.arange(n + 1, dtype=np.int64) * count) // n
+        level, source = -1, self._envelope_source()
+        if source is not None:
+            base, factor, levels, read_level = source
+            width = int(np.diff(edges).min())
+            while level + 1 < levels and base * factor ** (level + 1) * factor ** 2 <= width:
+                level += 1
+        if level < 0:
+            samples = np.asarray(self.read_range(start, stop))
+            starts = edges[:-1] - start
+            rows = np.empty((n, 3))
+            rows[:, ENVELOPE_MIN] = np.minimum.reduceat(samples, starts)
+            rows[:, ENVELOPE_MAX] = np.maximum.reduceat(samples, starts)
+            rows[:, ENVELOPE_MEAN] = np.add.reduceat(samples, starts, dtype=np.float64) / np.diff(edges)
+            return edges[:-1], rows
+
+        # Points entiers de la pyramide contenus dans chaque point demandé
+        bucket_size = base * factor ** level
+        full_first = -(-edges[:-1] // bucket_size)
+        first, last = int(full_first[0]), int(edges[-1] // bucket_size)
+        points = np.array(read_level(level, first, last), dtype=np.float64)
+        counts = bucket_counts(self.num_samples, bucket_size, first, last)
+        # Les points coupés par une borne intérieure sont neutralisés puis remplacés par leurs samples
+        split = edges[1:-1][edges[1:-1] % bucket_size != 0] // bucket_size - first
+        points[split] = (np.inf, -np.inf, 0.0)
+        counts[split] = 0
+        starts = full_first - first
+        rows = merge_points(points, counts, starts)
+        totals = np.add.reduceat(counts, starts)
+        sums = rows[:, ENVELOPE_MEAN] * totals
+
+        for i, edge in enumerate(edges):
+            if edge % bucket_size == 0:
+                continue
+            low = max(start, edge // bucket_size * bucket_size)
+            high = min(stop, low + bucket_size - low % bucket_size)
+            samples = np.asarray(self.read_range(low, high))
+            # Samples avant la borne : fin du point i - 1 ; après la borne : début du point i
+            for point, part in ((i - 1, samples[:edge - low]), (i, samples[edge - low:])):
+                if part.size and 0 <= point < n:
+                    rows[point, ENVELOPE_MIN] = min(rows[point, ENVELOPE_MIN], part.min())
+                    rows[point, ENVELOPE_MAX] = max(rows[point, ENVELOPE_MAX], part.max())
+                    sums[point] += part.sum(dtype=np.float64)
+                    totals[point] += part.size
+        rows[:, ENVELOPE_MEAN] = sums / totals
+        return edges[:-1], rows
+
+    def set_compression(self, compression, block_size=DEFAULT_BLOCK_SIZE):
+        """
+        Choisit le stockage en fichier compressé par blocs, appliqué aux prochaines écritures du fichier.
+        :param compression: Nom d'un codec ('zlib', 'lzma' ou enregistré avec compression.register_codec), ou None.
+        :param block_size: Nombre de samples par bloc : plus il est petit, moins une lecture directe décompresse.
+        """
+        if compression is not None:
+            get_codec(compression)
+        if self.quantization and block_size != self.block_size and (self.data is not None or self.file_path):
+            raise ValueError(f"Block size of quantized data {self.data_id} cannot change once data is stored.")
+        if block_size < 1:
+            raise ValueError("Block size must be at least 1 sample.")
+        self.compression = compression
+        self.block_size = int(block_size)
+
+    def set_quantization(self, quantization):
+        """
+        Choisit le stockage quantifié (avec perte) des prochaines données stockées, en RAM comme en fichier :
+        codes entiers avec un scale et un offset par bloc de block_size samples. Les lectures restent en float.
+        :param quantization: 'int16' (2x moins qu'en float32), 'int8' (4x moins) ou None (pas de quantification).
+        """
+        if quantization is not None:
+            get_quantization_range(quantization)
+        if self.data is not None or (self.in_file and self.file_path):
+            raise ValueError(f"Quantization of data {self.data_id} cannot change once data is stored.")
+        self.quantization = quantization
+
+    @classmethod
+    def open(cls, path, use_mmap=False):
+        """
+        Rattache un fichier de données auto-descriptif sans lire sa charge utile : seul l'en-tête est lu.
+        :param path: Chemin du fichier .dat.
+        :param use_mmap: Si True, les lectures passent par une projection mémoire du fichier.
+        :return: Instance de la classe, stockée en fichier et prête à être lue.
+        """
+        data_obj = open_data_file(path, use_mmap=use_mmap)
+        if not isinstance(data_obj, cls):
+            raise ValueError(f"File {path} contains {data_obj.data_type.name} data, not {cls.__name__}.")
+        return data_obj
+
+    def read_chunk_index(self):
+        """
+        Retourne les indices de début des chunks tels qu'ils ont été stockés (un par chunk du générateur),
+        lus depuis la section 'chunk_index' du fichier, ou None si la donnée n'est pas en fichier.
+        """
+        if not (self.in_file and self.file_path and self._has_header()):
+            return None
+        return read_section(self.file_path, read_file_header(self.file_path), 'chunk_index')
 
     def read_specific_chunk(self, chunk_index, chunk_size=1024):
         """
@@ -264,21 +1146,20 @@ class ChunkableMixin:
         :param chunk_size: Taille du chunk (en nombre de samples).
         :return: Le chunk de données lu.
         """
+        if self._uses_mmap():
+            # Tranche de la projection mémoire : accès direct sans ouverture ni copie
+            start = chunk_index * chunk_size
+            return self._get_memmap()[start:start + chunk_size]
+        if self.in_file and self.file_path and self._is_encoded():
+            # Seuls les blocs contenant le chunk sont décodés
+            start = chunk_index * chunk_size
+            return self._read_encoded_range(start, start + chunk_size)
         if self.in_file and self.file_path:
-            # Obtenir la taille du fichier
-            file_size = os.path.getsize(self.file_path)
-            # print(f"File size: {file_size} bytes")
-
-            # Recalculer le nombre total de samples en fonction de la taille du fichier
-            num_samples_from_file = file_size // self.sample_size
-            # print(
-            #     f"num_samples_from_file: {num_samples_from_file},file_size: {file_size}, sample_size: {self.sample_size}")
-            # print(f"Data size in bytes: {self.data_size_in_bytes}")
             with open(self.file_path, 'rb') as f:
-                # Calculer la position du chunk dans le fichier
+                # Calculer la position du chunk dans la charge utile du fichier
                 offset = chunk_index * chunk_size * self.sample_size
                 # print(f"Offset: {offset}, Chunk size: {chunk_size}, Sample size: {self.sample_size}")
-                f.seek(offset)  # Se déplacer à l'offset calculé
+                f.seek(self._payload_offset() + offset)  # Se déplacer à l'offset calculé (après l'en-tête)
 
                 # Lire les données, mais s'assurer de ne pas lire plus que ce qui reste dans le fichier
                 remaining_bytes = self.data_size_in_bytes - offset
@@ -286,19 +1167,18 @@ class ChunkableMixin:
                 #     f"self.data_size_in_bytes: {self.data_size_in_bytes}, Offset: {offset}, Remaining bytes: {remaining_bytes}")
                 if remaining_bytes <= 0:
                     # print(f"Warning: No remaining bytes to read at chunk {chunk_index}.")
-                    return []  # Retourner un tableau vide si aucun octet restant à lire
+                    # Retourner un tableau vide si aucun octet restant à lire
+                    return '' if self.sample_type == 'str' else np.empty(0, dtype=self.dtype)
 
                 bytes_to_read = min(chunk_size * self.sample_size, remaining_bytes)
 
                 # print(f"Offset: {offset}, Bytes to read: {bytes_to_read}, Remaining bytes: {remaining_bytes}")
 
-                chunk_data = f.read(bytes_to_read)
-                # print(f"Chunk {chunk_index}: Read {len(chunk_data)} bytes.")
                 # Décoder les données en fonction de leur type
                 if self.sample_type == 'str':
-                    return chunk_data.decode('utf-8')
+                    return f.read(bytes_to_read).decode('utf-8')
                 else:
-                    return struct.unpack(f'{len(chunk_data) // self.sample_size}{self.sample_format}', chunk_data)
+                    return self._read_samples(f, bytes_to_read // self.sample_size)
         else:
             raise ValueError("Data is not stored in a file or file path is missing.")
 
@@ -318,26 +1198,41 @@ class FileRamMixin:
             if not os.path.exists(folder):
                 os.makedirs(folder)
             self.file_path = os.path.join(folder, f"{self.data_id}.dat")
-            with open(self.file_path, 'wb') as f:
+            if self.quantization:
+                # Résumés calculés en RAM : les codes écrits tels quels ne passent pas par les résumés
+                if self.envelope:
+                    self._envelope_levels()
+                if self.block_stats:
+                    self.block_statistics()
+            # Des données quantifiées sont écrites telles quelles (codes et paramètres), sans requantification
+            with self._open_data_file(quantize=not self.quantization) as f:
                 if self.sample_type == 'str':
                     # Pour les chaînes de caractères, il faut écrire les données caractère par caractère
                     packed_data = ''.join(self.data).encode('utf-8')  # Convertir la chaîne en bytes
                     f.write(packed_data)
                 else:
-                    # Pour les autres types de données, on utilise struct.pack
-                    packed_data = struct.pack(f'{len(self.data)}{self.sample_format}', *self.data)
-                    f.write(packed_data)
+                    # Pour les autres types de données, écriture directe du buffer NumPy
+                    self.num_samples = self._write_samples(f, self.data) if not self.quantization \
+                        else self._write_stored(f, self.data)
+                    self.data_size_in_bytes = self.num_samples * self.sample_size
+                    self._finalize_data_file(f, [0] if self.num_samples else [])
 
             self.in_file = True
+            self.release_shared_memory()
             del self.data
             self.data = None
 
     def convert_file_to_ram(self):
         """Convertit les données stockées dans un fichier en RAM."""
         if self.in_file and self.file_path:
-            with open(self.file_path, 'rb') as f:
-                data = f.read()
-                self.data = struct.unpack(f'{len(data) // self.sample_size}{self.sample_format}', data)
+            if self.quantization:
+                # Les codes quantifiés restent quantifiés en RAM
+                self._quantization_params()
+                self.data = self._read_file(decode=False)
+            else:
+                self.data = self._read_file()
+            self._memmap = None
+            self._envelope = None
             self.in_file = False
             # remove file
             os.remove(self.file_path)
@@ -381,14 +1276,72 @@ class FileListData(Data):
 
 
 class TemporalSignalData(Data, ChunkableMixin, FileRamMixin):
+    self_describing = True  # Fichiers avec en-tête (dtype, nombre de samples, axe, unité, nom)
+    block_stats = True  # Index des statistiques par bloc (find_blocks, global_stats)
+
     def __init__(self, data_id, data_name, data_size_in_bytes, number_of_elements, time_step, unit, tmin=0.0,
-                 in_file=False):
+                 in_file=False, use_mmap=False,
+                 compression=None, block_size=DEFAULT_BLOCK_SIZE, quantization=None, envelope=False):
         super().__init__(data_id, Data_Type.TEMPORAL_SIGNAL, data_name, data_size_in_bytes, number_of_elements, in_file,
                          sample_type='float32')
+        self.use_mmap = use_mmap  # lecture du fichier par projection mémoire
+        self.set_compression(compression, block_size)  # fichier compressé par blocs (codec), None : brut
+        self.set_quantization(quantization)  # stockage en codes int16/int8, None : float32
+        self.envelope = envelope  # pyramide d'enveloppes min/max/moyenne (read_envelope)
         self.dt = time_step
         self.unit = unit
         self.tmin = tmin  # temps minimum (par défaut à 0)
 
+    def _file_metadata(self):
+        metadata = super()._file_metadata()
+        metadata.update(dt=self.dt, tmin=self.tmin, unit=self.unit)
+        return metadata
+
+    @classmethod
+    def _from_file_metadata(cls, metadata, use_mmap=False):
+        return cls(metadata['data_id'], metadata['data_name'], 0, metadata['num_samples'], metadata['dt'],
+                   metadata['unit'], tmin=metadata['tmin'], in_file=True, use_mmap=use_mmap)
+
+    def time_axis(self):
+        """Retourne l'axe temporel (tmin + i * dt), généré à la demande sans être matérialisé."""
+        return LinearAxis(self.tmin, self.dt, self.num_samples)
+
+    def read_time_range(self, t0, t1, with_axis=False):
+        """
+        Retourne les samples dont le temps est compris entre t0 et t1 (bornes incluses), par une seule lecture à
+        la position correspondante du fichier (ou une tranche de la projection mémoire ou de la RAM).
+        :param t0: Temps de début (s).
+        :param t1: Temps de fin (s).
+        :param with_axis: Si True, retourne le tuple (axe temporel de la plage, samples).
+        """
+        start, stop = self.time_axis().index_range(t0, t1)
+        samples = self.read_range(start, stop)
+        return (self.time_axis()[start:stop], samples) if with_axis else samples
+
+    def read_envelope(self, t0, t1, n_points):
+        """
+        Retourne un résumé de taille fixe du signal entre t0 et t1 (bornes incluses) : min, max et moyenne de
+        n_points intervalles consécutifs. Avec la pyramide d'enveloppes (envelope=True), le coût d'I/O est en
+        O(n_points) quelle que soit la longueur de la plage.
+        :param t0: Temps de début (s).
+        :param t1: Temps de fin (s).
+        :param n_points: Nombre de points du résumé (moins si la plage contient moins de samples).
+        :return: Tuple (temps de début de chaque point, minimums, maximums, moyennes).
+        """
+        start, stop = self.time_axis().index_range(t0, t1)
+        starts, rows = self._read_envelope(start, stop, n_points)
+        return self.tmin + starts * self.dt, rows[:, ENVELOPE_MIN], rows[:, ENVELOPE_MAX], rows[:, ENVELOPE_MEAN]
+
+    def check_limit(self, limits, chunk_size=DEFAULT_EVALUATION_CHUNK):
+        """
+        Évalue le signal par rapport à une limite temporelle en le parcourant chunk par chunk (mémoire constante),
+        voir TempLimitEvaluator.
+        :param limits: Limite temporelle (TempLimitsData).
+        :param chunk_size: Nombre de samples évalués par chunk.
+        :return: ViolationIntervals (table : start_time, end_time, samples, worst_time, worst_value, limit, excess).
+        """
+        return check_temporal_signal(limits, self, chunk_size)
+
     def get_sampling_rate(self):
         return 1 / self.dt
 
@@ -397,15 +1350,48 @@ class TemporalSignalData(Data, ChunkableMixin, FileRamMixin):
 
 
 class FreqSignalData(Data, ChunkableMixin, FileRamMixin):
+    self_describing = True  # Fichiers avec en-tête (dtype, nombre de samples, axe, unité, nom)
+    block_stats = True  # Index des statistiques par bloc (find_blocks, global_stats)
+
     def __init__(self, data_id, data_name, data_size_in_bytes, number_of_elements, freq_step, unit, fmin=0.0,
-                 timestamp=0.0, in_file=False):
+                 timestamp=0.0, in_file=False, use_mmap=False,
+                 compression=None, block_size=DEFAULT_BLOCK_SIZE):
         super().__init__(data_id, Data_Type.FREQ_SIGNAL, data_name, data_size_in_bytes, number_of_elements, in_file,
                          sample_type='float32')
+        self.use_mmap = use_mmap  # lecture du fichier par projection mémoire
+        self.set_compression(compression, block_size)  # fichier compressé par blocs (codec), None : brut
         self.df = freq_step
         self.unit = unit
         self.fmin = fmin  # fréquence minimum (par défaut à 0)
         self.timestamp = timestamp  # timestamp optionnel (par défaut à 0)
 
+    def _file_metadata(self):
+        metadata = super()._file_metadata()
+        metadata.update(df=self.df, fmin=self.fmin, timestamp=self.timestamp, unit=self.unit)
+        return metadata
+
+    def freq_axis(self):
+        """Retourne l'axe fréquentiel (fmin + i * df), généré à la demande sans être matérialisé."""
+        return LinearAxis(self.fmin, self.df, self.num_samples)
+
+    def read_freq_band(self, f0, f1, with_axis=False):
+        """
+        Retourne les samples dont la fréquence est comprise entre f0 et f1 (bornes incluses), par une seule
+        lecture à la position correspondante du fichier (ou une tranche de la projection mémoire ou de la RAM).
+        :param f0: Fréquence de début (Hz).
+        :param f1: Fréquence de fin (Hz).
+        :param with_axis: Si True, retourne le tuple (axe fréquentiel de la bande, samples).
+        """
+        start, stop = self.freq_axis().index_range(f0, f1)
+        samples = self.read_range(start, stop)
+        return (self.freq_axis()[start:stop], samples) if with_axis else samples
+
+    @classmethod
+    def _from_file_metadata(cls, metadata, use_mmap=False):
+        return cls(metadata['data_id'], metadata['data_name'], 0, metadata['num_samples'], metadata['df'],
+                   metadata['unit'], fmin=metadata['fmin'], timestamp=metadata['timestamp'], in_file=True,
+                   use_mmap=use_mmap)
+
 
 class FFTSData(Data):
     def __init__(self, data_id, data_name, data_size_in_bytes, number_of_elements, freq_step, fmin, unit, datapool=None,
@@ -437,7 +1423,7 @@ class FFTSData(Data):
         """
         Récupère les objets FreqSignalData à partir de leurs data_id en interrogeant le DataPool.
         """
-        return [self.datapool.get_data_info(data_id)['data_object'].values[0] for data_id in self.data]
+        return [self.datapool.get_data_info(data_id)['data_object'] for data_id in self.data]
 
     @property
     def fft_ids(self):
@@ -446,6 +1432,17 @@ class FFTSData(Data):
         """
         return self.data
 
+    def check_limit(self, limit, batch_size=DEFAULT_FRAME_BATCH, workers=None):
+        """
+        Vérifie tous les spectres par rapport à une limite fréquentielle : la limite est évaluée une seule fois sur
+        la grille commune (fmin, df), puis les spectres sont comparés par lots 2-D en parallèle (voir check_frames).
+        :param limit: Limite fréquentielle (FreqLimitsData).
+        :param batch_size: Nombre de spectres comparés ensemble.
+        :param workers: Nombre de threads (nombre de CPU par défaut).
+        :return: ComplianceResult (table : frame, timestamp, worst_margin, worst_frequency, violations).
+        """
+        return check_frames(limit, self.fft_signals, self.fmin, self.df, batch_size, workers)
+
 
 class ConstantsData(Data):
     def __init__(self, data_id, data_name, data_size_in_bytes, number_of_elements, in_file=False):
@@ -487,6 +1484,7 @@ class FreqLimitsData(Data):
         self.interpolation_type = None
         self.freq_min = None
         self.freq_max = None
+        self._limit_cache = None  # (clé, fréquences triées, niveaux) ; invalidé à chaque modification des points
 
     def set_interpolation_type(self, interpolation_type):
         """
@@ -505,6 +1503,7 @@ class FreqLimitsData(Data):
         # if self.data and frequency <= self.data[-1][0]:
         #     raise ValueError("Frequency points must be in strictly increasing order.")
         self.data.append((frequency, level))
+        self._limit_cache = None
         #récupérer les fréquences max et min
         if self.freq_min is None or frequency < self.freq_min:
             self.freq_min = frequency
@@ -516,44 +1515,93 @@ class FreqLimitsData(Data):
         Efface tous les points de limite de fréquence.
         """
         self.data.clear()
+        self._limit_cache = None
+
+    def _limit_arrays(self):
+        """
+        Retourne les tableaux (fréquences, niveaux) des points de limite triés par fréquence. Le tri est stable :
+        deux points de même fréquence (marche de la limite) gardent leur ordre d'ajout. Les tableaux sont mis en
+        cache et recalculés si la liste des points a été modifiée ou remplacée (store_data).
+        """
+        key = (id(self.data), len(self.data))
+        if self._limit_cache is None or self._limit_cache[0] != key:
+            points = np.asarray(self.data, dtype=np.float64).reshape(-1, 2)
+            order = np.argsort(points[:, 0], kind='stable')
+            self._limit_cache = (key, points[order, 0].copy(), points[order, 1].copy())
+        return self._limit_cache[1], self._limit_cache[2]
 
     def interpolate(self, freq):
         """
-        Interpole le niveau limite pour une fréquence donnée en fonction du type d'interpolation spécifié.
-        :param freq: La fréquence pour laquelle interpoler le niveau limite.
-        :return: Le niveau limite interpolé.
+        Interpole le niveau limite pour une ou plusieurs fréquences en fonction du type d'interpolation spécifié.
+        En dessous de la première fréquence (au-dessus de la dernière), le premier (dernier) niveau est renvoyé.
+        :param freq: La fréquence (scalaire) ou les fréquences (tableau) pour lesquelles interpoler le niveau limite.
+        :return: Le niveau limite interpolé (float), ou un tableau de niveaux de même forme que freq.
         """
         if not self.data:
             raise ValueError("No frequency limit points have been added.")
         if self.interpolation_type is None:
             raise ValueError("Interpolation type is not set.")
 
-        # Extraire les fréquences et niveaux limites
-        frequencies, levels = zip(*self.data)
-
-        if freq <= frequencies[0]:
-            return levels[0]  # En dessous de la première fréquence, renvoyer le premier niveau
-        elif freq >= frequencies[-1]:
-            return levels[-1]  # Au-dessus de la dernière fréquence, renvoyer le dernier niveau
+        frequencies, levels = self._limit_arrays()
+        query = np.asarray(freq, dtype=np.float64)
+        flat = query.reshape(-1)
+        # Premier point de fréquence >= freq : segment [i - 1, i] (à une fréquence de marche, le premier niveau)
+        index = np.clip(np.searchsorted(frequencies, flat, side='left'), 1, max(len(frequencies) - 1, 1))
+        result = np.empty(flat.shape)
+        below = flat <= frequencies[0]
+        above = ~below & (flat >= frequencies[-1])
+        inside = ~(below | above)
+        result[below] = levels[0]
+        result[above] = levels[-1]
+
+        if inside.any():
+            i = index[inside]
+            f0, f1 = frequencies[i - 1], frequencies[i]
+            l0, l1 = levels[i - 1], levels[i]
+            f = flat[inside]
+            if self.interpolation_type == 'linear':
+                # Interpolation linéaire
+                result[inside] = l0 + (l1 - l0) * (f - f0) / (f1 - f0)
+            else:
+                # Interpolation logarithmique
+                if np.any(f0 <= 0):
+                    raise ValueError("Frequencies must be positive for logarithmic interpolation.")
+                result[inside] = l0 + (l1 - l0) * (np.log(f / f0) / np.log(f1 / f0))
 
-        # Interpolation entre les points
-        for i in range(1, len(frequencies)):
-            if frequencies[i] >= freq:
-                f0, l0 = frequencies[i - 1], levels[i - 1]
-                f1, l1 = frequencies[i], levels[i]
-                if self.interpolation_type == 'linear':
-                    # Interpolation linéaire
-                    return l0 + (l1 - l0) * (freq - f0) / (f1 - f0)
-                elif self.interpolation_type == 'log':
-                    # Interpolation logarithmique
-                    if f0 <= 0 or f1 <= 0:
-                        raise ValueError("Frequencies must be positive for logarithmic interpolation.")
-                    return l0 + (l1 - l0) * (np.log(freq / f0) / np.log(f1 / f0))
+        if query.ndim == 0:
+            return float(result[0])
+        return result.reshape(query.shape)
 
-        raise ValueError("Interpolation failed. Frequency range not found.")
+    def check_spectrum(self, freq_signal):
+        """
+        Compare un spectre à la limite en une seule passe vectorisée : la limite est interpolée sur tout l'axe
+        fréquentiel du signal, puis la marge (limite - niveau) est calculée pour chaque bin.
+        :param freq_signal: Signal fréquentiel (FreqSignalData) à vérifier, exprimé dans l'unité de la limite.
+        :return: Dictionnaire avec 'margins' (marge de chaque bin), 'violations' (indices des bins dont la marge
+            est négative), 'violation_frequencies', 'worst_margin', 'worst_frequency' et 'passed'.
+        """
+        if not isinstance(freq_signal, FreqSignalData):
+            raise ValueError("Spectrum check requires a FreqSignalData.")
+        frequencies = np.asarray(freq_signal.freq_axis())
+        spectrum = np.asarray(freq_signal.read_data(), dtype=np.float64).reshape(-1)
+        if spectrum.size != frequencies.size:
+            raise ValueError("Spectrum size does not match its frequency axis.")
+        margins = self.interpolate(frequencies) - spectrum
+        violations = np.flatnonzero(margins < 0)
+        worst = int(np.argmin(margins)) if margins.size else None
+        return {
+            'margins': margins,
+            'violations': violations,
+            'violation_frequencies': frequencies[violations],
+            'worst_margin': float(margins[worst]) if worst is not None else None,
+            'worst_frequency': float(frequencies[worst]) if worst is not None else None,
+            'passed': not violations.size,
+        }
 
 
 class TempLimitsData(Data):
+    _INITIAL_CAPACITY = 1024  # Capacité initiale des colonnes de l'index (doublée au besoin)
+
     def __init__(self, data_id, data_name, data_size_in_bytes, number_of_elements, unit, in_file=False):
         """
         Initializes an instance of TempLimitsData.
@@ -571,6 +1619,11 @@ class TempLimitsData(Data):
         self.data = []  # List of tuples (level, transparency_time, release_time)
         self.time_min = None
         self.time_max = None
+        # Index columnaire (niveau, transparency, release, release maximal cumulé) trié par transparency_time,
+        # associé à la liste des points par la clé (id, longueur) et complété en place par add_limit_point
+        self._index_columns = None
+        self._index_count = 0
+        self._index_key = None
 
     def add_limit_point(self, level, transparency_time, release_time):
         """
@@ -582,8 +1635,13 @@ class TempLimitsData(Data):
         """
         if self.data and transparency_time <= self.data[-1][1]:
             raise ValueError("Transparency times must be in strictly increasing order.")
+        if release_time < transparency_time:
+            raise ValueError("Release time must be greater than or equal to transparency time.")
 
+        indexed = self._index_columns is not None and self._index_key == (id(self.data), len(self.data))
         self.data.append((level, transparency_time, release_time))
+        if indexed:
+            self._append_to_index(level, transparency_time, release_time)
 
         # Update minimum and maximum time ranges
         if self.time_min is None or transparency_time < self.time_min:
@@ -596,6 +1654,126 @@ class TempLimitsData(Data):
         self.data.clear()
         self.time_min = None
         self.time_max = None
+        self._index_columns = None
+
+    def _append_to_index(self, level, transparency_time, release_time):
+        """Ajoute un point à la fin de l'index (les transparency_time sont croissants), en O(1) amorti."""
+        columns, count = self._index_columns, self._index_count
+        if count == columns.shape[1]:
+            grown = np.empty((4, 2 * count))
+            grown[:, :count] = columns
+            self._index_columns = columns = grown
+        max_release = max(columns[3, count - 1], release_time) if count else release_time
+        columns[:, count] = (level, transparency_time, release_time, max_release)
+        self._index_count = count + 1
+        self._index_key = (id(self.data), len(self.data))
+
+    def _limit_index(self):
+        """
+        Retourne les colonnes de l'index (tableau (4, n) : niveaux, transparency_time, release_time et release_time
+        maximal cumulé), triées par transparency_time. L'index est reconstruit si la liste des points a été
+        remplacée (store_data) ; le maximum cumulé, croissant, borne par recherche dichotomique les fenêtres
+        pouvant encore être actives à un instant donné.
+        """
+        data = [] if self.data is None else self.data
+        key = (id(self.data), len(data))
+        if self._index_columns is None or self._index_key != key:
+            try:
+                points = np.asarray(data, dtype=np.float64).reshape(-1, 3)
+            except ValueError:
+                raise ValueError("Temporal limit points must be (level, transparency_time, release_time) tuples.")
+            if np.any(points[:, 2] < points[:, 1]):
+                raise ValueError("Release time must be greater than or equal to transparency time.")
+            points = points[np.argsort(points[:, 1], kind='stable')]
+            columns = np.empty((4, max(len(points), self._INITIAL_CAPACITY)))
+            columns[:3, :len(points)] = points.T
+            columns[3, :len(points)] = np.maximum.accumulate(points[:, 2]) if len(points) else points[:, 2]
+            self._index_columns, self._index_count, self._index_key = columns, len(points), key
+        return self._index_columns[:, :self._index_count]
+
+    def limit_columns(self):
+        """
+        Retourne les points de limite sous forme de colonnes NumPy triées par transparency_time.
+        :return: Tuple (niveaux, transparency_times, release_times) de tableaux float64 (vues en lecture seule).
+        """
+        columns = self._limit_index()[:3].view()
+        columns.flags.writeable = False
+        return columns[0], columns[1], columns[2]
+
+    def _query(self, first, stop, keep):
+        """
+        Parcourt, pour chaque requête q, les fenêtres candidates [first[q], stop[q]) et garde celles pour lesquelles
+        keep(release_times, indices des requêtes) est vrai, en une seule passe vectorisée.
+        :return: Tuple (offsets, indices) : les fenêtres de la requête q sont indices[offsets[q]:offsets[q + 1]].
+        """
+        counts = np.maximum(stop - first, 0)
+        total = int(counts.sum())
+        queries = np.repeat(np.arange(len(first)), counts)
+        # Indices candidats : first[q], first[q] + 1, ..., stop[q] - 1 pour chaque requête, concaténés
+        candidates = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(first, counts)
+        mask = keep(self._limit_index()[2][candidates], queries)
+        offsets = np.zeros(len(first) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(queries[mask], minlength=len(first)), out=offsets[1:])
+        return offsets, candidates[mask]
+
+    @staticmethod
+    def _query_bounds(start_times, end_times):
+        starts = np.atleast_1d(np.asarray(start_times, dtype=np.float64))
+        ends = np.atleast_1d(np.asarray(end_times, dtype=np.float64))
+        if starts.shape != ends.shape or starts.ndim != 1:
+            raise ValueError("Start and end times must be 1-D arrays of the same length.")
+        if np.any(starts > ends):
+            raise ValueError("Start time must be less than or equal to end time.")
+        return starts, ends
+
+    def get_limits_in_ranges(self, start_times, end_times):
+        """
+        Forme groupée de get_limits_in_range : fenêtres entièrement contenues dans chaque plage
+        [start_times[q], end_times[q]], en O(log n + k) par requête (les candidates sont les fenêtres dont la
+        transparency_time est dans la plage, contiguës dans l'index).
+        :return: Tuple (offsets, indices) : les indices (dans limit_columns()) des fenêtres de la plage q sont
+            indices[offsets[q]:offsets[q + 1]].
+        """
+        starts, ends = self._query_bounds(start_times, end_times)
+        transparency = self._limit_index()[1]
+        first = np.searchsorted(transparency, starts, side='left')
+        stop = np.searchsorted(transparency, ends, side='right')
+        return self._query(first, stop, lambda release, q: release <= ends[q])
+
+    def windows_overlapping(self, start_times, end_times):
+        """
+        Fenêtres actives à au moins un instant de chaque plage [start_times[q], end_times[q]]
+        (transparency_time <= fin et release_time >= début). Les candidates sont bornées par recherche
+        dichotomique sur les transparency_time et sur le release_time maximal cumulé.
+        :return: Tuple (offsets, indices), comme get_limits_in_ranges.
+        """
+        starts, ends = self._query_bounds(start_times, end_times)
+        columns = self._limit_index()
+        first = np.searchsorted(columns[3], starts, side='left')
+        stop = np.searchsorted(columns[1], ends, side='right')
+        return self._query(first, stop, lambda release, q: release >= starts[q])
+
+    def windows_at(self, times):
+        """
+        Forme groupée de limits_at : fenêtres actives à chaque instant times[q]
+        (transparency_time <= t <= release_time).
+        :return: Tuple (offsets, indices), comme get_limits_in_ranges.
+        """
+        return self.windows_overlapping(times, times)
+
+    def _points(self, indices):
+        """Retourne les points de limite (level, transparency_time, release_time) d'indices de l'index."""
+        columns = self._limit_index()[:3, indices]
+        return list(zip(*columns.tolist())) if len(indices) else []
+
+    def limits_at(self, time):
+        """
+        Retourne les points de limite actifs à l'instant time (transparency_time <= time <= release_time).
+
+        :param time: Time of the query.
+        :return: List of limit points (level, transparency_time, release_time) active at that time.
+        """
+        return self._points(self.windows_at(time)[1])
 
     def get_limits_in_range(self, start_time, end_time):
         """
@@ -607,15 +1785,68 @@ class TempLimitsData(Data):
         """
         if start_time > end_time:
             raise ValueError("Start time must be less than or equal to end time.")
+        return self._points(self.get_limits_in_ranges(start_time, end_time)[1])
+
+    def ram_footprint(self):
+        footprint = super().ram_footprint()
+        if self._index_columns is not None:
+            footprint += self._index_columns.nbytes
+        return footprint
 
-        # Filter data points based on the specified time range
-        limits_in_range = [
-            (level, transparency_time, release_time)
-            for level, transparency_time, release_time in self.data
-            if transparency_time >= start_time and release_time <= end_time
-        ]
 
-        return limits_in_range
+def open_data_file(path, use_mmap=False):
+    """
+    Rattache un fichier de données auto-descriptif à un nouvel objet Data de la classe indiquée par son en-tête,
+    sans lire la charge utile.
+    :param path: Chemin du fichier .dat.
+    :param use_mmap: Si True, les lectures passent par une projection mémoire du fichier.
+    :return: L'objet Data (TemporalSignalData ou FreqSignalData), stocké en fichier et prêt à être lu.
+    :raises ValueError: Si le fichier n'est pas auto-descriptif ou contient un type de données non supporté.
+    """
+    return data_from_file_metadata(read_file_header(path), path, use_mmap=use_mmap)
+
+
+def data_from_file_metadata(metadata, path, use_mmap=False):
+    """
+    Crée l'objet Data décrit par les métadonnées d'en-tête d'un fichier (lues depuis le fichier ou un catalogue),
+    sans accéder au fichier.
+    :param metadata: Dict des métadonnées de l'en-tête.
+    :param path: Chemin du fichier de données.
+    :param use_mmap: Si True, les lectures passent par une projection mémoire du fichier.
+    :return: L'objet Data, stocké en fichier et prêt à être lu.
+    """
+    data_class = SELF_DESCRIBING_CLASSES.get(metadata.get('data_type'))
+    if data_class is None:
+        raise ValueError(f"Unsupported data type {metadata.get('data_type')} in file {path}.")
+    data_obj = data_class._from_file_metadata(metadata, use_mmap=use_mmap)
+    if np.dtype(metadata['dtype']) != data_obj.dtype:
+        raise ValueError(f"File {path} stores {metadata['dtype']} samples, expected {data_obj.dtype.str}.")
+    compression = metadata.get('compression')
+    if compression is not None:
+        data_obj.set_compression(compression['codec'], compression['block_size'])
+    data_obj.envelope = 'envelope' in metadata
+    quantization = metadata.get('quantization')
+    if quantization is not None:
+        data_obj.set_compression(data_obj.compression, quantization['block_size'])
+        data_obj.set_quantization(quantization['dtype'])
+    data_obj.file_path = os.path.abspath(path)
+    data_obj.num_samples = metadata['num_samples']
+    data_obj.data_size_in_bytes = data_obj.num_samples * data_obj.sample_size
+    data_obj.mark_data_ready()
+    return data_obj
+
+
+# Classes dont les fichiers sont auto-descriptifs, par nom de Data_Type (champ data_type de l'en-tête)
+SELF_DESCRIBING_CLASSES = {
+    Data_Type.TEMPORAL_SIGNAL.name: TemporalSignalData,
+    Data_Type.FREQ_SIGNAL.name: FreqSignalData,
+}
+
+
+def _resolve_future(future):
+    """Termine une future asyncio si elle n'a pas été annulée entre-temps."""
+    if not future.done():
+        future.set_result(None)
 
 
 # Obsolète Générateur de données pour différents types (int32, int64, float32, float64)
@@ -1,35 +1,113 @@
+import asyncio
+import json
 import numpy as np
 import os
-import pandas as pd
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from uuid import uuid4
 #si dev src sinon si distrib PyDataCore
 
 from .data import Data_Type, FilePathListData, FolderPathListData, FileListData, \
-    TemporalSignalData, FreqSignalData, FFTSData, ConstantsData, StrData, IntsData, FreqLimitsData, TempLimitsData
+    TemporalSignalData, FreqSignalData, FFTSData, ConstantsData, StrData, IntsData, FreqLimitsData, TempLimitsData, \
+    FileRamMixin, ChunkableMixin, open_data_file, data_from_file_metadata
+from .compliance import DEFAULT_EVALUATION_CHUNK, DEFAULT_FRAME_BATCH, check_frames
+from .locks import ReadWriteLock
+from .registry import LazyRow, RegistryTable, SubscriberTable
+from .streaming import ordered_map, prefetch as prefetch_chunks
+
+_WRITE_PHASE = object()  # Détenteur du verrou pendant la phase d'écriture ouverte par register_data
+
+# Mapping des types de données vers les classes correspondantes
+DATA_CLASS_MAPPING = {
+    Data_Type.FILE_PATHS: FilePathListData,
+    Data_Type.FOLDER_PATHS: FolderPathListData,
+    Data_Type.FILE_LIST: FileListData,
+    Data_Type.TEMPORAL_SIGNAL: TemporalSignalData,
+    Data_Type.FREQ_SIGNAL: FreqSignalData,
+    Data_Type.FFTS: FFTSData,
+    Data_Type.CONSTANTS: ConstantsData,
+    Data_Type.STR: StrData,
+    Data_Type.INTS: IntsData,
+    Data_Type.FREQ_LIMIT: FreqLimitsData,
+    Data_Type.TEMP_LIMIT: TempLimitsData,
+}
+
+# Identification des fichiers de catalogue (save_catalog / load)
+CATALOG_FORMAT = 'PyDataCore-catalog'
+CATALOG_VERSION = 1
+
+
+def _restore_data_object(entry):
+    """Crée l'objet Data d'une entrée de catalogue lors du premier accès à sa ligne de registre."""
+    return {'data_object': data_from_file_metadata(entry['metadata'], entry['file_path'], use_mmap=entry['use_mmap'])}
+
+
+# Fonctions exécutées par les workers de map_chunks (au niveau du module pour être picklables)
+def _map_range(fn, data_obj, start, stop):
+    """Lit la plage [start, stop) dans le worker (thread) puis applique fn."""
+    return fn(data_obj.read_range(start, stop))
+
+
+def _map_file_range(fn, file_path, dtype, offset, count):
+    """Lit count samples à l'offset donné du fichier dans le worker (processus) puis applique fn."""
+    return fn(np.fromfile(file_path, dtype=dtype, count=count, offset=offset))
+
+
+def _map_opened_range(fn, file_path, start, stop):
+    """Rattache le fichier auto-descriptif dans le worker (processus) et lit la plage (décompression comprise)."""
+    return fn(open_data_file(file_path).read_range(start, stop))
+
+
+def _map_shared_range(fn, descriptor, start, stop):
+    """Attache la mémoire partagée dans le worker (processus) et applique fn à la plage sans copie."""
+    with descriptor.attach() as array:
+        return fn(array[start:stop])
 
 
 class DataPool:
-    def __init__(self):
-        # DataFrame pour enregistrer les informations sur les données (Data)
-        self.data_registry = pd.DataFrame(columns=[
+    def __init__(self, max_ram_bytes=None, spill_folder=None):
+        """
+        :param max_ram_bytes: Budget RAM en bytes. Au-delà, les signaux non protégés les moins récemment utilisés
+                              sont déplacés en fichier (None : pas de budget).
+        :param spill_folder: Dossier des fichiers de débordement (dossier temporaire créé à la demande si None).
+        """
+        # Registre des données (Data) indexé par data_id, avec index secondaires par type et par nom
+        self.data_registry = RegistryTable(columns=[
             'data_id', 'data_type', 'data_name', 'storage_type', 'data_object'
-        ])
+        ], indexed_columns=('data_type', 'data_name'))
 
-        # DataFrame pour lier les sources aux données et gérer les verrous et la protection
-        self.source_to_data = pd.DataFrame(columns=[
+        # Registre liant les sources aux données et gérant les verrous et la protection, indexé par data_id et source_id
+        self.source_to_data = RegistryTable(columns=[
             'source_id', 'data_id', 'locked', 'protected'
-        ])
-
-        # DataFrame pour gérer les abonnés (subscribers) et les acquittements
-        self.subscriber_to_data = pd.DataFrame(columns=[
-            'subscriber_id', 'data_id', 'acquitements'
-        ])
+        ], indexed_columns=('source_id',))
+
+        # Registre des abonnés (subscribers) et des acquittements, indexé par data_id puis subscriber_id
+        self.subscriber_to_data = SubscriberTable()
+
+        # Verrou court protégeant les registres (jamais détenu pendant une lecture/écriture de données)
+        self._registry_lock = threading.RLock()
+        # Verrou lecteurs/écrivain par donnée : lectures concurrentes, écriture exclusive
+        self._item_locks = {}
+        # Détenteur du verrou en écriture de chaque donnée verrouillée (thread, owner explicite ou _WRITE_PHASE)
+        self._lock_owners = {}
+
+        # Budget RAM : occupation réelle des données en RAM, du moins au plus récemment utilisée (LRU)
+        self.max_ram_bytes = max_ram_bytes
+        self.spill_folder = spill_folder
+        self._ram_usage = OrderedDict()  # data_id -> bytes occupés en RAM
+        self._ram_bytes = 0
+        self._spilled = set()  # Données déplacées en fichier par le DataPool (candidates à la promotion)
+        self._maintenance = set()  # Données en cours de déplacement RAM <-> fichier par le DataPool
+        self._ram_stats = {'evictions': 0, 'promotions': 0, 'spilled_bytes': 0, 'promoted_bytes': 0}
 
     def generate_unique_id(self):
         """ Génère un identifiant unique pour une nouvelle donnée """
         return str(uuid4())
 
-    def register_data(self, data_type, data_name, source_id, protected=False, in_file=False, **kwargs):
+    def register_data(self, data_type, data_name, source_id, protected=False, in_file=False, shared_memory=False,
+                      **kwargs):
         """
         Enregistre une nouvelle donnée dans le DataPool et l'associe à une source.
 
@@ -38,37 +116,20 @@ class DataPool:
         :param source_id: ID de la source associée à cette donnée
         :param protected: True si la donnée est protégée contre la suppression
         :param in_file: Si True, la donnée sera stockée dans un fichier. Si False, elle sera stockée en RAM.
+        :param shared_memory: Si True, la donnée numérique est stockée dans un segment de mémoire partagée,
+                              attachable sans copie depuis d'autres processus (voir get_shared_descriptor).
         :param kwargs: Paramètres supplémentaires requis par certaines classes de données (ex: time_step, unit)
         :return: L'ID unique de la donnée créée
         """
         data_id = self.generate_unique_id()
 
-        # Déterminer le type de stockage : 'ram' ou 'file'
-        storage_type = 'file' if in_file else 'ram'
-
-        # Mapping des types de données vers les classes correspondantes
-        data_class_mapping = {
-            Data_Type.FILE_PATHS.value: FilePathListData,
-            Data_Type.FOLDER_PATHS.value: FolderPathListData,
-            Data_Type.FILE_LIST.value: FileListData,
-            Data_Type.TEMPORAL_SIGNAL.value: TemporalSignalData,
-            Data_Type.FREQ_SIGNAL.value: FreqSignalData,
-            Data_Type.FFTS.value: FFTSData,
-            Data_Type.CONSTANTS.value: ConstantsData,
-            Data_Type.STR.value: StrData,
-            Data_Type.INTS.value: IntsData,
-            Data_Type.FREQ_LIMIT.value: FreqLimitsData,
-            Data_Type.TEMP_LIMIT.value: TempLimitsData,
-        }
-
-        # Debugging: print the available data mappings
-        print(f"Available data class mappings: {list(data_class_mapping.keys())}")
-        print(f"Registering data of type: {data_type}")
-
-        # Comparer en utilisant la valeur de l'énumération
+        # Déterminer le type de stockage : 'ram', 'shm' (mémoire partagée) ou 'file'
+        if shared_memory and in_file:
+            raise ValueError("Shared memory storage is not available for file-based data.")
+        storage_type = 'file' if in_file else 'shm' if shared_memory else 'ram'
+
         try:
-            data_class = data_class_mapping[data_type.value]
-            print(f"Instantiating data class: {data_class}")
+            data_class = DATA_CLASS_MAPPING[data_type]
         except KeyError:
             raise ValueError(f"Data type {data_type} is not supported.")
 
@@ -97,115 +158,418 @@ class DataPool:
                 **kwargs  # Transfert des paramètres optionnels (time_step, unit, etc.)
             )
 
-            print(f"Data object created: {data_obj}")
-
         except Exception as e:
             raise ValueError(f"Failed to instantiate data class {data_class} with error: {e}")
+        if shared_memory and data_obj.sample_type == 'str':
+            raise ValueError(f"Shared memory storage requires numeric data, not {data_type.name}.")
+        if shared_memory and data_obj.quantization:
+            raise ValueError("Shared memory storage is not available for quantized data.")
 
-        # Ajouter la donnée au registre de données
-        new_data_entry = {
-            'data_id': data_id,
-            'data_type': data_type.name,  # Use the name instead of full enum
-            'data_name': data_name,
-            'storage_type': storage_type,
-            'data_object': data_obj  # Objet de donnée instancié
-        }
-        self.data_registry = pd.concat([self.data_registry, pd.DataFrame([new_data_entry])], ignore_index=True)
-
-        # Ajouter la donnée au registre source_to_data
-        source_entry = {
-            'source_id': source_id,
-            'data_id': data_id,
-            'locked': True,  # Verrouiller pendant la phase d'écriture
-            'protected': protected
-        }
-        self.source_to_data = pd.concat([self.source_to_data, pd.DataFrame([source_entry])], ignore_index=True)
-
+        # Verrouiller en écriture pendant la phase d'écriture (jusqu'au store_data ou unlock_data)
+        self._add_entry(data_obj, source_id, protected, storage_type, locked=True)
         return data_id
 
+    def _add_entry(self, data_obj, source_id, protected, storage_type, locked):
+        """
+        Ajoute un objet Data instancié aux registres.
+        :param locked: Si True, la donnée est verrouillée en écriture (phase d'écriture jusqu'au store_data) ;
+                       sinon elle est immédiatement lisible.
+        """
+        data_id = data_obj.data_id
+        item_lock = ReadWriteLock()
+        if locked:
+            item_lock.acquire_write()
+
+        with self._registry_lock:
+            if data_id in self.data_registry:
+                raise ValueError(f"Data {data_id} is already registered.")
+            # Ajouter la donnée au registre de données
+            self.data_registry.add({
+                'data_id': data_id,
+                'data_type': data_obj.data_type.name,  # Use the name instead of full enum
+                'data_name': data_obj.data_name,
+                'storage_type': storage_type,
+                'data_object': data_obj  # Objet de donnée instancié
+            })
+
+            # Ajouter la donnée au registre source_to_data
+            self.source_to_data.add({
+                'source_id': source_id,
+                'data_id': data_id,
+                'locked': locked,  # Verrouiller pendant la phase d'écriture
+                'protected': protected
+            })
+            self._item_locks[data_id] = item_lock
+            if locked:
+                self._lock_owners[data_id] = _WRITE_PHASE
+        if not locked:
+            data_obj.mark_data_ready()
+
+    def register_file(self, file_path, source_id, protected=False, use_mmap=False):
+        """
+        Enregistre une donnée à partir d'un fichier .dat auto-descriptif, sans lire sa charge utile.
+        La donnée conserve le data_id de son en-tête et est immédiatement lisible.
+
+        :param file_path: Chemin du fichier.
+        :param source_id: ID de la source associée à cette donnée.
+        :param protected: True si la donnée est protégée contre la suppression.
+        :param use_mmap: Si True, les lectures passent par une projection mémoire du fichier.
+        :return: L'ID de la donnée.
+        """
+        data_obj = open_data_file(file_path, use_mmap=use_mmap)
+        self._add_entry(data_obj, source_id, protected, 'file', locked=False)
+        return data_obj.data_id
+
+    def save_catalog(self, catalog_path):
+        """
+        Enregistre un instantané du catalogue du DataPool (registre, sources, protection, subscribers et
+        acquittements) pour un redémarrage rapide avec DataPool.load(). Seules les données stockées dans un fichier
+        auto-descriptif et hors phase d'écriture sont enregistrées : le contenu des données en RAM n'est pas
+        persistant. Le fichier est remplacé de façon atomique.
+
+        :param catalog_path: Chemin du fichier de catalogue (JSON).
+        :return: Nombre de données enregistrées dans le catalogue.
+        """
+        entries = []
+        with self._registry_lock:
+            for data_row in self.data_registry.rows():
+                data_id = data_row['data_id']
+                source_row = self.source_to_data[data_id]
+                if data_row['storage_type'] != 'file' or source_row['locked']:
+                    continue
+                if isinstance(data_row, LazyRow) and not data_row.loaded:
+                    # Entrée restaurée jamais accédée : ses métadonnées sont celles du catalogue d'origine
+                    entry = dict(data_row.source)
+                else:
+                    data_obj = data_row['data_object']
+                    if data_obj is None or not data_obj._has_header():
+                        continue
+                    entry = {'file_path': data_obj.file_path, 'use_mmap': data_obj.use_mmap,
+                             'metadata': data_obj._file_metadata()}
+                entry.update(source_id=source_row['source_id'], protected=source_row['protected'],
+                             subscribers=self.subscriber_to_data.acknowledgements(data_id))
+                entries.append(entry)
+
+        temporary_path = f"{catalog_path}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump({'format': CATALOG_FORMAT, 'version': CATALOG_VERSION, 'entries': entries}, f,
+                      separators=(',', ':'))
+        os.replace(temporary_path, catalog_path)
+        return len(entries)
+
+    @classmethod
+    def load(cls, catalog_path, **kwargs):
+        """
+        Crée un DataPool à partir d'un catalogue enregistré par save_catalog(). Les données en fichier sont
+        restaurées de façon différée : les lignes des registres sont créées à partir du catalogue, et l'objet Data
+        (ainsi que le verrou de la donnée) n'est créé qu'au premier accès, sans jamais lire la charge utile.
+        Les abonnements et acquittements en attente sont restaurés.
+
+        :param catalog_path: Chemin du fichier de catalogue.
+        :param kwargs: Paramètres du constructeur du DataPool (max_ram_bytes, spill_folder).
+        :return: Le DataPool restauré.
+        """
+        with open(catalog_path, 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+        if catalog.get('format') != CATALOG_FORMAT:
+            raise ValueError(f"File {catalog_path} is not a PyDataCore catalog.")
+        if catalog.get('version', 0) > CATALOG_VERSION:
+            raise ValueError(f"Unsupported catalog version {catalog['version']} (maximum supported: {CATALOG_VERSION}).")
+
+        pool = cls(**kwargs)
+        data_rows, source_rows = [], []
+        for entry in catalog['entries']:
+            metadata = entry['metadata']
+            data_id = metadata['data_id']
+            data_rows.append(LazyRow({
+                'data_id': data_id,
+                'data_type': metadata['data_type'],
+                'data_name': metadata['data_name'],
+                'storage_type': 'file',
+            }, entry, _restore_data_object))
+            source_rows.append({
+                'source_id': entry['source_id'],
+                'data_id': data_id,
+                'locked': False,
+                'protected': entry['protected']
+            })
+            pool.subscriber_to_data.restore(data_id, entry['subscribers'])
+        # Ajout en masse : les index secondaires sont construits à la première recherche
+        pool.data_registry.extend(data_rows)
+        pool.source_to_data.extend(source_rows)
+        if len(pool.data_registry) != len(data_rows):
+            raise ValueError(f"Catalog {catalog_path} contains duplicate data IDs.")
+        return pool
+
+    def register_folder(self, folder, source_id, protected=False, use_mmap=False):
+        """
+        Reconstruit le DataPool à partir des fichiers .dat auto-descriptifs d'un dossier (par exemple après un
+        redémarrage). Les fichiers sans en-tête valide et les données déjà enregistrées sont ignorés.
+
+        :param folder: Dossier à parcourir.
+        :param source_id: ID de la source associée aux données.
+        :param protected: True si les données sont protégées contre la suppression.
+        :param use_mmap: Si True, les lectures passent par une projection mémoire des fichiers.
+        :return: Liste des ID des données enregistrées.
+        """
+        data_ids = []
+        for file_name in sorted(os.listdir(folder)):
+            if not file_name.endswith('.dat'):
+                continue
+            try:
+                data_ids.append(self.register_file(os.path.join(folder, file_name), source_id, protected, use_mmap))
+            except ValueError as e:
+                print(f"Skipping {file_name}: {e}")
+        return data_ids
+
     def add_subscriber(self, data_id, subscriber_id):
         """Ajoute un subscriber à la donnée."""
-        subscriber_mapping = {
-            'subscriber_id': subscriber_id,
-            'data_id': data_id,
-            'acquitements': 0  # Pas encore d'acquittement
-        }
-        self.subscriber_to_data = pd.concat([self.subscriber_to_data, pd.DataFrame([subscriber_mapping])],
-                                            ignore_index=True)
+        with self._registry_lock:
+            self.subscriber_to_data.add(data_id, subscriber_id)
 
     def acknowledge_data(self, data_id, subscriber_id):
-        # Vérifier si la donnée est bien dans le registre
-        if data_id not in self.data_registry['data_id'].values:
-            raise ValueError(f"Data {data_id} not found in registry")
-
-        # Mettre à jour l'acquittement pour le subscriber
-        for index, row in self.subscriber_to_data.iterrows():
-            if row['data_id'] == data_id and row['subscriber_id'] == subscriber_id:
-                # Incrémenter l'acquittement pour ce subscriber
-                self.subscriber_to_data.at[index, 'acquitements'] = True
-                break
-        else:
-            raise ValueError(f"Subscriber {subscriber_id} not found for data {data_id}")
-
-        # Si tous les subscribers ont acquitté
-        if self._all_subscribers_acknowledged(data_id):
-            source_row = self.source_to_data[self.source_to_data['data_id'] == data_id]
-            if not source_row['protected'].values[0]:  # Si la donnée n'est pas protégée
-                print(f"All subscribers acknowledged and data {data_id} is not protected. Deleting data...")
-                self._release_data(data_id)  # Supprimer la donnée si elle n'est pas protégée
-            else:
+        with self._registry_lock:
+            # Vérifier si la donnée est bien dans le registre
+            if data_id not in self.data_registry:
+                raise ValueError(f"Data {data_id} not found in registry")
+
+            # Mettre à jour l'acquittement pour le subscriber (compteur d'acquittements en attente)
+            all_acknowledged = self.subscriber_to_data.acknowledge(data_id, subscriber_id)
+            if not all_acknowledged:
+                return
+            # Si tous les subscribers ont acquitté
+            if self.source_to_data.get_value(data_id, 'protected'):
                 print(f"Data {data_id} is protected, not deleting.")
+                return
+            # Retirer la donnée des registres sous le verrou pour qu'un seul thread la libère
+            print(f"All subscribers acknowledged and data {data_id} is not protected. Deleting data...")
+            unregistered = self._unregister(data_id)
+
+        self._release_data(data_id, unregistered)  # Supprimer la donnée si elle n'est pas protégée
+
+    def acknowledge_many(self, subscriber_id, data_ids):
+        """
+        Acquitte en une seule fois plusieurs données pour un subscriber.
+        Les données dont tous les subscribers ont acquitté sont libérées (si elles ne sont pas protégées).
+
+        :param subscriber_id: L'ID du subscriber qui acquitte.
+        :param data_ids: Itérable des ID des données à acquitter.
+        """
+        for data_id in list(data_ids):
+            self.acknowledge_data(data_id, subscriber_id)
 
     def _all_subscribers_acknowledged(self, data_id):
         # Vérifier si tous les subscribers ont acquitté
-        #récupérer une liste de tous les subscribers pour la donnée contenant les acquittements
-        subscribers = self.subscriber_to_data[self.subscriber_to_data['data_id'] == data_id]
-        print(f"subscribers : {subscribers}")
-        #faire une fonction logique et entre tous les acquittements
-        acquittements = subscribers['acquitements']
-        is_all_acquitted = acquittements.all()
-
-        return is_all_acquitted
-
-    def _release_data(self, data_id):
-        # Vérification si la donnée existe dans le registre
-        if data_id not in self.data_registry['data_id'].values:
+        return self.subscriber_to_data.all_acknowledged(data_id)
+
+    def _unregister(self, data_id):
+        """
+        Retire la donnée de tous les registres (à appeler sous le verrou des registres).
+        :return: Tuple (ligne du registre de données, ligne source_to_data, verrou de la donnée).
+        """
+        data_row = self.data_registry.remove(data_id)
+        if data_row is None:
             raise ValueError(f"Data {data_id} not found in registry during release process")
+        source_row = self.source_to_data.remove(data_id)
+        self.subscriber_to_data.remove(data_id)
+        self._lock_owners.pop(data_id, None)
+        self._forget_ram(data_id)
+        self._spilled.discard(data_id)
+        return data_row, source_row, self._item_locks.pop(data_id, None)
+
+    def _wait_for_readers(self, source_row, item_lock):
+        """
+        Attend la fin des lectures en cours sur une donnée retirée des registres avant de supprimer son contenu.
+        :return: True si le verrou en écriture a été pris et doit être relâché par l'appelant.
+        """
+        if item_lock is None or (source_row is not None and source_row['locked']):
+            # Donnée en phase d'écriture : le verrou en écriture est déjà détenu
+            return False
+        item_lock.acquire_write()
+        return True
+
+    def _release_data(self, data_id, unregistered=None):
+        # Retirer la donnée des registres si l'appelant ne l'a pas déjà fait
+        if unregistered is None:
+            with self._registry_lock:
+                unregistered = self._unregister(data_id)
+        data_row, source_row, item_lock = unregistered
+
+        # Attendre la fin des lectures en cours avant de supprimer le contenu
+        write_locked = self._wait_for_readers(source_row, item_lock)
+        try:
+            # Si la donnée est en RAM ou en fichier, la supprimer et nettoyer la référence
+            data_obj = data_row['data_object']
+            if data_row['storage_type'] == 'ram':
+                # Supprimer l'objet data de la RAM
+                data_row['data_object'] = None
+            elif data_row['storage_type'] == 'shm':
+                # Supprimer le segment de mémoire partagée (les processus attachés gardent leur projection)
+                data_obj.release_shared_memory()
+                data_row['data_object'] = None
+            elif data_row['storage_type'] == 'file':
+                # Supprimer le fichier si la donnée est stockée en fichier
+                if data_obj.file_path and os.path.exists(data_obj.file_path):
+                    print(f"Deleting file {data_obj.file_path} associated with data {data_id}")
+                    os.remove(data_obj.file_path)
+        finally:
+            if write_locked:
+                item_lock.release_write()
+
+        print(f"Donnée {data_id} libérée et retirée du registre")
+
+    def find(self, source_id=None, subscriber_id=None, data_type=None, data_name=None):
+        """
+        Recherche les données correspondant à tous les critères fournis à partir des index secondaires.
+        Le coût est proportionnel à la taille du plus petit ensemble de résultats parmi les critères fournis.
+
+        :param source_id: ID de la source propriétaire des données.
+        :param subscriber_id: ID d'un subscriber abonné aux données.
+        :param data_type: Type des données (Data_Type).
+        :param data_name: Nom des données.
+        :return: Liste des data_id correspondants, dans l'ordre d'enregistrement du plus petit ensemble.
+        """
+        with self._registry_lock:
+            return self._find(source_id, subscriber_id, data_type, data_name)
 
-        # Si la donnée est en RAM ou en fichier, la supprimer et nettoyer la référence
-        for index, row in self.data_registry.iterrows():
-            if row['data_id'] == data_id:
-                data_obj = row['data_object']
-                storage_type = row['storage_type']
-
-                if storage_type == 'ram':
-                    # Supprimer l'objet data de la RAM
-                    self.data_registry.at[index, 'data_object'] = None
-                elif storage_type == 'file':
-                    # Supprimer le fichier si la donnée est stockée en fichier
-                    if data_obj.file_path and os.path.exists(data_obj.file_path):
-                        print(f"Deleting file {data_obj.file_path} associated with data {data_id}")
-                        os.remove(data_obj.file_path)
-
-                # Retirer la donnée du registre
-                self.data_registry.drop(index, inplace=True)
-
-                # Supprimer l'entrée dans le tableau des sources et subscribers
-                self.source_to_data = self.source_to_data[self.source_to_data['data_id'] != data_id]
-                self.subscriber_to_data = self.subscriber_to_data[self.subscriber_to_data['data_id'] != data_id]
-
-                print(f"Donnée {data_id} libérée et retirée du registre")
-                break
-        else:
-            raise ValueError(f"Data {data_id} not found for release")
+    def _find(self, source_id, subscriber_id, data_type, data_name):
+        candidates = []
+        if source_id is not None:
+            candidates.append(self.source_to_data.lookup('source_id', source_id))
+        if subscriber_id is not None:
+            candidates.append(self.subscriber_to_data.data_ids(subscriber_id))
+        if data_type is not None:
+            candidates.append(self.data_registry.lookup('data_type', data_type.name))
+        if data_name is not None:
+            candidates.append(self.data_registry.lookup('data_name', data_name))
+        if not candidates:
+            return list(self.data_registry)
+
+        # Parcourir le plus petit ensemble et filtrer avec les autres (tests d'appartenance en O(1))
+        candidates.sort(key=len)
+        smallest, others = candidates[0], candidates[1:]
+        return [data_id for data_id in smallest if all(data_id in other for other in others)]
+
+    def _item_lock(self, data_id):
+        """
+        Retourne le verrou lecteurs/écrivain de la donnée (à appeler sous le verrou des registres). Pour les données
+        restaurées depuis un catalogue, le verrou n'est créé qu'au premier accès.
+        """
+        item_lock = self._item_locks.get(data_id)
+        if item_lock is None and data_id in self.source_to_data:
+            item_lock = self._item_locks[data_id] = ReadWriteLock()
+        return item_lock
+
+    def _get_item_lock(self, data_id):
+        """Retourne le verrou lecteurs/écrivain de la donnée."""
+        with self._registry_lock:
+            item_lock = self._item_lock(data_id)
+        if item_lock is None:
+            raise ValueError(f"Data {data_id} not found in registry")
+        return item_lock
+
+    def lock_data(self, data_id, timeout=None, owner=None):
+        """
+        Verrouille la donnée en écriture pour prévenir l'accès pendant l'écriture.
+        Attend la fin des lectures en cours et la libération du verrou par son détenteur actuel (par exemple une
+        conversion RAM <-> fichier en cours dans un autre thread, ou la phase d'écriture ouverte par register_data).
+
+        :param data_id: L'ID unique de la donnée dans le DataPool.
+        :param timeout: Durée maximale d'attente en secondes (None pour attendre indéfiniment).
+        :param owner: Détenteur du verrou (par défaut le thread appelant) ; seul ce détenteur peut le relâcher.
+        """
+        owner = self._lock_owner(owner)
+        item_lock = self._get_item_lock(data_id)
+        with self._registry_lock:
+            if self._lock_owners.get(data_id) == owner:
+                raise RuntimeError(f"Data {data_id} is already locked by this owner.")
+        if not item_lock.acquire_write(timeout=timeout):
+            raise TimeoutError(f"Timed out waiting to lock data {data_id}.")
+        with self._registry_lock:
+            if data_id not in self.source_to_data:
+                # Donnée libérée pendant l'attente du verrou
+                item_lock.release_write()
+                raise ValueError(f"Data {data_id} has been released.")
+            self._lock_owners[data_id] = owner
+            self.source_to_data.set_value(data_id, 'locked', True)
+            data_obj = self.data_registry.get_value(data_id, 'data_object')
+        if data_obj is not None:
+            data_obj.mark_data_unready()
+
+    def unlock_data(self, data_id, owner=None):
+        """
+        Déverrouille la donnée après écriture et la marque comme prête. Sans effet si la donnée n'est pas
+        verrouillée ; la phase d'écriture ouverte par register_data peut être close par n'importe quel appelant.
+
+        :param owner: Détenteur du verrou (par défaut le thread appelant).
+        :raises PermissionError: Si le verrou est détenu par un autre détenteur.
+        """
+        owner = self._lock_owner(owner)
+        with self._registry_lock:
+            holder = self._lock_owners.get(data_id)
+            if holder is None:
+                return
+            if holder is not _WRITE_PHASE and holder != owner:
+                raise PermissionError(f"Data {data_id} is locked by another owner and cannot be unlocked.")
+            del self._lock_owners[data_id]
+            self.source_to_data.set_value(data_id, 'locked', False)
+            item_lock = self._item_lock(data_id)
+            data_obj = self.data_registry.get_value(data_id, 'data_object')
+        item_lock.release_write()
+        if data_obj is not None:
+            data_obj.mark_data_ready()
+
+    @staticmethod
+    def _lock_owner(owner):
+        """Détenteur d'un verrou en écriture : owner s'il est fourni, sinon le thread appelant."""
+        return owner if owner is not None else ('thread', threading.get_ident())
+
+    def _check_readable(self, data_id, subscriber_id):
+        """
+        Vérifie que la donnée existe et que le subscriber est autorisé à la lire (à appeler sous le verrou des registres).
+        :return: La ligne du registre de données correspondante.
+        """
+        if data_id not in self.source_to_data:
+            raise ValueError(f"Data with ID {data_id} not found in source_to_data.")
+        if subscriber_id is not None and not self.subscriber_to_data.is_subscribed(data_id, subscriber_id):
+            raise PermissionError(f"Subscriber {subscriber_id} is not authorized to read data {data_id}")
+        return self.data_registry[data_id]
 
-    def lock_data(self, data_id):
-        """Verrouille la donnée pour prévenir l'accès pendant l'écriture."""
-        self.source_to_data.loc[self.source_to_data['data_id'] == data_id, 'locked'] = True
+    def _acquire_read(self, data_id, subscriber_id, blocking=False, timeout=None, check_subscriber=True):
+        """
+        Acquiert le verrou en lecture de la donnée après vérification des droits du subscriber.
+        Sans blocage, lève PermissionError si la donnée est verrouillée en écriture ; avec blocage, attend la fin
+        de l'écriture et lève TimeoutError si le délai est dépassé.
+
+        :return: Tuple (ligne du registre de données, verrou de la donnée) ; l'appelant doit relâcher le verrou.
+        """
+        with self._registry_lock:
+            if check_subscriber:
+                if subscriber_id is None:
+                    raise PermissionError(f"Subscriber {subscriber_id} is not authorized to read data {data_id}")
+                self._check_readable(data_id, subscriber_id)
+            elif data_id not in self.source_to_data:
+                raise ValueError(f"Data with ID {data_id} not found in source_to_data.")
+            item_lock = self._item_lock(data_id)
+
+        acquired = item_lock.acquire_read(blocking=blocking, timeout=timeout)
+        if not acquired and not blocking and data_id in self._maintenance:
+            # Déplacement RAM <-> fichier en cours par le DataPool : attendre, le déplacement est transparent
+            acquired = item_lock.acquire_read()
+        if not acquired:
+            if blocking:
+                raise TimeoutError(f"Timed out waiting for data {data_id} to be unlocked.")
+            raise PermissionError(f"Data {data_id} is locked and cannot be read.")
 
-    def unlock_data(self, data_id):
-        """Déverrouille la donnée après écriture."""
-        self.source_to_data.loc[self.source_to_data['data_id'] == data_id, 'locked'] = False
+        # La donnée a pu être libérée pendant l'attente du verrou
+        with self._registry_lock:
+            data_row = self.data_registry.get(data_id)
+            if data_id in self._ram_usage:
+                self._ram_usage.move_to_end(data_id)  # Donnée la plus récemment utilisée
+        if data_row is None:
+            item_lock.release_read()
+            raise ValueError(f"Data {data_id} has been released.")
+        return data_row, item_lock
 
     # Vérification des définitions spécifiques pour TemporalSignalData et FreqSignalData
     def _check_signal_data_definitions(self, data_obj):
@@ -221,7 +585,7 @@ class DataPool:
             if data_obj.df is None or data_obj.unit is None:
                 raise ValueError(f"Data {data_obj.data_id} is missing required definitions (freq_step, unit)")
 
-    def store_data(self, data_id, data_source, source_id, folder=None):
+    def store_data(self, data_id, data_source, source_id, folder=None, write_behind=False):
         """
         Stocke la donnée dans le DataPool en vérifiant les définitions de la donnée et son type de stockage.
 
@@ -229,24 +593,30 @@ class DataPool:
         :param data_source: Source des données (liste, tableau ou générateur).
         :param source_id: ID de la source qui donne la donnée.
         :param folder: Dossier où stocker le fichier si nécessaire (pour les données en fichier).
+        :param write_behind: Si True, un générateur stocké en fichier est écrit par un thread dédié pendant que le
+                             générateur est parcouru. La méthode retourne alors un concurrent.futures.Future terminé
+                             lorsque le fichier est durable et la donnée déverrouillée.
         """
-        # Vérifier que la donnée existe dans le registre
-        data_row = self.data_registry[self.data_registry['data_id'] == data_id]
-        if data_row.empty:
-            raise ValueError(f"Data {data_id} not found in registry")
-
-        # Vérifier que la source est bien celle qui a enregistré la donnée
-        source_row = self.source_to_data[self.source_to_data['data_id'] == data_id]
-        # print(f"Source row: {source_row} for data ID: {data_id}, write attempt by source: {source_id}")
-        if source_row.empty or source_row['source_id'].values[0] != source_id:
-            raise PermissionError(f"Source {source_id} is not authorized to store data for {data_id}")
-
-        # Vérifier que la donnée est verrouillée avant de la stocker
-        if not source_row['locked'].values[0]:
-            raise PermissionError(f"Data {data_id} is not locked and cannot be stored")
+        with self._registry_lock:
+            # Vérifier que la donnée existe dans le registre
+            data_row = self.data_registry.get(data_id)
+            if data_row is None:
+                raise ValueError(f"Data {data_id} not found in registry")
+
+            # Vérifier que la source est bien celle qui a enregistré la donnée
+            source_row = self.source_to_data.get(data_id)
+            if source_row is None or source_row['source_id'] != source_id:
+                raise PermissionError(f"Source {source_id} is not authorized to store data for {data_id}")
+
+            # Vérifier que la donnée est verrouillée (phase d'écriture) par l'appelant avant de la stocker
+            holder = self._lock_owners.get(data_id)
+            if holder is None:
+                raise PermissionError(f"Data {data_id} is not locked and cannot be stored")
+            if holder is not _WRITE_PHASE and holder != self._lock_owner(None):
+                raise PermissionError(f"Data {data_id} is locked by another owner and cannot be stored")
 
         # Récupérer l'objet Data correspondant à cette donnée
-        data_obj = data_row['data_object'].values[0]
+        data_obj = data_row['data_object']
 
         # Vérifier les définitions requises
         self._check_signal_data_definitions(data_obj)
@@ -257,6 +627,9 @@ class DataPool:
                 raise ValueError("Folder must be specified for file-based storage")
             if isinstance(data_source, (list, np.ndarray)):
                 data_obj.store_data_from_object(data_source, folder=folder)
+            elif write_behind:
+                writing = data_obj.store_data_from_data_generator(data_source, folder=folder, write_behind=True)
+                return self._unlock_when_written(data_id, writing, holder)
             else:
                 data_obj.store_data_from_data_generator(data_source, folder=folder)
         else:
@@ -264,162 +637,392 @@ class DataPool:
                 data_obj.store_data_from_object(data_source)
             else:
                 data_obj.store_data_from_data_generator(data_source)
-
-        # Mise à jour de l'objet dans le registre
-        self.data_registry.loc[self.data_registry['data_id'] == data_id, 'data_object'] = data_obj
+            if data_row['storage_type'] == 'shm':
+                # Copier les données dans un segment de mémoire partagée
+                data_obj.move_to_shared_memory()
 
         # Déverrouiller la donnée après le stockage
-        self.unlock_data(data_id)
+        self.unlock_data(data_id, owner=holder)
+        self._account_ram(data_id)
+        if write_behind:
+            # Stockage synchrone : le handle est déjà terminé
+            handle = Future()
+            handle.set_result(data_obj.num_samples)
+            return handle
+
+    def _unlock_when_written(self, data_id, writing, owner):
+        """
+        Retourne un Future terminé après la fin de l'écriture en arrière-plan et le déverrouillage de la donnée.
+        En cas d'erreur d'écriture, la donnée reste verrouillée (comme pour un stockage synchrone) et l'erreur
+        est transmise au Future.
+        """
+        handle = Future()
+
+        def on_written(future):
+            error = future.exception()
+            if error is not None:
+                handle.set_exception(error)
+                return
+            try:
+                self.unlock_data(data_id, owner=owner)
+            except Exception as e:
+                handle.set_exception(e)
+            else:
+                handle.set_result(future.result())
+
+        writing.add_done_callback(on_written)
+        return handle
 
     def delete_data(self, data_id):
         """Supprime la donnée si elle n'est pas protégée et que tous les acquittements sont reçus."""
-        # Vérifier la protection dans source_to_data
-        source_row = self.source_to_data[self.source_to_data['data_id'] == data_id]
-        if not source_row.empty and not source_row['protected'].values[0]:
-            # Récupérer l'objet Data avant de supprimer la ligne du registre
-            data_row = self.data_registry[self.data_registry['data_id'] == data_id]
-
-            if not data_row.empty:
-                data_obj = data_row['data_object'].values[0]  # Récupérer l'objet Data
-
-                # Supprimer la relation source-to-data
-                self.source_to_data = self.source_to_data[self.source_to_data['data_id'] != data_id]
-
-                # Supprimer la relation subscriber-to-data
-                self.subscriber_to_data = self.subscriber_to_data[self.subscriber_to_data['data_id'] != data_id]
-
-                # Supprimer la ligne du DataFrame principal après récupération de l'objet
-                self.data_registry = self.data_registry[self.data_registry['data_id'] != data_id]
+        with self._registry_lock:
+            # Vérifier la protection dans source_to_data
+            source_row = self.source_to_data.get(data_id)
+            if source_row is None or source_row['protected'] or data_id not in self.data_registry:
+                return
+            # Supprimer les relations source-to-data et subscriber-to-data puis la ligne du registre
+            data_row, source_row, item_lock = self._unregister(data_id)
+
+        # Attendre la fin des lectures en cours avant de supprimer le contenu
+        write_locked = self._wait_for_readers(source_row, item_lock)
+        try:
+            data_obj = data_row['data_object']  # Récupérer l'objet Data
 
-                # Appeler la méthode de suppression de l'objet Data
-                if data_obj is not None:
-                    data_obj.delete_data()  # Suppression des données (RAM ou fichier)
+            # Appeler la méthode de suppression de l'objet Data
+            if data_obj is not None:
+                data_obj.delete_data()  # Suppression des données (RAM ou fichier)
 
-                # Supprimer l'objet Data explicitement
-                del data_obj
+            # Supprimer l'objet Data explicitement
+            del data_obj
+        finally:
+            if write_locked:
+                item_lock.release_write()
 
     def get_data_info(self, data_id):
-        """Retourne les informations de la donnée via son ID, si elle n'est pas verrouillée."""
-        # Vérifier si la donnée est verrouillée
-        is_locked = self.source_to_data.loc[self.source_to_data['data_id'] == data_id, 'locked'].values[0]
-
-        if is_locked:
-            raise PermissionError(f"Data {data_id} is locked and cannot be read.")
+        """Retourne les informations de la donnée via son ID (ligne du registre), si elle n'est pas verrouillée."""
+        with self._registry_lock:
+            # Vérifier si la donnée est verrouillée
+            if self.source_to_data.get_value(data_id, 'locked'):
+                raise PermissionError(f"Data {data_id} is locked and cannot be read.")
 
-        # Si la donnée n'est pas verrouillée, renvoyer ses informations
-        return self.data_registry.loc[self.data_registry['data_id'] == data_id]
+            # Si la donnée n'est pas verrouillée, renvoyer ses informations
+            return self.data_registry[data_id]
 
-    def get_data_object(self, data_id, subscriber_id):
-        """Retourne l'objet Data correspondant à l'ID de la donnée."""
-        # Vérifier si la donnée est verrouillée
-        is_locked = self.source_to_data.loc[self.source_to_data['data_id'] == data_id, 'locked'].values[0]
-        if is_locked:
-            raise PermissionError(f"Data {data_id} is locked and cannot be read.")
-
-        # Vérifier si le subscriber est autorisé à lire la donnée
-        if subscriber_id not in self.subscriber_to_data.loc[
-            self.subscriber_to_data['data_id'] == data_id, 'subscriber_id'].values:
-            raise PermissionError(f"Subscriber {subscriber_id} is not authorized to read data {data_id}")
+    def get_data_object(self, data_id, subscriber_id, blocking=False, timeout=None):
+        """
+        Retourne l'objet Data correspondant à l'ID de la donnée.
 
-        # Récupérer l'objet Data correspondant
-        data_obj = self.data_registry.loc[self.data_registry['data_id'] == data_id, 'data_object'].values[0]
-        return data_obj
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
+        """
+        self._promote_if_spilled(data_id)
+        data_row, item_lock = self._acquire_read(data_id, subscriber_id, blocking, timeout)
+        item_lock.release_read()
+        return data_row['data_object']
 
-    def get_data(self, data_id, subscriber_id):
+    def get_data(self, data_id, subscriber_id, blocking=False, timeout=None):
         """
         Permet à un subscriber de lire les données complètes.
         Prend en compte le verrouillage de la donnée et gère l'acquittement après lecture.
 
         :param data_id: L'ID de la donnée à lire.
         :param subscriber_id: L'ID du subscriber qui lit les données.
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
         :return: Les données complètes si disponibles.
         """
-        data = None
-        # Vérifier si la donnée est verrouillée
-        is_locked = self.source_to_data.loc[self.source_to_data['data_id'] == data_id, 'locked'].values[0]
-        if is_locked:
-            raise PermissionError(f"Data {data_id} is locked and cannot be read.")
-        #verifier si le subscriber est autorisé à lire la donnée
-        if subscriber_id not in self.subscriber_to_data.loc[
-            self.subscriber_to_data['data_id'] == data_id, 'subscriber_id'].values:
-            raise PermissionError(f"Subscriber {subscriber_id} is not authorized to read data {data_id}")
-        #vérifier si la donnée est sous forme de fichier
-        data_obj = self.data_registry.loc[self.data_registry['data_id'] == data_id, 'data_object'].values[0]
-        print(f"Data object for {data_id}: {data_obj}")
-        if data_obj is None:
-            raise ValueError(f"Data {data_id} has not been stored yet.")
-        data = data_obj.read_data()  #la méthode read_data() de la classe Data gère le cas de fichier ou de RAM
+        self._promote_if_spilled(data_id)
+        data_row, item_lock = self._acquire_read(data_id, subscriber_id, blocking, timeout)
+        try:
+            data_obj = data_row['data_object']
+            if data_obj is None:
+                raise ValueError(f"Data {data_id} has not been stored yet.")
+            data = data_obj.read_data()  #la méthode read_data() de la classe Data gère le cas de fichier ou de RAM
+        finally:
+            item_lock.release_read()
 
         # Acquitter la donnée après la lecture
         # self.acknowledge_data(data_id, subscriber_id)
 
         return data
 
-    def get_chunk_generator(self, data_id, chunk_size=1024, subscriber_id=None):
+    def get_shared_descriptor(self, data_id, subscriber_id, blocking=False, timeout=None):
+        """
+        Retourne le descripteur (picklable) d'une donnée stockée en mémoire partagée, à transmettre à un autre
+        processus qui l'attache sans copie (descriptor.attach()). Le segment reste valide jusqu'à la libération
+        de la donnée : le subscriber acquitte (acknowledge_data) lorsque ses processus ont fini de l'utiliser.
+
+        :param data_id: L'ID de la donnée.
+        :param subscriber_id: L'ID du subscriber qui lit les données.
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
+        :return: SharedArrayDescriptor de la donnée.
+        """
+        data_row, item_lock = self._acquire_read(data_id, subscriber_id, blocking, timeout)
+        try:
+            if data_row['storage_type'] != 'shm':
+                raise ValueError(f"Data {data_id} is not stored in shared memory.")
+            return data_row['data_object'].shared_descriptor()
+        finally:
+            item_lock.release_read()
+
+    def get_chunk_generator(self, data_id, chunk_size=1024, subscriber_id=None, blocking=False, timeout=None,
+                            prefetch=0):
         """
         Retourne un générateur de données chunk par chunk (sans chevauchement).
+        La donnée reste verrouillée en lecture pendant le parcours.
         L'acquittement est effectué lorsque tous les chunks ont été traités.
 
         :param data_id: L'ID unique de la donnée dans le DataPool.
         :param chunk_size: La taille de chaque chunk.
         :param subscriber_id: L'ID du subscriber effectuant la lecture (pour l'acquittement).
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
+        :param prefetch: Si > 0, un thread en arrière-plan lit jusqu'à prefetch chunks d'avance.
         :yield: Chaque chunk sans chevauchement.
         """
-        # Vérifier si la donnée existe et est verrouillée
-        source_row = self.source_to_data[self.source_to_data['data_id'] == data_id]
-        if source_row.empty:
-            raise ValueError(f"Data with ID {data_id} not found in source_to_data.")
-
-        if source_row['locked'].values[0]:
-            raise PermissionError(f"Data {data_id} is locked and cannot be read.")
-
-        # Vérifier si le subscriber est autorisé à lire la donnée
-        if subscriber_id not in self.subscriber_to_data.loc[
-            self.subscriber_to_data['data_id'] == data_id, 'subscriber_id'].values:
-            raise PermissionError(f"Subscriber {subscriber_id} is not authorized to read data {data_id}")
-
-        # Récupérer l'objet Data à partir de data_registry
-        data_obj = self.data_registry.loc[self.data_registry['data_id'] == data_id, 'data_object'].values[0]
-        if not data_obj:
-            raise ValueError(f"Data object for {data_id} not found or has been deleted.")
-
-        # Lire les données via la méthode de la classe Data (chunk par chunk sans chevauchement)
-        chunked_data = data_obj.read_chunked_data(chunk_size=chunk_size)
-
-        # Fournir les chunks au subscriber un par un
-        for chunk in chunked_data:
-            yield chunk
+        # Vérifier si la donnée existe, si le subscriber est autorisé à la lire et verrouiller en lecture
+        data_row, item_lock = self._acquire_read(data_id, subscriber_id, blocking, timeout)
+        try:
+            data_obj = data_row['data_object']
+            if not data_obj:
+                raise ValueError(f"Data object for {data_id} not found or has been deleted.")
+
+            # Lire les données via la méthode de la classe Data (chunk par chunk sans chevauchement)
+            chunked_data = data_obj.read_chunked_data(chunk_size=chunk_size)
+            if prefetch:
+                chunked_data = prefetch_chunks(chunked_data, prefetch)
+
+            # Fournir les chunks au subscriber un par un ; en cas d'arrêt anticipé, le thread de préchargement et
+            # le lecteur sont fermés avant de libérer le verrou de lecture
+            try:
+                for chunk in chunked_data:
+                    yield chunk
+            finally:
+                chunked_data.close()
+        finally:
+            item_lock.release_read()
 
         # Lorsque tous les chunks ont été traités, envoyer l'acquittement
         if subscriber_id is not None:
             self.acknowledge_data(data_id, subscriber_id)
 
-    def get_data_chunk(self, data_id, chunk_index, chunk_size=1024):
+    def get_data_chunk(self, data_id, chunk_index, chunk_size=1024, blocking=False, timeout=None):
         """
         Récupère un chunk spécifique des données depuis un fichier ou la RAM.
         :param data_id: L'ID unique de la donnée dans le DataPool.
         :param chunk_index: Index du chunk à récupérer.
         :param chunk_size: Taille du chunk (en nombre de samples).
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
         :return: Le chunk de données.
         """
-        # Vérifier si la donnée existe dans le registre
-        data_row = self.data_registry[self.data_registry['data_id'] == data_id]
-        if data_row.empty:
-            raise ValueError(f"Data {data_id} not found in registry")
+        # Vérifier si la donnée existe dans le registre et la verrouiller en lecture
+        data_row, item_lock = self._acquire_read(data_id, None, blocking, timeout, check_subscriber=False)
+        try:
+            # Récupérer l'objet Data correspondant
+            data_obj = data_row['data_object']
+
+            if data_row['storage_type'] == 'file':
+                # Si la donnée est stockée dans un fichier, utiliser la méthode read_specific_chunk
+                return data_obj.read_specific_chunk(chunk_index, chunk_size)
+            elif isinstance(data_obj, ChunkableMixin):
+                # Signal en RAM : accès direct à la plage (déquantifiée si nécessaire)
+                start_idx = chunk_index * chunk_size
+                return data_obj.read_range(start_idx, start_idx + chunk_size)
+            else:
+                # Si la donnée est en RAM, extraire simplement le segment correspondant
+                start_idx = chunk_index * chunk_size
+                end_idx = min(start_idx + chunk_size, len(data_obj.data))
+                return data_obj.data[start_idx:end_idx]
+        finally:
+            item_lock.release_read()
+
+    def get_time_range(self, data_id, t0, t1, with_axis=False, blocking=False, timeout=None):
+        """
+        Récupère les samples d'un signal temporel compris entre t0 et t1 (bornes incluses) par accès direct.
+        :param data_id: L'ID unique de la donnée dans le DataPool.
+        :param t0: Temps de début (s).
+        :param t1: Temps de fin (s).
+        :param with_axis: Si True, retourne le tuple (axe temporel de la plage, samples).
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
+        :return: Les samples de la plage.
+        """
+        data_row, item_lock = self._acquire_read(data_id, None, blocking, timeout, check_subscriber=False)
+        try:
+            data_obj = data_row['data_object']
+            if not isinstance(data_obj, TemporalSignalData):
+                raise ValueError(f"Data {data_id} is not a temporal signal.")
+            return data_obj.read_time_range(t0, t1, with_axis)
+        finally:
+            item_lock.release_read()
+
+    def get_envelope(self, data_id, t0, t1, n_points, blocking=False, timeout=None):
+        """
+        Récupère un résumé min/max/moyenne de taille fixe d'un signal temporel entre t0 et t1 (voir read_envelope).
+        :param data_id: L'ID unique de la donnée dans le DataPool.
+        :param t0: Temps de début (s).
+        :param t1: Temps de fin (s).
+        :param n_points: Nombre de points du résumé.
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
+        :return: Tuple (temps de début de chaque point, minimums, maximums, moyennes).
+        """
+        data_row, item_lock = self._acquire_read(data_id, None, blocking, timeout, check_subscriber=False)
+        try:
+            data_obj = data_row['data_object']
+            if not isinstance(data_obj, TemporalSignalData):
+                raise ValueError(f"Data {data_id} is not a temporal signal.")
+            return data_obj.read_envelope(t0, t1, n_points)
+        finally:
+            item_lock.release_read()
+
+    def find_blocks(self, data_id, predicate, blocking=False, timeout=None):
+        """
+        Recherche les blocs d'un signal satisfaisant predicate à partir de son index des statistiques par bloc,
+        sans lire les données (voir ChunkableMixin.find_blocks).
+        :param data_id: L'ID unique de la donnée dans le DataPool.
+        :param predicate: Fonction recevant le BlockStats et retournant un masque booléen (un élément par bloc).
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
+        :return: Tuple (indices des blocs, BlockStats) : block_range(index) donne la plage de samples d'un bloc.
+        """
+        data_row, item_lock = self._acquire_read(data_id, None, blocking, timeout, check_subscriber=False)
+        try:
+            data_obj = self._chunkable_signal(data_id, data_row)
+            return data_obj.find_blocks(predicate), data_obj.block_statistics()
+        finally:
+            item_lock.release_read()
 
-        # Récupérer l'objet Data correspondant
-        data_obj = data_row['data_object'].values[0]
+    def get_global_stats(self, data_id, blocking=False, timeout=None):
+        """
+        Retourne les statistiques globales d'un signal (count, min, max, sum, sumsq, mean, rms, std) à partir de
+        son index des statistiques par bloc.
+        :param data_id: L'ID unique de la donnée dans le DataPool.
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
+        """
+        data_row, item_lock = self._acquire_read(data_id, None, blocking, timeout, check_subscriber=False)
+        try:
+            return self._chunkable_signal(data_id, data_row).global_stats()
+        finally:
+            item_lock.release_read()
 
-        if data_row['storage_type'].values[0] == 'file':
-            # Si la donnée est stockée dans un fichier, utiliser la méthode read_specific_chunk
-            return data_obj.read_specific_chunk(chunk_index, chunk_size)
-        else:
-            # Si la donnée est en RAM, extraire simplement le segment correspondant
-            start_idx = chunk_index * chunk_size
-            end_idx = min(start_idx + chunk_size, len(data_obj.data))
-            return data_obj.data[start_idx:end_idx]
+    @staticmethod
+    def _chunkable_signal(data_id, data_row):
+        """Retourne l'objet Data d'un signal numérique découpable (ValueError sinon)."""
+        data_obj = data_row['data_object']
+        if not isinstance(data_obj, ChunkableMixin) or data_obj.sample_type == 'str':
+            raise ValueError(f"Data {data_id} is not a numeric chunkable signal.")
+        return data_obj
 
-    def get_overlapped_chunk_generator(self, data_id, chunk_size=1024, overlap=50, subscriber_id=None):
+    def get_freq_band(self, data_id, f0, f1, with_axis=False, blocking=False, timeout=None):
+        """
+        Récupère les samples d'un signal fréquentiel compris entre f0 et f1 (bornes incluses) par accès direct.
+        :param data_id: L'ID unique de la donnée dans le DataPool.
+        :param f0: Fréquence de début (Hz).
+        :param f1: Fréquence de fin (Hz).
+        :param with_axis: Si True, retourne le tuple (axe fréquentiel de la bande, samples).
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
+        :return: Les samples de la bande.
+        """
+        data_row, item_lock = self._acquire_read(data_id, None, blocking, timeout, check_subscriber=False)
+        try:
+            data_obj = data_row['data_object']
+            if not isinstance(data_obj, FreqSignalData):
+                raise ValueError(f"Data {data_id} is not a frequency signal.")
+            return data_obj.read_freq_band(f0, f1, with_axis)
+        finally:
+            item_lock.release_read()
+
+    def check_freq_limit(self, limit_id, signal_id, blocking=False, timeout=None):
+        """
+        Vérifie un signal fréquentiel par rapport à une limite fréquentielle (voir FreqLimitsData.check_spectrum).
+        :param limit_id: L'ID de la limite (FreqLimitsData) dans le DataPool.
+        :param signal_id: L'ID du signal fréquentiel (FreqSignalData) dans le DataPool.
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
+        :return: Dictionnaire des marges et des bins en dépassement.
+        """
+        limit_row, limit_lock = self._acquire_read(limit_id, None, blocking, timeout, check_subscriber=False)
+        try:
+            limit_obj = limit_row['data_object']
+            if not isinstance(limit_obj, FreqLimitsData):
+                raise ValueError(f"Data {limit_id} is not a frequency limit.")
+            signal_row, signal_lock = self._acquire_read(signal_id, None, blocking, timeout, check_subscriber=False)
+            try:
+                return limit_obj.check_spectrum(signal_row['data_object'])
+            finally:
+                signal_lock.release_read()
+        finally:
+            limit_lock.release_read()
+
+    def check_ffts_limit(self, ffts_id, limit_id, batch_size=DEFAULT_FRAME_BATCH, workers=None, blocking=False,
+                         timeout=None):
+        """
+        Vérifie chaque spectre d'un FFTSData par rapport à une limite fréquentielle (voir FFTSData.check_limit).
+        Le FFTSData, la limite et tous les spectres restent verrouillés en lecture pendant la vérification.
+        :param ffts_id: L'ID du FFTSData dans le DataPool.
+        :param limit_id: L'ID de la limite (FreqLimitsData) dans le DataPool.
+        :param batch_size: Nombre de spectres comparés ensemble.
+        :param workers: Nombre de threads (nombre de CPU par défaut).
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
+        :return: ComplianceResult (table : frame, timestamp, worst_margin, worst_frequency, violations).
+        """
+        locks = []
+        try:
+            ffts_row, item_lock = self._acquire_read(ffts_id, None, blocking, timeout, check_subscriber=False)
+            locks.append(item_lock)
+            limit_row, item_lock = self._acquire_read(limit_id, None, blocking, timeout, check_subscriber=False)
+            locks.append(item_lock)
+            ffts_obj, limit_obj = ffts_row['data_object'], limit_row['data_object']
+            if not isinstance(ffts_obj, FFTSData):
+                raise ValueError(f"Data {ffts_id} is not an FFTS data.")
+            if not isinstance(limit_obj, FreqLimitsData):
+                raise ValueError(f"Data {limit_id} is not a frequency limit.")
+            frames = []
+            for frame_id in ffts_obj.fft_ids:
+                frame_row, item_lock = self._acquire_read(frame_id, None, blocking, timeout, check_subscriber=False)
+                locks.append(item_lock)
+                frames.append(frame_row['data_object'])
+            return check_frames(limit_obj, frames, ffts_obj.fmin, ffts_obj.df, batch_size, workers)
+        finally:
+            for item_lock in reversed(locks):
+                item_lock.release_read()
+
+    def check_temp_limit(self, signal_id, limit_id, chunk_size=DEFAULT_EVALUATION_CHUNK, blocking=False,
+                         timeout=None):
+        """
+        Évalue un signal temporel par rapport à une limite temporelle, chunk par chunk (voir
+        TemporalSignalData.check_limit). Le signal et la limite restent verrouillés en lecture pendant l'évaluation.
+        :param signal_id: L'ID du signal temporel (TemporalSignalData) dans le DataPool.
+        :param limit_id: L'ID de la limite (TempLimitsData) dans le DataPool.
+        :param chunk_size: Nombre de samples évalués par chunk.
+        :param blocking: Si True, attend la fin de l'écriture au lieu de lever PermissionError.
+        :param timeout: Durée maximale d'attente en secondes si blocking est True (TimeoutError au-delà).
+        :return: ViolationIntervals (une ligne par intervalle de dépassement).
+        """
+        limit_row, limit_lock = self._acquire_read(limit_id, None, blocking, timeout, check_subscriber=False)
+        try:
+            limit_obj = limit_row['data_object']
+            if not isinstance(limit_obj, TempLimitsData):
+                raise ValueError(f"Data {limit_id} is not a temporal limit.")
+            signal_row, signal_lock = self._acquire_read(signal_id, None, blocking, timeout, check_subscriber=False)
+            try:
+                signal_obj = signal_row['data_object']
+                if not isinstance(signal_obj, TemporalSignalData):
+                    raise ValueError(f"Data {signal_id} is not a temporal signal.")
+                return signal_obj.check_limit(limit_obj, chunk_size)
+            finally:
+                signal_lock.release_read()
+        finally:
+            limit_lock.release_read()
+
+    def get_overlapped_chunk_generator(self, data_id, chunk_size=1024, overlap=50, subscriber_id=None,
+                                       batch_size=None, prefetch=0):
         """
         Retourne un générateur de données chunk par chunk avec chevauchement.
         L'acquittement est effectué lorsque tous les chunks ont été traités.
@@ -428,22 +1031,107 @@ class DataPool:
         :param chunk_size: La taille de chaque chunk.
         :param overlap: Le pourcentage de chevauchement entre les chunks.
         :param subscriber_id: L'ID du subscriber effectuant la lecture (pour l'acquittement).
+        :param batch_size: Si fourni, produit des tableaux 2-D (n_fenêtres, chunk_size) de fenêtres complètes.
+        :param prefetch: Si > 0, un thread en arrière-plan lit jusqu'à prefetch chunks d'avance.
         :yield: Chaque chunk avec chevauchement.
         """
-        # Vérifier si la donnée est verrouillée
-        source_row = self.source_to_data[self.source_to_data['data_id'] == data_id]
-        if source_row['locked'].values[0]:
-            raise ValueError(f"Data with ID {data_id} is locked and cannot be read.")
-
-        # Récupérer l'objet Data à partir de data_registry
-        data_obj = self.data_registry.loc[self.data_registry['data_id'] == data_id, 'data_object'].values[0]
+        # Vérifier si la donnée est verrouillée et la verrouiller en lecture
+        data_row, item_lock = self._acquire_read(data_id, subscriber_id, check_subscriber=False)
+        try:
+            # Récupérer l'objet Data à partir de data_registry
+            data_obj = data_row['data_object']
+
+            # Lire les données avec chevauchement via la méthode de la classe Data
+            chunked_data = data_obj.read_overlapped_chunked_data(chunk_size=chunk_size, overlap=overlap,
+                                                                 batch_size=batch_size)
+            if prefetch:
+                chunked_data = prefetch_chunks(chunked_data, prefetch)
+
+            # Fournir les chunks au subscriber un par un ; en cas d'arrêt anticipé, le thread de préchargement et
+            # le lecteur sont fermés avant de libérer le verrou de lecture
+            try:
+                for chunk in chunked_data:
+                    yield chunk
+            finally:
+                chunked_data.close()
+        finally:
+            item_lock.release_read()
 
-        # Lire les données avec chevauchement via la méthode de la classe Data
-        chunked_data = data_obj.read_overlapped_chunked_data(chunk_size=chunk_size, overlap=overlap)
+        # Lorsque tous les chunks ont été traités, envoyer l'acquittement
+        if subscriber_id is not None:
+            self.acknowledge_data(data_id, subscriber_id)
 
-        # Fournir les chunks au subscriber un par un
-        for chunk in chunked_data:
-            yield chunk
+    def map_chunks(self, data_id, fn, chunk_size=1024, workers=None, executor='thread', overlap=0,
+                   subscriber_id=None, output_id=None, output_source_id=None, folder=None):
+        """
+        Applique fn à chaque chunk d'un signal en parallèle et fournit les résultats dans l'ordre des chunks.
+        Chaque worker lit son chunk indépendamment par accès direct à sa position (read_range) ; en mode
+        'process', les données en fichier sont lues par les processus eux-mêmes et les données en mémoire partagée
+        y sont attachées sans copie (les autres données en RAM sont transmises par copie).
+        La donnée reste verrouillée en lecture pendant le traitement et est acquittée à la fin si subscriber_id
+        est fourni.
+
+        :param data_id: L'ID de la donnée à traiter.
+        :param fn: Fonction appliquée à chaque chunk (picklable en mode 'process').
+        :param chunk_size: Taille de chaque chunk en samples.
+        :param workers: Nombre de workers (défaut de concurrent.futures si None).
+        :param executor: 'thread', 'process' ou un concurrent.futures.Executor existant (non arrêté à la fin).
+        :param overlap: Pourcentage de chevauchement entre les chunks (0 <= overlap < 100).
+        :param subscriber_id: L'ID du subscriber effectuant la lecture (pour l'acquittement).
+        :param output_id: ID d'une donnée déjà enregistrée (register_data) dans laquelle stocker les résultats.
+        :param output_source_id: ID de la source de la donnée output_id.
+        :param folder: Dossier de stockage si la donnée output_id est en fichier.
+        :return: Générateur des résultats ; output_id si les résultats sont stockés.
+        """
+        if executor not in ('thread', 'process') and not isinstance(executor, Executor):
+            raise ValueError(f"Unsupported executor {executor!r}: expected 'thread', 'process' or an Executor.")
+        results = self._map_chunks(data_id, fn, chunk_size, workers, executor, overlap, subscriber_id)
+        if output_id is None:
+            return results
+        self.store_data(output_id, results, output_source_id, folder=folder)
+        return output_id
+
+    def _map_chunks(self, data_id, fn, chunk_size, workers, executor, overlap, subscriber_id):
+        data_row, item_lock = self._acquire_read(data_id, subscriber_id, check_subscriber=subscriber_id is not None)
+        try:
+            data_obj = self._chunkable_signal(data_id, data_row)
+            hop = data_obj._overlap_hop(chunk_size, overlap)
+            num_samples = data_obj.num_samples or 0
+            starts = data_obj.window_starts(num_samples, chunk_size, hop)
+            use_processes = executor == 'process' or isinstance(executor, ProcessPoolExecutor)
+
+            def tasks():
+                for start in starts:
+                    stop = min(start + chunk_size, num_samples)
+                    if not use_processes:
+                        # Threads : lecture directe dans le worker
+                        yield _map_range, fn, data_obj, start, stop
+                    elif data_row['storage_type'] == 'file' and data_obj._is_encoded():
+                        yield _map_opened_range, fn, data_obj.file_path, start, stop
+                    elif data_row['storage_type'] == 'file':
+                        yield _map_file_range, fn, data_obj.file_path, data_obj.dtype.str, \
+                            data_obj._file_offset(start), stop - start
+                    elif data_row['storage_type'] == 'shm':
+                        yield _map_shared_range, fn, data_obj.shared_descriptor(), start, stop
+                    else:
+                        # Données en RAM : le chunk est transmis par copie au processus
+                        yield fn, data_obj.read_range(start, stop)
+
+            if isinstance(executor, Executor):
+                pool_executor, owned = executor, False
+            elif executor == 'process':
+                pool_executor, owned = ProcessPoolExecutor(max_workers=workers), True
+            else:
+                pool_executor, owned = ThreadPoolExecutor(max_workers=workers), True
+            try:
+                # Au plus deux chunks en attente par worker : mémoire bornée, résultats dans l'ordre
+                max_pending = 2 * (workers or getattr(pool_executor, '_max_workers', None) or os.cpu_count() or 1)
+                yield from ordered_map(pool_executor, tasks(), max_pending)
+            finally:
+                if owned:
+                    pool_executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            item_lock.release_read()
 
         # Lorsque tous les chunks ont été traités, envoyer l'acquittement
         if subscriber_id is not None:
@@ -455,25 +1143,30 @@ class DataPool:
 
         :param data_id: L'ID unique de la donnée dans le DataPool.
         """
-        # locker la donnée pour éviter les accès concurrents
+        # locker la donnée pour éviter les accès concurrents (attend la fin des lectures en cours)
         self.lock_data(data_id)
-        # Récupérer l'objet Data à partir du data_registry
-        data_row = self.data_registry[self.data_registry['data_id'] == data_id].iloc[0]
-        data_obj = data_row['data_object']
+        try:
+            # Récupérer l'objet Data à partir du data_registry
+            data_row = self.data_registry[data_id]
+            data_obj = data_row['data_object']
 
-        if data_obj.in_file and data_obj.file_path:
-            print(f"Conversion des données de fichier vers RAM pour {data_id}...")
+            if data_obj.in_file and data_obj.file_path:
+                print(f"Conversion des données de fichier vers RAM pour {data_id}...")
 
-            # Si les données sont dans un fichier, les lire en une seule fois
-            data_obj.convert_file_to_ram()
+                # Si les données sont dans un fichier, les lire en une seule fois
+                data_obj.convert_file_to_ram()
 
-            # Mise à jour du type de stockage
-            self.data_registry.loc[self.data_registry['data_id'] == data_id, 'storage_type'] = 'ram'
-            print(f"Les données {data_id} sont maintenant en RAM.")
-        else:
-            print(f"Les données {data_id} sont déjà en RAM ou le fichier est manquant.")
-        #unlocker la donnée après la conversion
-        self.unlock_data(data_id)
+                # Mise à jour du type de stockage
+                data_row['storage_type'] = 'ram'
+                with self._registry_lock:
+                    self._spilled.discard(data_id)
+                print(f"Les données {data_id} sont maintenant en RAM.")
+            else:
+                print(f"Les données {data_id} sont déjà en RAM ou le fichier est manquant.")
+        finally:
+            #unlocker la donnée après la conversion
+            self.unlock_data(data_id)
+        self._account_ram(data_id)
 
     def convert_data_to_file(self, data_id, folder=None):
         """
@@ -483,40 +1176,233 @@ class DataPool:
         :param folder: Le dossier où stocker le fichier de données.
         """
         # Récupérer l'objet Data à partir du data_registry
-        # locker la donnée pour éviter les accès concurrents
+        # locker la donnée pour éviter les accès concurrents (attend la fin des lectures en cours)
         self.lock_data(data_id)
-        data_row = self.data_registry[self.data_registry['data_id'] == data_id].iloc[0]
-        data_obj = data_row['data_object']
+        try:
+            data_row = self.data_registry[data_id]
+            data_obj = data_row['data_object']
+
+            if not data_obj.in_file:
+                print(f"Conversion des données de RAM vers fichier pour {data_id}...")
+
+                # Si les données sont en RAM, les convertir en fichier directement
+                if folder is None:
+                    raise ValueError("Le dossier où stocker les fichiers doit être spécifié.")
+                data_obj.convert_ram_to_file(folder)
+
+                # Mise à jour du type de stockage
+                data_row['storage_type'] = 'file'
+                with self._registry_lock:
+                    self._forget_ram(data_id)
+                print(f"Les données {data_id} sont maintenant stockées dans un fichier.")
+            else:
+                print(f"Les données {data_id} sont déjà dans un fichier.")
+        finally:
+            #unlocker la donnée après la conversion
+            self.unlock_data(data_id)
 
-        if not data_obj.in_file:
-            print(f"Conversion des données de RAM vers fichier pour {data_id}...")
+    def _forget_ram(self, data_id):
+        """Retire la donnée du suivi de l'occupation RAM (à appeler sous le verrou des registres)."""
+        self._ram_bytes -= self._ram_usage.pop(data_id, 0)
 
-            # Si les données sont en RAM, les convertir en fichier directement
-            if folder is None:
-                raise ValueError("Le dossier où stocker les fichiers doit être spécifié.")
-            data_obj.convert_ram_to_file(folder)
+    def _account_ram(self, data_id):
+        """
+        Enregistre l'occupation RAM réelle d'une donnée résidente en RAM comme la plus récemment utilisée,
+        puis fait respecter le budget RAM. Sans effet si le DataPool n'a pas de budget RAM.
+        """
+        if self.max_ram_bytes is None:
+            return
+        with self._registry_lock:
+            data_row = self.data_registry.get(data_id)
+            if data_row is None:
+                return
+            self._forget_ram(data_id)
+            data_obj = data_row['data_object']
+            if data_obj is not None and not data_obj.in_file:
+                footprint = data_obj.ram_footprint()
+                self._ram_usage[data_id] = footprint
+                self._ram_bytes += footprint
+        self._enforce_ram_budget()
+
+    @staticmethod
+    def _is_spillable(data_obj):
+        """Seuls les signaux numériques convertibles RAM <-> fichier peuvent être déplacés par le DataPool."""
+        return isinstance(data_obj, FileRamMixin) and data_obj.sample_type != 'str'
+
+    def _next_spill_candidate(self, exclude=None):
+        """
+        Retourne la donnée la moins récemment utilisée pouvant être déplacée en fichier (non protégée, non
+        verrouillée, sans lecture en cours), verrouillée en écriture, ou None (à appeler sous le verrou des registres).
+        :return: Tuple (data_id, ligne du registre de données, verrou de la donnée) ou None.
+        """
+        for data_id in self._ram_usage:
+            if data_id == exclude:
+                continue
+            source_row = self.source_to_data.get(data_id)
+            data_row = self.data_registry.get(data_id)
+            if source_row['protected'] or source_row['locked'] or data_row['storage_type'] != 'ram' \
+                    or not self._is_spillable(data_row['data_object']):
+                continue
+            item_lock = self._item_lock(data_id)
+            if item_lock.acquire_write(blocking=False):
+                self._maintenance.add(data_id)
+                return data_id, data_row, item_lock
+        return None
+
+    def _enforce_ram_budget(self, exclude=None):
+        """Déplace en fichier les données les moins récemment utilisées tant que le budget RAM est dépassé."""
+        while True:
+            with self._registry_lock:
+                if self._ram_bytes <= self.max_ram_bytes:
+                    return
+                candidate = self._next_spill_candidate(exclude)
+            if candidate is None:
+                # Aucune donnée déplaçable : le budget reste dépassé jusqu'à la prochaine libération
+                return
+            self._spill(*candidate)
+
+    def _spill(self, data_id, data_row, item_lock):
+        """Déplace une donnée en fichier (le verrou en écriture de la donnée est détenu par l'appelant)."""
+        try:
+            if self.spill_folder is None:
+                self.spill_folder = tempfile.mkdtemp(prefix="pydatacore_spill_")
+            data_row['data_object'].convert_ram_to_file(self.spill_folder)
+            data_row['storage_type'] = 'file'
+            with self._registry_lock:
+                footprint = self._ram_usage.get(data_id, 0)
+                self._forget_ram(data_id)
+                if data_id in self.data_registry:
+                    self._spilled.add(data_id)
+                self._ram_stats['evictions'] += 1
+                self._ram_stats['spilled_bytes'] += footprint
+        finally:
+            with self._registry_lock:
+                self._maintenance.discard(data_id)
+            item_lock.release_write()
+
+    def _promote_if_spilled(self, data_id):
+        """
+        Ramène en RAM une donnée déplacée en fichier par le DataPool lorsqu'elle est relue en entier, si elle tient
+        dans le budget RAM (les données les moins récemment utilisées sont alors déplacées à sa place).
+        """
+        if self.max_ram_bytes is None:
+            return
+        with self._registry_lock:
+            if data_id not in self._spilled:
+                return
+            data_row = self.data_registry[data_id]
+            if self.source_to_data.get_value(data_id, 'locked'):
+                return
+            if data_row['data_object'].data_size_in_bytes > self.max_ram_bytes:
+                return
+            item_lock = self._item_lock(data_id)
+            if not item_lock.acquire_write(blocking=False):
+                return  # Lecture en cours : la donnée reste en fichier
+            self._maintenance.add(data_id)
+        try:
+            data_obj = data_row['data_object']
+            data_obj.convert_file_to_ram()
+            data_row['storage_type'] = 'ram'
+            with self._registry_lock:
+                self._spilled.discard(data_id)
+                if data_id in self.data_registry:
+                    footprint = data_obj.ram_footprint()
+                    self._ram_usage[data_id] = footprint
+                    self._ram_bytes += footprint
+                    self._ram_stats['promotions'] += 1
+                    self._ram_stats['promoted_bytes'] += footprint
+        finally:
+            with self._registry_lock:
+                self._maintenance.discard(data_id)
+            item_lock.release_write()
+        self._enforce_ram_budget(exclude=data_id)
+
+    def get_ram_stats(self):
+        """
+        Retourne les statistiques du budget RAM.
+        :return: Dict avec max_ram_bytes, ram_bytes (occupation actuelle), resident (nombre de données en RAM),
+                 spilled (nombre de données déplacées en fichier), evictions, promotions, spilled_bytes et
+                 promoted_bytes (cumulés).
+        """
+        with self._registry_lock:
+            return {
+                'max_ram_bytes': self.max_ram_bytes,
+                'ram_bytes': self._ram_bytes,
+                'resident': len(self._ram_usage),
+                'spilled': len(self._spilled),
+                **self._ram_stats,
+            }
+
+    def _get_registered_object(self, data_id):
+        """Retourne l'objet Data enregistré, ou lève KeyError s'il n'existe pas."""
+        with self._registry_lock:
+            data_row = self.data_registry.get(data_id)
+        if data_row is None or data_row['data_object'] is None:
+            raise KeyError(f"Data with ID {data_id} not found in DataPool.")
+        return data_row['data_object']
 
-            # Mise à jour du type de stockage
-            self.data_registry.loc[self.data_registry['data_id'] == data_id, 'storage_type'] = 'file'
-            print(f"Les données {data_id} sont maintenant stockées dans un fichier.")
-        else:
-            print(f"Les données {data_id} sont déjà dans un fichier.")
-        #unlocker la donnée après la conversion
-        self.unlock_data(data_id)
+    async def wait_ready(self, data_id, timeout=None):
+        """
+        Attend de façon asynchrone que la donnée soit prête (stockée et déverrouillée).
+
+        :param data_id: L'ID unique de la donnée dans le DataPool.
+        :param timeout: Durée maximale d'attente en secondes (None pour attendre indéfiniment).
+        """
+        data_obj = self._get_registered_object(data_id)
+        await asyncio.wait_for(data_obj.wait_ready(), timeout)
 
     async def wait_for_data_ready(self, data_id):
-        data = self.data_registry.get(data_id)
-        if data:
-            await data.data_ready.wait()
-        else:
-            raise KeyError(f"Data with ID {data_id} not found in DataPool.")
+        await self.wait_ready(data_id)
 
     def mark_data_as_ready(self, data_id):
-        data = self.data_registry.get(data_id)
-        if data:
-            data.mark_data_ready()
-        else:
-            raise KeyError(f"Data with ID {data_id} not found in DataPool.")
+        self._get_registered_object(data_id).mark_data_ready()
 
+    async def _await_readable(self, read, data_id, timeout):
+        """
+        Attend que la donnée soit prête puis exécute la lecture read(timeout) dans un thread.
+        La lecture est bloquante : si un écrivain reprend le verrou entre le réveil et la lecture, elle l'attend
+        dans le thread pendant le temps restant.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        await self.wait_ready(data_id, timeout=timeout)
+        remaining = None if deadline is None else max(0.0, deadline - loop.time())
+        return await asyncio.to_thread(read, remaining)
 
+    async def aget_data(self, data_id, subscriber_id, timeout=None):
+        """
+        Version asynchrone de get_data : attend que la donnée soit prête puis la lit hors de la boucle asyncio.
 
+        :param data_id: L'ID de la donnée à lire.
+        :param subscriber_id: L'ID du subscriber qui lit les données.
+        :param timeout: Durée maximale d'attente de disponibilité en secondes.
+        :return: Les données complètes.
+        """
+        return await self._await_readable(
+            lambda remaining: self.get_data(data_id, subscriber_id, blocking=True, timeout=remaining), data_id, timeout)
+
+    async def aiter_chunks(self, data_id, chunk_size=1024, subscriber_id=None, timeout=None):
+        """
+        Itérateur asynchrone chunk par chunk : chaque chunk est lu dans un thread pour ne pas bloquer la boucle.
+        L'acquittement est effectué lorsque tous les chunks ont été traités.
+
+        :param data_id: L'ID unique de la donnée dans le DataPool.
+        :param chunk_size: La taille de chaque chunk.
+        :param subscriber_id: L'ID du subscriber effectuant la lecture (pour l'acquittement).
+        :param timeout: Durée maximale d'attente de disponibilité en secondes.
+        """
+        end = object()
+
+        def open_generator(remaining):
+            generator = self.get_chunk_generator(data_id, chunk_size=chunk_size, subscriber_id=subscriber_id,
+                                                 blocking=True, timeout=remaining)
+            # Démarrer le générateur pour vérifier les droits et prendre le verrou en lecture
+            return generator, next(generator, end)
+
+        generator, chunk = await self._await_readable(open_generator, data_id, timeout)
+        try:
+            while chunk is not end:
+                yield chunk
+                chunk = await asyncio.to_thread(next, generator, end)
+        finally:
+            await asyncio.to_thread(generator.close)
@@ -0,0 +1,79 @@
+import numpy as np
+
+from .accumulator import BlockAccumulator
+
+DEFAULT_ENVELOPE_BASE = 1024  # Nombre de samples par point du niveau 0 de la pyramide
+DEFAULT_ENVELOPE_FACTOR = 8  # Facteur de décimation entre deux niveaux consécutifs
+
+# Colonnes des niveaux de la pyramide (tableaux float64 de forme (n_points, 3))
+ENVELOPE_MIN, ENVELOPE_MAX, ENVELOPE_MEAN = range(3)
+
+
+class EnvelopeBuilder:
+    """
+    Construit au fil de l'eau la pyramide d'enveloppes min/max/moyenne d'un signal : le niveau 0 résume chaque
+    bloc de base samples (BlockAccumulator), chaque niveau suivant regroupe factor points du niveau précédent.
+    Les niveaux supérieurs sont calculés à la fermeture.
+    """
+
+    def __init__(self, base=DEFAULT_ENVELOPE_BASE, factor=DEFAULT_ENVELOPE_FACTOR):
+        if base < 1 or factor < 2:
+            raise ValueError("Envelope base must be at least 1 and factor at least 2.")
+        self.base = base
+        self.factor = factor
+        self._blocks = BlockAccumulator(base, _summarize, 3)
+
+    @property
+    def num_samples(self):
+        return self._blocks.num_samples
+
+    def write(self, samples):
+        """Ajoute des samples au signal résumé."""
+        self._blocks.write(samples)
+
+    def close(self):
+        """
+        Résume le dernier bloc incomplet et calcule les niveaux supérieurs.
+        :return: Liste des niveaux (tableaux (n_points, 3) : min, max, moyenne), du plus fin au plus grossier.
+        """
+        levels = [self._blocks.close()]
+        while len(levels[-1]) > self.factor:
+            levels.append(merge_points(levels[-1], bucket_counts(self.num_samples, self.bucket_size(len(levels) - 1),
+                                                                 0, len(levels[-1])),
+                                       np.arange(0, len(levels[-1]), self.factor)))
+        return levels
+
+    def bucket_size(self, level):
+        """Nombre de samples résumés par un point du niveau level."""
+        return self.base * self.factor ** level
+
+
+def _summarize(blocks):
+    """Résume chaque ligne d'un tableau 2-D de samples en (min, max, moyenne)."""
+    rows = np.empty((len(blocks), 3))
+    rows[:, ENVELOPE_MIN] = blocks.min(axis=1)
+    rows[:, ENVELOPE_MAX] = blocks.max(axis=1)
+    rows[:, ENVELOPE_MEAN] = blocks.mean(axis=1, dtype=np.float64)
+    return rows
+
+
+def bucket_counts(num_samples, bucket_size, first, stop):
+    """Nombre de samples résumés par les points [first, stop) d'un niveau (le dernier point du signal est partiel)."""
+    counts = np.full(stop - first, bucket_size, dtype=np.int64)
+    if counts.size and stop * bucket_size > num_samples:
+        counts[-1] = num_samples - (stop - 1) * bucket_size
+    return counts
+
+
+def merge_points(rows, counts, starts):
+    """
+    Regroupe des points consécutifs d'enveloppe : le groupe i commence au point starts[i] et s'arrête au début
+    du suivant. Les moyennes sont pondérées par le nombre de samples de chaque point.
+    :return: Tableau (len(starts), 3) des points regroupés.
+    """
+    merged = np.empty((len(starts), 3))
+    merged[:, ENVELOPE_MIN] = np.minimum.reduceat(rows[:, ENVELOPE_MIN], starts)
+    merged[:, ENVELOPE_MAX] = np.maximum.reduceat(rows[:, ENVELOPE_MAX], starts)
+    merged[:, ENVELOPE_MEAN] = (np.add.reduceat(rows[:, ENVELOPE_MEAN] * counts, starts)
+                                / np.add.reduceat(counts, starts))
+    return merged
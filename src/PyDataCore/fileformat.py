@@ -0,0 +1,91 @@
+import json
+import os
+import struct
+
+import numpy as np
+
+# Format des fichiers .dat auto-descriptifs :
+#   [préfixe fixe de HEADER_SIZE bytes : MAGIC, version, position et longueur des métadonnées JSON]
+#   [charge utile : num_samples samples bruts (dtype des métadonnées)]
+#   [sections optionnelles : tableaux NumPy bruts (index des chunks...), décrits dans metadata['sections']]
+#   [métadonnées JSON (longueur indiquée dans le préfixe)]
+MAGIC = b'PYDCDAT\x00'
+FORMAT_VERSION = 1
+_PREFIX = struct.Struct('<8sH6xQQ')  # magic, version, (bourrage), position et longueur des métadonnées JSON
+HEADER_SIZE = _PREFIX.size  # 32 bytes : la charge utile reste alignée pour tous les dtypes numériques
+
+
+def write_header(f, metadata):
+    """
+    Écrit les métadonnées à la fin du fichier puis le préfixe qui les référence en début de fichier.
+    Le préfixe est écrit en dernier : tant qu'il ne l'est pas, le fichier n'est pas reconnu comme valide.
+    :param f: Fichier ouvert en écriture binaire.
+    :param metadata: Dict des métadonnées (sérialisable en JSON).
+    """
+    payload = json.dumps(metadata, separators=(',', ':')).encode('utf-8')
+    f.seek(0, os.SEEK_END)
+    offset = max(f.tell(), HEADER_SIZE)
+    f.seek(offset)
+    f.write(payload)
+    f.seek(0)
+    f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, offset, len(payload)))
+
+
+def read_header(f):
+    """
+    Lit les métadonnées d'un fichier ouvert en lecture binaire (sans lire la charge utile).
+    :return: Dict des métadonnées.
+    :raises ValueError: Si le fichier n'est pas un fichier PyDataCore auto-descriptif complet ou si sa version est
+                        inconnue.
+    """
+    f.seek(0)
+    prefix = f.read(_PREFIX.size)
+    if len(prefix) < _PREFIX.size:
+        raise ValueError("File is too short to contain a PyDataCore header.")
+    magic, version, offset, length = _PREFIX.unpack(prefix)
+    if magic != MAGIC:
+        raise ValueError("File is not a self-describing PyDataCore data file.")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Unsupported file format version {version} (maximum supported: {FORMAT_VERSION}).")
+    f.seek(offset)
+    payload = f.read(length)
+    if len(payload) < length:
+        raise ValueError("File is truncated: PyDataCore metadata block is incomplete.")
+    metadata = json.loads(payload.decode('utf-8'))
+    metadata['format_version'] = version
+    return metadata
+
+
+def read_file_header(path):
+    """Lit l'en-tête du fichier path (voir read_header)."""
+    with open(path, 'rb') as f:
+        return read_header(f)
+
+
+def append_section(f, metadata, name, array):
+    """
+    Ajoute un tableau à la fin du fichier (après la charge utile) et le déclare dans metadata['sections'].
+    Les métadonnées doivent ensuite être écrites avec write_header pour que la section soit retrouvée.
+    """
+    array = np.ascontiguousarray(array)
+    f.seek(0, os.SEEK_END)
+    f.seek(max(f.tell(), HEADER_SIZE))  # Charge utile vide : ne pas écrire dans le préfixe
+    metadata.setdefault('sections', {})[name] = {
+        'offset': f.tell(), 'dtype': array.dtype.str, 'count': int(array.size)
+    }
+    array.tofile(f)
+
+
+def read_section(path, metadata, name, start=0, stop=None):
+    """
+    Lit une section déclarée dans les métadonnées, ou seulement ses éléments [start, stop) (lecture positionnée).
+    :return: Tableau NumPy de la section, ou None si elle n'existe pas.
+    """
+    section = metadata.get('sections', {}).get(name)
+    if section is None:
+        return None
+    dtype = np.dtype(section['dtype'])
+    stop = section['count'] if stop is None else min(stop, section['count'])
+    with open(path, 'rb') as f:
+        f.seek(section['offset'] + start * dtype.itemsize)
+        return np.fromfile(f, dtype=dtype, count=max(0, stop - start))
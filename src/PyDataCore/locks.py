@@ -0,0 +1,110 @@
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """
+    Verrou lecteurs/écrivain : plusieurs lecteurs simultanés ou un seul écrivain exclusif.
+    Les écrivains en attente sont prioritaires sur les nouveaux lecteurs pour éviter leur famine.
+    Le verrou n'est pas lié à un thread : la phase d'écriture d'une donnée peut commencer lors de
+    l'enregistrement et se terminer lors du stockage, éventuellement dans un autre thread.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @property
+    def is_write_locked(self):
+        """Indique si un écrivain détient le verrou."""
+        return self._writer
+
+    @property
+    def readers(self):
+        """Nombre de lecteurs détenant actuellement le verrou."""
+        return self._readers
+
+    def _can_read(self):
+        return not self._writer and not self._waiting_writers
+
+    def _can_write(self):
+        return not self._writer and self._readers == 0
+
+    def acquire_read(self, blocking=True, timeout=None):
+        """
+        Acquiert le verrou en lecture.
+        :param blocking: Si False, retourne immédiatement si un écrivain détient ou attend le verrou.
+        :param timeout: Durée maximale d'attente en secondes (None pour attendre indéfiniment).
+        :return: True si le verrou a été acquis.
+        """
+        with self._condition:
+            if not blocking:
+                if not self._can_read():
+                    return False
+            elif not self._condition.wait_for(self._can_read, timeout):
+                return False
+            self._readers += 1
+            return True
+
+    def release_read(self):
+        """Libère le verrou en lecture."""
+        with self._condition:
+            if self._readers == 0:
+                raise RuntimeError("Read lock released without being acquired")
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self, blocking=True, timeout=None):
+        """
+        Acquiert le verrou en écriture (exclusif).
+        :param blocking: Si False, retourne immédiatement si le verrou est détenu.
+        :param timeout: Durée maximale d'attente en secondes (None pour attendre indéfiniment).
+        :return: True si le verrou a été acquis.
+        """
+        with self._condition:
+            if not blocking:
+                if not self._can_write():
+                    return False
+            else:
+                self._waiting_writers += 1
+                try:
+                    acquired = self._condition.wait_for(self._can_write, timeout)
+                finally:
+                    self._waiting_writers -= 1
+                if not acquired:
+                    # Réveiller les lecteurs bloqués par cet écrivain en attente
+                    self._condition.notify_all()
+                    return False
+            self._writer = True
+            return True
+
+    def release_write(self):
+        """Libère le verrou en écriture."""
+        with self._condition:
+            if not self._writer:
+                raise RuntimeError("Write lock released without being acquired")
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self, timeout=None):
+        """Context manager de lecture ; lève TimeoutError si le verrou n'est pas obtenu à temps."""
+        if not self.acquire_read(timeout=timeout):
+            raise TimeoutError("Timed out waiting for read lock")
+        try:
+            yield self
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self, timeout=None):
+        """Context manager d'écriture ; lève TimeoutError si le verrou n'est pas obtenu à temps."""
+        if not self.acquire_write(timeout=timeout):
+            raise TimeoutError("Timed out waiting for write lock")
+        try:
+            yield self
+        finally:
+            self.release_write()
@@ -0,0 +1,112 @@
+import numpy as np
+
+# Types entiers de stockage disponibles et leur valeur maximale (codes symétriques [-qmax, qmax])
+QUANTIZATION_TYPES = {
+    'int16': 32767,
+    'int8': 127,
+}
+
+
+def get_quantization_range(quantization):
+    """Retourne la valeur maximale des codes du type de stockage ; lève ValueError s'il est inconnu."""
+    try:
+        return QUANTIZATION_TYPES[quantization]
+    except KeyError:
+        raise ValueError(f"Unsupported quantization {quantization!r}. Available types: {sorted(QUANTIZATION_TYPES)}.")
+
+
+def quantize(samples, quantization, block_size):
+    """
+    Quantifie des samples flottants par blocs de block_size samples : chaque bloc a son propre pas (scale) et
+    son propre centre (offset), calculés sur son min/max, de sorte que code = round((x - offset) / scale).
+    L'erreur absolue est au plus scale / 2 dans chaque bloc.
+    :param samples: Samples flottants (finis).
+    :param quantization: Type entier de stockage ('int16' ou 'int8').
+    :param block_size: Nombre de samples par bloc.
+    :return: Tuple (codes entiers, scales float64, offsets float64), un scale et un offset par bloc.
+    """
+    qmax = get_quantization_range(quantization)
+    samples = np.asarray(samples).reshape(-1)
+    if samples.size == 0:
+        return np.empty(0, dtype=quantization), np.empty(0), np.empty(0)
+    starts = np.arange(0, samples.size, block_size)
+    low = np.minimum.reduceat(samples, starts).astype(np.float64)
+    high = np.maximum.reduceat(samples, starts).astype(np.float64)
+    offsets = (high + low) / 2
+    scales = (high - low) / (2 * qmax)
+    scales[scales == 0] = 1.0  # Bloc constant : tous les codes valent 0
+    counts = np.diff(np.append(starts, samples.size))
+    codes = (samples - np.repeat(offsets, counts)) / np.repeat(scales, counts)
+    return np.clip(np.rint(codes), -qmax, qmax).astype(quantization), scales, offsets
+
+
+def dequantize(codes, scales, offsets, block_size, start=0, dtype=np.float32):
+    """
+    Reconstitue les samples flottants des codes [start, start + len(codes)) en une seule opération vectorisée.
+    :param codes: Codes entiers consécutifs, le premier étant le sample start du signal.
+    :param scales: Scale de chaque bloc du signal.
+    :param offsets: Offset de chaque bloc du signal.
+    :param block_size: Nombre de samples par bloc.
+    :param start: Index (dans le signal) du premier code.
+    :param dtype: dtype flottant du résultat.
+    :return: Nouveau tableau NumPy de samples flottants.
+    """
+    codes = np.asarray(codes)
+    if codes.size == 0:
+        return np.empty(0, dtype=dtype)
+    first, last = start // block_size, (start + codes.size - 1) // block_size
+    bounds = np.arange(first, last + 2) * block_size
+    bounds[0], bounds[-1] = start, start + codes.size
+    counts = np.diff(bounds)
+    samples = codes.astype(dtype)
+    samples *= np.repeat(scales[first:last + 1].astype(dtype), counts)
+    samples += np.repeat(offsets[first:last + 1].astype(dtype), counts)
+    return samples
+
+
+class BlockQuantizer:
+    """
+    Quantifie un flux de samples par blocs de block_size samples (voir quantize) : les blocs complets sont
+    quantifiés puis transmis à sink, le dernier bloc partiel à la fermeture.
+    """
+
+    def __init__(self, quantization, block_size, sink, dtype=np.float32):
+        """
+        :param quantization: Type entier de stockage ('int16' ou 'int8').
+        :param block_size: Nombre de samples par bloc.
+        :param sink: Fonction recevant les codes entiers de chaque bloc.
+        :param dtype: dtype flottant des samples reçus.
+        """
+        get_quantization_range(quantization)
+        self._quantization = quantization
+        self._sink = sink
+        self._block = np.empty(block_size, dtype=dtype)
+        self._filled = 0
+        self._scales = []
+        self._offsets = []
+
+    def write(self, samples):
+        """Ajoute des samples au flux. :return: Nombre de samples reçus."""
+        samples = np.asarray(samples, dtype=self._block.dtype).reshape(-1)
+        position = 0
+        while position < samples.size:
+            count = min(self._block.size - self._filled, samples.size - position)
+            self._block[self._filled:self._filled + count] = samples[position:position + count]
+            self._filled += count
+            position += count
+            if self._filled == self._block.size:
+                self._flush()
+        return samples.size
+
+    def _flush(self):
+        if self._filled:
+            codes, scales, offsets = quantize(self._block[:self._filled], self._quantization, self._block.size)
+            self._scales.append(scales[0])
+            self._offsets.append(offsets[0])
+            self._filled = 0
+            self._sink(codes)
+
+    def close(self):
+        """Quantifie le dernier bloc (partiel). :return: Tuple (scales, offsets) de tous les blocs."""
+        self._flush()
+        return np.asarray(self._scales, dtype=np.float64), np.asarray(self._offsets, dtype=np.float64)
@@ -0,0 +1,250 @@
+import threading
+
+import pandas as pd
+
+
+class LazyRow(dict):
+    """
+    Ligne de registre dont certaines colonnes ne sont calculées qu'au premier accès : loader(source) retourne
+    un dict des colonnes manquantes (par exemple l'objet Data d'une entrée restaurée depuis un catalogue).
+    Le chargement est protégé par un verrou : les accès concurrents attendent la fin du premier chargement.
+    """
+
+    __slots__ = ('source', '_loader', '_load_lock')
+
+    def __init__(self, columns, source, loader):
+        super().__init__(columns)
+        self.source = source
+        self._loader = loader
+        self._load_lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        """Indique si les colonnes différées ont été calculées."""
+        return self._loader is None
+
+    def __missing__(self, key):
+        if self._loader is not None:
+            with self._load_lock:
+                # Double vérification : un autre thread a pu terminer le chargement pendant l'attente
+                if self._loader is not None:
+                    self.update(self._loader(self.source))
+                    # Le loader n'est oublié qu'une fois les colonnes ajoutées (nouvel essai en cas d'erreur)
+                    self._loader = None
+        if key in self:
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+
+class RegistryTable:
+    """
+    Table de registre indexée par data_id (dictionnaire) utilisée par le DataPool.
+    Chaque ligne est un dict {colonne: valeur} ; l'ajout, la lecture, la mise à jour et la suppression
+    d'une ligne se font en O(1). Des index secondaires (valeur de colonne -> clés) peuvent être maintenus
+    sur certaines colonnes pour les recherches. La méthode to_dataframe() fournit une vue tabulaire pour l'inspection.
+    """
+
+    def __init__(self, columns, key='data_id', indexed_columns=()):
+        """
+        :param columns: Liste ordonnée des colonnes de la table.
+        :param key: Colonne utilisée comme clé d'indexation (par défaut data_id).
+        :param indexed_columns: Colonnes pour lesquelles un index secondaire est maintenu.
+        """
+        self.columns = list(columns)
+        self.key = key
+        self._rows = {}
+        self._indexes = {column: {} for column in indexed_columns}
+        self._indexes_stale = False  # Index secondaires à reconstruire (après un ajout en masse)
+
+    def _ensure_indexes(self):
+        """Reconstruit les index secondaires s'ils ont été invalidés par un ajout en masse."""
+        if not self._indexes_stale:
+            return
+        for column, index in self._indexes.items():
+            index.clear()
+            for key, row in self._rows.items():
+                index.setdefault(row[column], {})[key] = None
+        self._indexes_stale = False
+
+    def _index_add(self, column, value, key):
+        self._indexes[column].setdefault(value, {})[key] = None
+
+    def _index_remove(self, column, value, key):
+        keys = self._indexes[column].get(value)
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                del self._indexes[column][value]
+
+    def add(self, row):
+        """Ajoute (ou remplace) une ligne, indexée par la valeur de sa colonne clé."""
+        key = row[self.key]
+        if key in self._rows:
+            self.remove(key)
+        self._rows[key] = row
+        if not self._indexes_stale:
+            for column in self._indexes:
+                self._index_add(column, row[column], key)
+        return row
+
+    def extend(self, rows):
+        """
+        Ajoute des lignes en masse (clés supposées nouvelles) ; les index secondaires ne sont reconstruits qu'à la
+        prochaine recherche, ce qui rend le chargement d'un grand nombre de lignes proportionnel à leur seul ajout.
+        """
+        key = self.key
+        self._rows.update((row[key], row) for row in rows)
+        if self._indexes:
+            self._indexes_stale = True
+
+    def get(self, key, default=None):
+        """Retourne la ligne associée à la clé, ou default si elle n'existe pas."""
+        return self._rows.get(key, default)
+
+    def get_value(self, key, column):
+        """Retourne la valeur d'une colonne pour la clé donnée."""
+        try:
+            return self._rows[key][column]
+        except KeyError:
+            raise ValueError(f"Data {key} not found in registry")
+
+    def set_value(self, key, column, value):
+        """Met à jour la valeur d'une colonne pour la clé donnée (et l'index secondaire associé)."""
+        row = self._rows.get(key)
+        if row is None:
+            raise ValueError(f"Data {key} not found in registry")
+        if column in self._indexes and not self._indexes_stale:
+            self._index_remove(column, row[column], key)
+            self._index_add(column, value, key)
+        row[column] = value
+
+    def remove(self, key):
+        """Supprime la ligne associée à la clé et la retourne (None si absente)."""
+        row = self._rows.pop(key, None)
+        if row is not None and not self._indexes_stale:
+            for column in self._indexes:
+                self._index_remove(column, row[column], key)
+        return row
+
+    def lookup(self, column, value):
+        """
+        Retourne les clés des lignes dont la colonne indexée vaut value, dans l'ordre d'insertion.
+        La vue retournée est en lecture seule et reflète l'état courant de l'index.
+        """
+        if column not in self._indexes:
+            raise KeyError(f"Column {column} is not indexed")
+        self._ensure_indexes()
+        return self._indexes[column].get(value, {}).keys()
+
+    def rows(self):
+        """Itère sur les lignes de la table."""
+        return iter(self._rows.values())
+
+    def __getitem__(self, key):
+        return self._rows[key]
+
+    def __contains__(self, key):
+        return key in self._rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def to_dataframe(self):
+        """Retourne une vue DataFrame (copie) de la table pour l'inspection."""
+        return pd.DataFrame(list(self._rows.values()), columns=self.columns)
+
+
+class SubscriberTable:
+    """
+    Table des abonnements (subscriber, data) et de leurs acquittements, indexée par data_id puis subscriber_id.
+    Un compteur d'acquittements en attente est maintenu par donnée, de sorte que l'acquittement et le test
+    "tous les subscribers ont acquitté" se font en temps constant.
+    """
+
+    columns = ['subscriber_id', 'data_id', 'acquitements']
+
+    def __init__(self):
+        self._subscriptions = {}  # data_id -> {subscriber_id: acquittement}
+        self._pending = {}  # data_id -> nombre de subscribers n'ayant pas encore acquitté
+        self._by_subscriber = {}  # subscriber_id -> {data_id: None} (index secondaire ordonné)
+
+    def add(self, data_id, subscriber_id):
+        """Ajoute un abonnement (sans acquittement). Un nouvel abonnement annule un acquittement précédent."""
+        subscribers = self._subscriptions.setdefault(data_id, {})
+        if subscribers.get(subscriber_id, True):
+            # Nouvel abonné, ou abonné ayant déjà acquitté : un acquittement est de nouveau attendu
+            self._pending[data_id] = self._pending.get(data_id, 0) + 1
+        subscribers[subscriber_id] = False
+        self._by_subscriber.setdefault(subscriber_id, {})[data_id] = None
+
+    def is_subscribed(self, data_id, subscriber_id):
+        """Indique si le subscriber est abonné à la donnée."""
+        return subscriber_id in self._subscriptions.get(data_id, ())
+
+    def subscribers(self, data_id):
+        """Retourne la liste des subscribers abonnés à la donnée."""
+        return list(self._subscriptions.get(data_id, ()))
+
+    def acknowledge(self, data_id, subscriber_id):
+        """
+        Marque l'acquittement du subscriber pour la donnée.
+        :return: True si tous les subscribers de la donnée ont maintenant acquitté.
+        """
+        subscribers = self._subscriptions.get(data_id)
+        if subscribers is None or subscriber_id not in subscribers:
+            raise ValueError(f"Subscriber {subscriber_id} not found for data {data_id}")
+        if not subscribers[subscriber_id]:
+            subscribers[subscriber_id] = True
+            self._pending[data_id] -= 1
+        return self._pending[data_id] == 0
+
+    def acknowledgements(self, data_id):
+        """Retourne (copie) l'état d'acquittement de chaque subscriber de la donnée : {subscriber_id: bool}."""
+        return dict(self._subscriptions.get(data_id, {}))
+
+    def restore(self, data_id, acknowledgements):
+        """Restaure en une fois les abonnements d'une donnée et leurs acquittements : {subscriber_id: bool}."""
+        if not acknowledgements:
+            return
+        self._subscriptions[data_id] = dict(acknowledgements)
+        self._pending[data_id] = list(acknowledgements.values()).count(False)
+        for subscriber_id in acknowledgements:
+            self._by_subscriber.setdefault(subscriber_id, {})[data_id] = None
+
+    def pending_count(self, data_id):
+        """Retourne le nombre de subscribers n'ayant pas encore acquitté la donnée."""
+        return self._pending.get(data_id, 0)
+
+    def all_acknowledged(self, data_id):
+        """Indique si tous les subscribers de la donnée ont acquitté."""
+        return self._pending.get(data_id, 0) == 0
+
+    def data_ids(self, subscriber_id):
+        """Retourne (vue en lecture seule) les data_id auxquels le subscriber est abonné."""
+        return self._by_subscriber.get(subscriber_id, {}).keys()
+
+    def remove(self, data_id):
+        """Supprime tous les abonnements d'une donnée."""
+        subscribers = self._subscriptions.pop(data_id, None)
+        self._pending.pop(data_id, None)
+        for subscriber_id in subscribers or ():
+            data_ids = self._by_subscriber[subscriber_id]
+            data_ids.pop(data_id, None)
+            if not data_ids:
+                del self._by_subscriber[subscriber_id]
+        return subscribers
+
+    def __len__(self):
+        return sum(len(subscribers) for subscribers in self._subscriptions.values())
+
+    def to_dataframe(self):
+        """Retourne une vue DataFrame (copie) des abonnements pour l'inspection."""
+        rows = [
+            {'subscriber_id': subscriber_id, 'data_id': data_id, 'acquitements': acknowledged}
+            for data_id, subscribers in self._subscriptions.items()
+            for subscriber_id, acknowledged in subscribers.items()
+        ]
+        return pd.DataFrame(rows, columns=self.columns)
@@ -0,0 +1,92 @@
+import sys
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+_created = set()  # Noms des segments créés par ce processus (enregistrés auprès de son resource_tracker)
+
+
+def create_segment(size):
+    """Crée un segment de mémoire partagée d'au moins size bytes (un segment ne peut pas être vide)."""
+    segment = shared_memory.SharedMemory(create=True, size=max(int(size), 1))
+    _created.add(segment.name)
+    return segment
+
+
+def attach_segment(name):
+    """
+    Attache un segment de mémoire partagée existant sans en prendre la propriété : seul le processus qui l'a créé
+    (le DataPool) le supprime, lors de la libération de la donnée.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    segment = shared_memory.SharedMemory(name=name)
+    if name not in _created:
+        # Avant Python 3.13, l'attachement enregistre le segment auprès du resource_tracker, qui le supprimerait à
+        # la sortie du processus attaché : l'enregistrement est annulé aussitôt (sans toucher au resource_tracker
+        # partagé par les autres threads). Dans le processus créateur, l'enregistrement existant est conservé.
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def close_segment(segment):
+    """Détache un segment ; s'il est encore référencé par des vues NumPy, il sera démappé à leur libération."""
+    try:
+        segment.close()
+    except BufferError:
+        pass
+
+
+def unlink_segment(segment):
+    """Supprime un segment créé par ce processus puis le détache."""
+    _created.discard(segment.name)
+    segment.unlink()
+    close_segment(segment)
+
+
+class SharedArrayDescriptor:
+    """
+    Descripteur léger (picklable) d'un tableau NumPy stocké en mémoire partagée, à transmettre aux autres processus.
+    Le segment reste valide jusqu'à la libération de la donnée par le DataPool (acquittement de tous les subscribers
+    ou suppression) : un processus doit avoir fini de l'utiliser avant d'acquitter.
+    """
+
+    __slots__ = ('name', 'dtype', 'shape', 'data_id')
+
+    def __init__(self, name, dtype, shape, data_id=None):
+        """
+        :param name: Nom du segment de mémoire partagée.
+        :param dtype: dtype NumPy des éléments (chaîne, ex. '<f4').
+        :param shape: Forme du tableau.
+        :param data_id: ID de la donnée dans le DataPool.
+        """
+        self.name = name
+        self.dtype = dtype
+        self.shape = tuple(shape)
+        self.data_id = data_id
+
+    def __getstate__(self):
+        return self.name, self.dtype, self.shape, self.data_id
+
+    def __setstate__(self, state):
+        self.name, self.dtype, self.shape, self.data_id = state
+
+    def __repr__(self):
+        return (f"SharedArrayDescriptor(name={self.name!r}, dtype={self.dtype!r}, shape={self.shape!r}, "
+                f"data_id={self.data_id!r})")
+
+    @contextmanager
+    def attach(self):
+        """
+        Attache le segment dans le processus courant et fournit le tableau NumPy correspondant, sans copie et en
+        lecture seule. Le segment est détaché à la sortie du bloc : le tableau ne doit pas être utilisé au-delà.
+        """
+        segment = attach_segment(self.name)
+        array = np.ndarray(self.shape, dtype=self.dtype, buffer=segment.buf)
+        array.flags.writeable = False
+        try:
+            yield array
+        finally:
+            del array
+            close_segment(segment)
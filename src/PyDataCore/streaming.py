@@ -0,0 +1,156 @@
+import queue
+from collections import deque
+import threading
+from concurrent.futures import Future
+
+_ITEM, _END, _ERROR = range(3)
+
+
+def prefetch(iterable, depth):
+    """
+    Générateur qui parcourt iterable dans un thread en arrière-plan en gardant au plus depth éléments d'avance,
+    de sorte que la lecture (I/O) du chunk suivant se recouvre avec le traitement du chunk courant.
+    Les exceptions levées par iterable sont relancées côté consommateur. Si le consommateur s'arrête avant la fin,
+    le thread est arrêté et iterable est fermé avant le retour.
+
+    :param iterable: Itérable à parcourir (typiquement un générateur de chunks).
+    :param depth: Nombre maximal d'éléments lus d'avance (mémoire bornée).
+    :yield: Les éléments de iterable, dans l'ordre.
+    """
+    if depth < 1:
+        raise ValueError("Prefetch depth must be at least 1.")
+    items = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(message):
+        # Attente interruptible : le consommateur peut demander l'arrêt pendant que la file est pleine
+        while not stop.is_set():
+            try:
+                items.put(message, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def worker():
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not put((_ITEM, item)):
+                    return
+            put((_END, None))
+        except BaseException as e:
+            put((_ERROR, e))
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=worker, name="PyDataCore-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, value = items.get()
+            if kind == _END:
+                break
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        stop.set()
+        thread.join()
+
+
+def ordered_map(executor, tasks, max_pending):
+    """
+    Soumet les tâches à l'executor en gardant au plus max_pending tâches en cours et génère leurs résultats
+    dans l'ordre de soumission. Les tâches en attente sont annulées si le consommateur s'arrête avant la fin.
+
+    :param executor: concurrent.futures.Executor exécutant les tâches.
+    :param tasks: Itérable de tuples (fonction, *arguments).
+    :param max_pending: Nombre maximal de tâches soumises non encore consommées.
+    :yield: Le résultat de chaque tâche, dans l'ordre.
+    """
+    pending = deque()
+    try:
+        for task in tasks:
+            pending.append(executor.submit(*task))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+class WriteBehindWriter:
+    """
+    Thread d'écriture dédié alimenté par un double buffer borné : le producteur (par exemple le générateur
+    d'acquisition) remet ses chunks via submit() et continue pendant que le thread les écrit sur le disque.
+    La fin de l'écriture est signalée par un concurrent.futures.Future.
+    """
+
+    def __init__(self, write, finish, abort=None, depth=2):
+        """
+        :param write: Fonction appelée dans le thread d'écriture pour chaque chunk.
+        :param finish: Fonction appelée dans le thread d'écriture après le dernier chunk ; sa valeur de retour
+                       devient le résultat du Future.
+        :param abort: Fonction appelée dans le thread d'écriture en cas d'échec ou d'abandon (nettoyage).
+        :param depth: Nombre de buffers en attente d'écriture (2 : double buffer).
+        """
+        if depth < 1:
+            raise ValueError("Write-behind depth must be at least 1.")
+        self._write = write
+        self._finish = finish
+        self._abort = abort
+        self._queue = queue.Queue(maxsize=depth)
+        self.future = Future()
+        self._thread = threading.Thread(target=self._run, name="PyDataCore-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            while True:
+                kind, value = self._queue.get()
+                if kind == _END:
+                    break
+                if kind == _ERROR:
+                    raise value
+                self._write(value)
+            result = self._finish()
+        except BaseException as e:
+            if self._abort is not None:
+                self._abort()
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+
+    def _put(self, message):
+        # Attente interruptible : si le thread d'écriture a échoué, son erreur est relancée chez le producteur
+        while True:
+            if self.future.done():
+                self.future.result()
+                raise RuntimeError("Writer already finished")
+            try:
+                self._queue.put(message, timeout=0.05)
+                return
+            except queue.Full:
+                continue
+
+    def submit(self, chunk):
+        """Remet un chunk au thread d'écriture (bloque tant que les deux buffers sont occupés)."""
+        self._put((_ITEM, chunk))
+
+    def close(self):
+        """Signale la fin des données et retourne le Future de fin d'écriture."""
+        self._put((_END, None))
+        return self.future
+
+    def abort(self, error):
+        """Interrompt l'écriture ; le Future se termine avec error."""
+        try:
+            self._put((_ERROR, error))
+        except BaseException:
+            pass  # Le thread d'écriture s'est déjà terminé
+        self._thread.join()
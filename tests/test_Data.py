@@ -3,7 +3,7 @@ import tracemalloc
 
 import numpy as np
 
-from src.PyDataCore.data import Data, data_generator, ChunkableMixin, FileRamMixin
+from src.PyDataCore.data import Data, data_generator, ChunkableMixin, FileRamMixin, GrowableBuffer, TemporalSignalData
 
 
 def test_data_methods():
@@ -112,6 +112,25 @@ def test_data_methods():
     print("---- Fin des tests des méthodes de la classe Data ----")
 
 
+def test_generator_ram_store_uses_typed_buffer():
+    """Le stockage RAM depuis un générateur remplit un buffer NumPy typé, préalloué ou agrandi puis réduit."""
+    num_samples = 10000
+    for number_of_elements in [num_samples, 0, 10]:  # taille connue, inconnue, sous-estimée
+        signal = TemporalSignalData("test_buffer", "test_buffer", data_size_in_bytes=0,
+                                    number_of_elements=number_of_elements, time_step=0.01, unit="V")
+        signal.store_data_from_data_generator(data_generator('float64', num_samples, 333))
+        assert isinstance(signal.data, np.ndarray) and signal.data.dtype == np.float32
+        assert len(signal.data) == signal.num_samples == num_samples
+        assert signal.data_size_in_bytes == num_samples * 4
+        np.testing.assert_allclose(signal.data, np.arange(num_samples) * 1.1, rtol=1e-6)
+
+    buffer = GrowableBuffer(np.int32)
+    for chunk in ([1, 2, 3], np.arange(4, 2000), 2000):
+        buffer.extend(chunk)
+    data = buffer.finalize()
+    assert len(data) == 2000 and data[0] == 1 and data[-1] == 2000
+
+
 def check_memory_leaks():
     """
     Teste les fuites de mémoire pour différents types de données en utilisant tracemalloc.
@@ -61,7 +61,7 @@ for freq_signal in freq_signals:
     data_pool.add_subscriber(data_id, "sub1")
 
     #afficher l'état du registre data_pool avec tabulate
-    print(tabulate.tabulate(data_pool.data_registry, headers='keys', tablefmt='pretty'))
+    print(tabulate.tabulate(data_pool.data_registry.to_dataframe(), headers='keys', tablefmt='pretty'))
 
     ffts_data = data_pool.get_data_object(ffts_data_id, "sub1")
     print(f"Objet FFTSData: {ffts_data}")
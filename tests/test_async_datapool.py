@@ -0,0 +1,70 @@
+import asyncio
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from src.PyDataCore.datapool import DataPool
+from src.PyDataCore.data import Data_Type
+
+
+def test_wait_ready_and_aget_data():
+    pool = DataPool()
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", time_step=0.01, unit="V")
+    pool.add_subscriber(data_id, "subscriber_1")
+
+    async def scenario():
+        # Plusieurs subscribers attendent la donnée, stockée par un autre thread
+        readers = [asyncio.create_task(pool.aget_data(data_id, "subscriber_1", timeout=5)) for _ in range(10)]
+        await asyncio.sleep(0.05)
+        assert not any(reader.done() for reader in readers)
+        writer = threading.Thread(target=pool.store_data, args=(data_id, [0.1, 0.2, 0.3], "source_1"))
+        writer.start()
+        results = await asyncio.gather(*readers)
+        writer.join()
+        return results
+
+    results = asyncio.run(scenario())
+    assert all(result == [0.1, 0.2, 0.3] for result in results)
+
+    # La donnée est prête : l'attente se termine immédiatement
+    asyncio.run(pool.wait_ready(data_id, timeout=1))
+    asyncio.run(pool.wait_for_data_ready(data_id))
+
+
+def test_wait_ready_timeout_and_unknown_data():
+    pool = DataPool()
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", time_step=0.01, unit="V")
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(pool.wait_ready(data_id, timeout=0.05))
+    with pytest.raises(KeyError):
+        asyncio.run(pool.wait_ready("unknown"))
+
+    pool.mark_data_as_ready(data_id)
+    asyncio.run(pool.wait_ready(data_id, timeout=1))
+
+
+def test_aiter_chunks_from_file():
+    pool = DataPool()
+    folder = "test_folder"
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    data_value = np.arange(100, dtype=np.float32)
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", in_file=True,
+                                 time_step=0.01, unit="V")
+    pool.add_subscriber(data_id, "subscriber_1")
+    pool.store_data(data_id, data_value, "source_1", folder=folder)
+    file_path = pool.data_registry[data_id]['data_object'].file_path
+
+    async def read_all():
+        return [chunk async for chunk in pool.aiter_chunks(data_id, chunk_size=30, subscriber_id="subscriber_1")]
+
+    chunks = asyncio.run(read_all())
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    np.testing.assert_allclose(np.concatenate(chunks), data_value)
+
+    # Tous les subscribers ont acquitté : la donnée non protégée est libérée
+    assert data_id not in pool.data_registry
+    assert not os.path.exists(file_path)
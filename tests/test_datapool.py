@@ -1,6 +1,10 @@
 # Fonctions de test
 from tabulate import tabulate
 import os
+import sys
+import threading
+import time
+import pytest
 import numpy as np
 from src.PyDataCore.datapool import DataPool
 from src.PyDataCore.data import Data_Type
@@ -9,9 +13,9 @@ from src.PyDataCore.data import Data_Type
 # test de l'initialisation de la classe DataPool
 def test_datapool():
     pool = DataPool()
-    assert pool.data_registry.empty
-    assert pool.source_to_data.empty
-    assert pool.subscriber_to_data.empty
+    assert pool.data_registry.to_dataframe().empty
+    assert pool.source_to_data.to_dataframe().empty
+    assert pool.subscriber_to_data.to_dataframe().empty
     print("DataPool initialization passed")
 
     data_id = pool.register_data(
@@ -24,14 +28,14 @@ def test_datapool():
         unit="V"  # Exemple d'unité
     )
 
-    assert not pool.data_registry.empty
+    assert not pool.data_registry.to_dataframe().empty
     # Comparer le nom du type de donnée avec la chaîne 'TEMPORAL_SIGNAL'
-    assert pool.data_registry.iloc[0]['data_type'] == Data_Type.TEMPORAL_SIGNAL.name
-    assert pool.source_to_data.loc[pool.source_to_data['data_id'] == data_id, 'locked'].values[0]
+    assert pool.data_registry.to_dataframe().iloc[0]['data_type'] == Data_Type.TEMPORAL_SIGNAL.name
+    assert pool.source_to_data[data_id]['locked']
     #affichage de tous les registres
-    print(tabulate(pool.data_registry, headers='keys', tablefmt='psql'))
-    print(tabulate(pool.source_to_data, headers='keys', tablefmt='psql'))
-    print(tabulate(pool.subscriber_to_data, headers='keys', tablefmt='psql'))
+    print(tabulate(pool.data_registry.to_dataframe(), headers='keys', tablefmt='psql'))
+    print(tabulate(pool.source_to_data.to_dataframe(), headers='keys', tablefmt='psql'))
+    print(tabulate(pool.subscriber_to_data.to_dataframe(), headers='keys', tablefmt='psql'))
 
 
 def test_datapool_all_data_types():
@@ -103,7 +107,7 @@ def test_file_storage_data_types():
     pool.store_data(data_id, data_value, "source_1", folder=test_folder)
 
     # Vérifier l'existence du fichier
-    data_obj = pool.data_registry.loc[pool.data_registry['data_id'] == data_id, 'data_object'].values[0]
+    data_obj = pool.data_registry[data_id]['data_object']
     assert data_obj.file_path is not None, f"File path for {data_name} should not be None"
     assert os.path.exists(data_obj.file_path), f"File for {data_name} does not exist at {data_obj.file_path}"
 
@@ -131,7 +135,7 @@ def test_file_storage_data_types():
     pool.store_data(data_id, data_value, "source_1", folder=test_folder)
 
     # Vérifier l'existence du fichier
-    data_obj = pool.data_registry.loc[pool.data_registry['data_id'] == data_id, 'data_object'].values[0]
+    data_obj = pool.data_registry[data_id]['data_object']
     assert data_obj.file_path is not None, f"File path for {data_name} should not be None"
     assert os.path.exists(data_obj.file_path), f"File for {data_name} does not exist at {data_obj.file_path}"
 
@@ -193,6 +197,715 @@ def test_chunk_storage_and_read():
         print(f"File {file_path} was deleted after all subscribers acknowledged.")
 
 
+def test_registry_release_after_acknowledgement():
+    pool = DataPool()
+
+    # Enregistrer plusieurs données et vérifier les accès directs par data_id
+    data_ids = [pool.register_data(Data_Type.TEMPORAL_SIGNAL, f"TempSignal_{i}", "source_1", time_step=0.01, unit="V")
+                for i in range(100)]
+    assert len(pool.data_registry) == 100
+    assert pool.data_registry[data_ids[42]]['data_name'] == "TempSignal_42"
+
+    data_id = data_ids[0]
+    pool.store_data(data_id, [0.1, 0.2, 0.3], "source_1")
+    pool.add_subscriber(data_id, "subscriber_1")
+    pool.add_subscriber(data_id, "subscriber_2")
+    assert len(pool.subscriber_to_data.to_dataframe()) == 2
+
+    # La donnée n'est libérée qu'après l'acquittement de tous les subscribers
+    pool.acknowledge_data(data_id, "subscriber_1")
+    assert data_id in pool.data_registry
+    pool.acknowledge_data(data_id, "subscriber_2")
+    assert data_id not in pool.data_registry
+    assert data_id not in pool.source_to_data
+    assert len(pool.subscriber_to_data) == 0
+
+
+def test_find_with_secondary_indexes():
+    pool = DataPool()
+
+    temporal_ids = [pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", time_step=0.01, unit="V")
+                    for _ in range(3)]
+    freq_ids = [pool.register_data(Data_Type.FREQ_SIGNAL, f"Spectrum_{i}", "source_2", freq_step=0.1, unit="V")
+                for i in range(3)]
+    for data_id in temporal_ids[:2] + freq_ids[:1]:
+        pool.add_subscriber(data_id, "subscriber_1")
+
+    assert pool.find(source_id="source_1") == temporal_ids
+    assert pool.find(data_type=Data_Type.FREQ_SIGNAL) == freq_ids
+    assert pool.find(data_type=Data_Type.FREQ_SIGNAL, data_name="Spectrum_1") == [freq_ids[1]]
+    assert pool.find(subscriber_id="subscriber_1", source_id="source_1") == temporal_ids[:2]
+    assert pool.find(source_id="unknown") == []
+
+    # Les index sont mis à jour lors de la suppression
+    pool.delete_data(temporal_ids[0])
+    assert pool.find(subscriber_id="subscriber_1", data_name="Signal") == [temporal_ids[1]]
+
+
+def test_acknowledge_many():
+    pool = DataPool()
+
+    data_ids = []
+    for i in range(5):
+        data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, f"Signal_{i}", "source_1", protected=(i == 0),
+                                     time_step=0.01, unit="V")
+        pool.store_data(data_id, [0.1, 0.2], "source_1")
+        pool.add_subscriber(data_id, "subscriber_1")
+        pool.add_subscriber(data_id, "subscriber_2")
+        data_ids.append(data_id)
+
+    pool.acknowledge_many("subscriber_1", data_ids)
+    assert all(pool.subscriber_to_data.pending_count(data_id) == 1 for data_id in data_ids)
+
+    # Un acquittement répété ne change pas le compteur
+    pool.acknowledge_data(data_ids[1], "subscriber_1")
+    assert pool.subscriber_to_data.pending_count(data_ids[1]) == 1
+
+    # Le second subscriber libère les données non protégées
+    pool.acknowledge_many("subscriber_2", pool.find(subscriber_id="subscriber_2"))
+    assert pool.find(source_id="source_1") == [data_ids[0]]
+    assert pool.subscriber_to_data.all_acknowledged(data_ids[0])
+
+
+def test_blocking_reads_wait_for_writer():
+    pool = DataPool()
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", time_step=0.01, unit="V")
+    pool.add_subscriber(data_id, "subscriber_1")
+
+    # Sans blocage la lecture d'une donnée en cours d'écriture est refusée ; avec délai elle expire
+    with pytest.raises(PermissionError):
+        pool.get_data(data_id, "subscriber_1")
+    with pytest.raises(TimeoutError):
+        pool.get_data(data_id, "subscriber_1", blocking=True, timeout=0.05)
+
+    # Un lecteur bloquant attend la fin du stockage réalisé par un autre thread
+    results = []
+    reader = threading.Thread(target=lambda: results.append(pool.get_data(data_id, "subscriber_1", blocking=True)))
+    reader.start()
+    time.sleep(0.05)
+    assert not results
+    pool.store_data(data_id, [0.1, 0.2, 0.3], "source_1")
+    reader.join(timeout=5)
+    assert results == [[0.1, 0.2, 0.3]]
+
+    # Un écrivain attend la fin des lectures en cours
+    generator = pool.get_chunk_generator(data_id, chunk_size=1, subscriber_id="subscriber_1")
+    next(generator)
+    with pytest.raises(TimeoutError):
+        pool.lock_data(data_id, timeout=0.05)
+    generator.close()
+    pool.lock_data(data_id, timeout=1)
+    assert pool.source_to_data[data_id]['locked']
+    pool.unlock_data(data_id)
+
+
+def test_lock_data_waits_for_conversion_in_other_thread():
+    pool = DataPool()
+    folder = "test_folder"
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", time_step=0.01, unit="V")
+    pool.store_data(data_id, np.arange(100, dtype=np.float32), "source_1")
+    data_obj = pool.data_registry[data_id]['data_object']
+
+    # Conversion lente dans le thread A
+    converting, release = threading.Event(), threading.Event()
+    convert_ram_to_file = data_obj.convert_ram_to_file
+
+    def slow_conversion(target_folder):
+        converting.set()
+        release.wait(5)
+        convert_ram_to_file(target_folder)
+
+    data_obj.convert_ram_to_file = slow_conversion
+    converter = threading.Thread(target=pool.convert_data_to_file, args=(data_id, folder))
+    converter.start()
+    assert converting.wait(5)
+
+    # Le thread B attend la fin de la conversion au lieu de s'approprier le verrou de A
+    with pytest.raises(TimeoutError):
+        pool.lock_data(data_id, timeout=0.05)
+    with pytest.raises(PermissionError):
+        pool.unlock_data(data_id)
+    events = []
+
+    def locker():
+        pool.lock_data(data_id, timeout=5)
+        events.append(pool.data_registry[data_id]['storage_type'])
+        pool.unlock_data(data_id)
+
+    thread_b = threading.Thread(target=locker)
+    thread_b.start()
+    time.sleep(0.05)
+    assert not events
+    release.set()
+    converter.join(timeout=5)
+    thread_b.join(timeout=5)
+    assert events == ['file'] and not pool.source_to_data[data_id]['locked']
+
+    # Verrou explicite : seul son détenteur peut le relâcher, depuis n'importe quel thread
+    pool.lock_data(data_id, owner="writer")
+    with pytest.raises(RuntimeError):
+        pool.lock_data(data_id, owner="writer")
+    with pytest.raises(PermissionError):
+        pool.unlock_data(data_id)
+    unlocker = threading.Thread(target=pool.unlock_data, args=(data_id,), kwargs={'owner': "writer"})
+    unlocker.start()
+    unlocker.join(timeout=5)
+    assert not pool.source_to_data[data_id]['locked']
+    pool.delete_data(data_id)
+
+
+def test_read_write_lock_state():
+    from src.PyDataCore.locks import ReadWriteLock
+
+    lock = ReadWriteLock()
+    assert lock.is_write_locked is False and lock.readers == 0
+    with lock.write_locked(timeout=1):
+        assert lock.is_write_locked is True
+        assert not lock.acquire_read(blocking=False)
+    assert lock.is_write_locked is False
+    with lock.read_locked(timeout=1):
+        assert lock.readers == 1 and lock.is_write_locked is False
+        with pytest.raises(TimeoutError):
+            with lock.write_locked(timeout=0.01):
+                pass
+    assert lock.readers == 0
+
+
+def test_concurrent_readers_and_conversions():
+    pool = DataPool()
+    folder = "test_folder"
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    data_value = np.arange(1000, dtype=np.float32)
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", protected=True,
+                                 time_step=0.01, unit="V")
+    pool.store_data(data_id, data_value, "source_1")
+    pool.add_subscriber(data_id, "subscriber_1")
+
+    errors = []
+
+    def reader():
+        try:
+            for _ in range(20):
+                data = pool.get_data(data_id, "subscriber_1", blocking=True, timeout=5)
+                np.testing.assert_allclose(data, data_value)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for _ in range(5):
+        pool.convert_data_to_file(data_id, folder=folder)
+        pool.convert_data_to_ram(data_id)
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert not errors
+    pool.source_to_data.set_value(data_id, 'protected', False)
+    pool.delete_data(data_id)
+
+
+def test_chunk_generator_prefetch():
+    from src.PyDataCore.streaming import prefetch
+    pool = DataPool()
+    folder = "test_folder"
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    data_value = np.arange(1000, dtype=np.float32)
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", in_file=True,
+                                 time_step=0.01, unit="V")
+    pool.add_subscriber(data_id, "subscriber_1")
+    pool.store_data(data_id, data_value, "source_1", folder=folder)
+
+    # Lecture anticipée : mêmes chunks, même ordre, libération après acquittement
+    chunks = list(pool.get_chunk_generator(data_id, chunk_size=128, subscriber_id="subscriber_1", prefetch=3))
+    assert [len(chunk) for chunk in chunks] == [128] * 7 + [104]
+    np.testing.assert_array_equal(np.concatenate(chunks), data_value)
+    assert data_id not in pool.data_registry
+
+    # Mémoire bornée : le producteur n'a jamais plus de depth éléments d'avance
+    produced = []
+
+    def source():
+        for i in range(20):
+            produced.append(i)
+            yield i
+
+    gen = prefetch(source(), 2)
+    assert next(gen) == 0
+    time.sleep(0.1)
+    assert len(produced) <= 4
+    gen.close()
+
+    # Les erreurs du producteur sont relancées côté consommateur
+    def failing():
+        yield 1
+        raise IOError("read failed")
+
+    with pytest.raises(IOError):
+        list(prefetch(failing(), 2))
+
+
+def test_chunk_generator_early_close_stops_prefetch(tmp_path):
+    pool = DataPool()
+    data_value = np.arange(4096, dtype=np.float32)
+    for overlapped in (False, True):
+        data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", in_file=True,
+                                     time_step=0.01, unit="V")
+        pool.add_subscriber(data_id, "subscriber_1")
+        pool.store_data(data_id, data_value, "source_1", folder=str(tmp_path))
+
+        # Relever les threads de préchargement encore actifs au moment où le verrou de lecture est libéré
+        item_lock = pool._item_lock(data_id)
+        release_read = item_lock.release_read
+        alive_at_release = []
+
+        def checked_release():
+            alive_at_release.append([t.name for t in threading.enumerate() if t.name == "PyDataCore-prefetch"])
+            release_read()
+
+        item_lock.release_read = checked_release
+        if overlapped:
+            gen = pool.get_overlapped_chunk_generator(data_id, chunk_size=128, overlap=32,
+                                                     subscriber_id="subscriber_1", prefetch=2)
+        else:
+            gen = pool.get_chunk_generator(data_id, chunk_size=128, subscriber_id="subscriber_1", prefetch=2)
+        next(gen)
+        gen.close()
+        assert alive_at_release == [[]]
+        pool.delete_data(data_id)
+
+
+def test_store_data_write_behind(tmp_path):
+    pool = DataPool()
+    folder = str(tmp_path)
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", in_file=True,
+                                 time_step=0.01, unit="V")
+    pool.add_subscriber(data_id, "subscriber_1")
+
+    def acquisition():
+        # Le producteur réutilise son buffer : chaque chunk doit être copié avant l'écriture
+        buffer = np.empty(100, dtype=np.float32)
+        for i in range(10):
+            buffer[:] = np.arange(i * 100, (i + 1) * 100)
+            yield buffer
+
+    handle = pool.store_data(data_id, acquisition(), "source_1", folder=folder, write_behind=True)
+    assert handle.result(timeout=5) == 1000
+    assert pool.source_to_data.get_value(data_id, 'locked') is False
+    np.testing.assert_array_equal(pool.get_data(data_id, "subscriber_1"), np.arange(1000, dtype=np.float32))
+
+    # Une erreur du générateur interrompt l'écriture et est relancée ; la donnée reste verrouillée
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", in_file=True,
+                                 time_step=0.01, unit="V")
+
+    def failing():
+        yield np.zeros(10, dtype=np.float32)
+        raise IOError("acquisition failed")
+
+    with pytest.raises(IOError):
+        pool.store_data(data_id, failing(), "source_1", folder=folder, write_behind=True)
+    assert pool.source_to_data.get_value(data_id, 'locked') is True
+
+    # Stockage RAM : le handle est déjà terminé
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", time_step=0.01, unit="V")
+    assert pool.store_data(data_id, [1.0, 2.0], "source_1", write_behind=True).done()
+
+    # Nettoyage : déverrouiller et supprimer chaque donnée, aucun fichier ne doit subsister
+    for data_id in list(pool.data_registry):
+        pool.unlock_data(data_id)
+        pool.delete_data(data_id)
+    assert os.listdir(folder) == []
+
+
+def test_ram_budget_lru_spill_and_promotion(tmp_path):
+    folder = str(tmp_path / "spill")
+    pool = DataPool(max_ram_bytes=10000, spill_folder=folder)
+    signal = np.arange(1000, dtype=np.float32)  # 4000 bytes
+    data_ids = []
+    for i in range(3):
+        data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, f"Signal {i}", "source_1", time_step=0.01, unit="V")
+        pool.add_subscriber(data_id, "subscriber_1")
+        pool.store_data(data_id, signal + i, "source_1")
+        data_ids.append(data_id)
+    protected_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Protected", "source_1", protected=True,
+                                      time_step=0.01, unit="V")
+    pool.add_subscriber(protected_id, "subscriber_1")
+
+    # Le premier signal (le moins récemment utilisé) a été déplacé en fichier
+    stats = pool.get_ram_stats()
+    assert stats['ram_bytes'] <= 10000 and stats['evictions'] == 1 and stats['spilled_bytes'] == 4000
+    assert pool.data_registry[data_ids[0]]['storage_type'] == 'file'
+    spilled_path = pool.data_registry[data_ids[0]]['data_object'].file_path
+    assert os.path.exists(spilled_path)
+
+    # La lecture est transparente et la donnée relue est ramenée en RAM à la place de la moins récente
+    np.testing.assert_array_equal(pool.get_data(data_ids[0], "subscriber_1"), signal)
+    stats = pool.get_ram_stats()
+    assert stats['promotions'] == 1 and stats['evictions'] == 2
+    assert pool.data_registry[data_ids[0]]['storage_type'] == 'ram'
+    assert pool.data_registry[data_ids[1]]['storage_type'] == 'file'
+    np.testing.assert_array_equal(pool.get_data(data_ids[1], "subscriber_1"), signal + 1)
+
+    # Les données protégées ne sont jamais déplacées
+    pool.store_data(protected_id, np.zeros(2000, dtype=np.float32), "source_1")
+    assert pool.data_registry[protected_id]['storage_type'] == 'ram'
+    assert pool.get_ram_stats()['ram_bytes'] <= 10000
+
+    # La libération d'une donnée déplacée supprime son fichier et met à jour le suivi
+    data_id = next(d for d in data_ids if pool.data_registry[d]['storage_type'] == 'file')
+    file_path = pool.data_registry[data_id]['data_object'].file_path
+    spilled = pool.get_ram_stats()['spilled']
+    pool.acknowledge_data(data_id, "subscriber_1")
+    assert not os.path.exists(file_path)
+    assert pool.get_ram_stats()['spilled'] == spilled - 1
+
+    # Nettoyage : la suppression des données restantes supprime aussi leurs fichiers de débordement
+    for data_id in list(pool.data_registry):
+        pool.source_to_data.set_value(data_id, 'protected', False)
+        pool.delete_data(data_id)
+    assert os.listdir(folder) == []
+
+
+def _shared_sum(descriptor):
+    # Exécuté dans un autre processus : attache le segment sans copie
+    with descriptor.attach() as array:
+        return float(array.sum()), array.shape
+
+
+def test_shared_memory_storage():
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    pool = DataPool()
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", shared_memory=True,
+                                 time_step=0.01, unit="V")
+    pool.add_subscriber(data_id, "subscriber_1")
+    pool.store_data(data_id, np.arange(1000, dtype=np.float32), "source_1")
+    assert pool.data_registry[data_id]['storage_type'] == 'shm'
+
+    descriptor = pool.get_shared_descriptor(data_id, "subscriber_1")
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(_shared_sum, [descriptor] * 4))
+    assert results == [(499500.0, (1000,))] * 4
+
+    # Lecture locale : vue sur le même segment, lecture par chunk inchangée
+    np.testing.assert_array_equal(pool.get_data(data_id, "subscriber_1"), np.arange(1000, dtype=np.float32))
+    assert len(pool.get_data_chunk(data_id, 2, chunk_size=400)) == 200
+
+    # Libération après acquittement : le segment est supprimé
+    pool.acknowledge_data(data_id, "subscriber_1")
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=descriptor.name)
+
+    with pytest.raises(ValueError):
+        pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", in_file=True, shared_memory=True,
+                           time_step=0.01, unit="V")
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 13), reason="track=False is used from Python 3.13")
+def test_attach_segment_leaves_resource_tracker_untouched(monkeypatch):
+    from multiprocessing import resource_tracker, shared_memory
+    from src.PyDataCore.shared import attach_segment, close_segment, create_segment, unlink_segment
+
+    register = resource_tracker.register
+    unregister = resource_tracker.unregister
+    unregistered = []
+    monkeypatch.setattr(resource_tracker, 'unregister',
+                        lambda name, rtype: (unregistered.append(name), unregister(name, rtype)))
+
+    # Attachements répétés pendant que d'autres threads créent des segments : le resource_tracker n'est jamais
+    # remplacé, les créations restent enregistrées
+    stop, replaced = threading.Event(), []
+
+    def creator():
+        while not stop.is_set():
+            if resource_tracker.register is not register:
+                replaced.append(True)
+            unlink_segment(create_segment(16))
+
+    owned = create_segment(64)
+    threads = [threading.Thread(target=creator) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for _ in range(200):
+        close_segment(attach_segment(owned.name))
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert not replaced
+    # Segment créé par ce processus : son enregistrement est conservé (seul unlink le retire)
+    assert owned._name not in unregistered
+    unlink_segment(owned)
+
+    # Segment créé ailleurs : l'enregistrement pris par l'attachement est aussitôt annulé
+    foreign = shared_memory.SharedMemory(create=True, size=16)
+    segment = attach_segment(foreign.name)
+    assert unregistered.count(foreign._name) == 1
+    close_segment(segment)
+    foreign.close()
+    shared_memory._posixshmem.shm_unlink(foreign._name)
+
+
+def _chunk_energy(chunk):
+    return np.array([np.sum(np.asarray(chunk, dtype=np.float64) ** 2)])
+
+
+def test_map_chunks():
+    pool = DataPool()
+    folder = "test_folder"
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    signal = np.arange(1000, dtype=np.float32)
+    expected = [np.sum(signal[i:i + 100].astype(np.float64) ** 2) for i in range(0, 1000, 100)]
+
+    ram_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "RAM", "source_1", time_step=0.01, unit="V")
+    pool.store_data(ram_id, signal, "source_1")
+    file_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "File", "source_1", in_file=True,
+                                 time_step=0.01, unit="V")
+    pool.add_subscriber(file_id, "subscriber_1")
+    pool.store_data(file_id, signal, "source_1", folder=folder)
+
+    # Threads : résultats dans l'ordre des chunks
+    results = list(pool.map_chunks(ram_id, _chunk_energy, chunk_size=100, workers=4))
+    np.testing.assert_allclose(np.concatenate(results), expected)
+
+    # Chevauchement : mêmes fenêtres que get_overlapped_chunk_generator
+    windows = list(pool.map_chunks(ram_id, lambda chunk: chunk, chunk_size=300, overlap=50, workers=2))
+    reference = list(pool.get_overlapped_chunk_generator(ram_id, chunk_size=300, overlap=50))
+    assert len(windows) == len(reference)
+    for window, ref in zip(windows, reference):
+        np.testing.assert_array_equal(window, ref)
+
+    # Processus : chaque worker lit son chunk dans le fichier ; résultats stockés dans une nouvelle donnée
+    output_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Energy", "source_2", time_step=1.0, unit="V2")
+    assert pool.map_chunks(file_id, _chunk_energy, chunk_size=100, workers=2, executor='process',
+                           subscriber_id="subscriber_1", output_id=output_id, output_source_id="source_2") == output_id
+    pool.add_subscriber(output_id, "subscriber_1")
+    np.testing.assert_allclose(pool.get_data(output_id, "subscriber_1"), expected)
+    # La donnée source a été acquittée et libérée
+    assert file_id not in pool.data_registry
+
+
+def test_register_folder_rebuilds_pool():
+    folder = "test_folder/rebuild"
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    pool = DataPool()
+    data_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", in_file=True,
+                                 time_step=0.01, unit="V", tmin=1.0)
+    pool.store_data(data_id, np.arange(100, dtype=np.float32), "source_1", folder=folder)
+
+    # Nouveau DataPool (redémarrage) reconstruit depuis le dossier, sans relire les données
+    restored = DataPool()
+    assert restored.register_folder(folder, "disk", protected=True) == [data_id]
+    assert restored.find(data_type=Data_Type.TEMPORAL_SIGNAL, data_name="Signal") == [data_id]
+    restored.add_subscriber(data_id, "subscriber_1")
+    data_obj = restored.get_data_object(data_id, "subscriber_1")
+    assert (data_obj.dt, data_obj.tmin, data_obj.unit) == (0.01, 1.0, "V")
+    np.testing.assert_array_equal(restored.get_data(data_id, "subscriber_1"), np.arange(100, dtype=np.float32))
+
+    # Les données déjà enregistrées sont ignorées lors d'un nouveau parcours
+    assert restored.register_folder(folder, "disk") == []
+    pool.delete_data(data_id)
+
+
+def test_catalog_save_and_load():
+    folder = "test_folder/catalog"
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    catalog_path = os.path.join(folder, "catalog.json")
+    pool = DataPool()
+    file_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", in_file=True,
+                                 time_step=0.01, unit="V")
+    pool.add_subscriber(file_id, "subscriber_1")
+    pool.add_subscriber(file_id, "subscriber_2")
+    pool.store_data(file_id, np.arange(100, dtype=np.float32), "source_1", folder=folder)
+    pool.acknowledge_data(file_id, "subscriber_1")
+    protected_id = pool.register_data(Data_Type.FREQ_SIGNAL, "Spectre", "source_2", protected=True, in_file=True,
+                                      freq_step=10.0, unit="dB")
+    pool.store_data(protected_id, np.ones(50, dtype=np.float32), "source_2", folder=folder)
+    # Les données en RAM ou en phase d'écriture ne sont pas persistées
+    ram_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "RAM", "source_1", time_step=0.01, unit="V")
+    pool.store_data(ram_id, [1.0, 2.0], "source_1")
+    pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Pending", "source_1", in_file=True, time_step=0.01, unit="V")
+    assert pool.save_catalog(catalog_path) == 2
+
+    # Redémarrage : les entrées sont restaurées sans créer les objets Data ni lire les fichiers
+    restored = DataPool.load(catalog_path)
+    assert len(restored.data_registry) == 2 and ram_id not in restored.data_registry
+    assert not restored.data_registry[file_id].loaded
+    assert restored.find(source_id="source_2") == [protected_id]
+    assert restored.find(subscriber_id="subscriber_2", data_type=Data_Type.TEMPORAL_SIGNAL) == [file_id]
+    assert restored.subscriber_to_data.pending_count(file_id) == 1
+
+    # Un nouvel instantané d'un pool restauré reste identique sans matérialiser les entrées
+    assert restored.save_catalog(catalog_path) == 2
+    assert not restored.data_registry[file_id].loaded
+
+    # Premier accès : l'objet est créé depuis les métadonnées du catalogue
+    np.testing.assert_array_equal(restored.get_data(file_id, "subscriber_2"), np.arange(100, dtype=np.float32))
+    assert restored.data_registry[file_id]['data_object'].dt == 0.01
+    file_path = restored.data_registry[file_id]['data_object'].file_path
+    restored.acknowledge_data(file_id, "subscriber_2")
+    assert file_id not in restored.data_registry and not os.path.exists(file_path)
+    assert restored.source_to_data.get_value(protected_id, 'protected') is True
+    restored.source_to_data.set_value(protected_id, 'protected', False)
+    restored.delete_data(protected_id)
+    os.remove(catalog_path)
+
+
+def test_lazy_row_concurrent_first_access():
+    from src.PyDataCore.registry import LazyRow
+
+    calls = []
+
+    def slow_loader(source):
+        calls.append(source)
+        time.sleep(0.05)
+        return {'data_object': source * 2}
+
+    row = LazyRow({'data_id': "id"}, 21, slow_loader)
+    results, errors = [], []
+
+    def reader():
+        try:
+            results.append(row['data_object'])
+        except KeyError as e:
+            errors.append(e)
+
+    readers = [threading.Thread(target=reader) for _ in range(16)]
+    for thread in readers:
+        thread.start()
+    for thread in readers:
+        thread.join(timeout=5)
+    assert not errors and results == [42] * 16 and calls == [21] and row.loaded
+    with pytest.raises(KeyError):
+        row['missing']
+
+    # Un chargement en échec est retenté au prochain accès
+    attempts = []
+
+    def failing_loader(source):
+        attempts.append(source)
+        if len(attempts) == 1:
+            raise OSError("catalog file unavailable")
+        return {'data_object': source}
+
+    row = LazyRow({'data_id': "id"}, 7, failing_loader)
+    with pytest.raises(OSError):
+        row['data_object']
+    assert not row.loaded and row['data_object'] == 7 and len(attempts) == 2
+
+
+def test_time_range_and_freq_band_reads():
+    pool = DataPool()
+    folder = "test_folder"
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    values = np.arange(2000, dtype=np.float32)
+    temp_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", in_file=True,
+                                 time_step=0.5, unit="V", tmin=10.0)
+    pool.store_data(temp_id, values, "source_1", folder=folder)
+    freq_id = pool.register_data(Data_Type.FREQ_SIGNAL, "Spectre", "source_1", freq_step=2.0, unit="dB", fmin=100.0)
+    pool.store_data(freq_id, values, "source_1")
+
+    np.testing.assert_array_equal(pool.get_time_range(temp_id, 20.0, 30.0), values[20:41])
+    time_axis, samples = pool.get_time_range(temp_id, 1009.2, 2000.0, with_axis=True)
+    np.testing.assert_array_equal(samples, values[1999:])
+    assert (time_axis.start, len(time_axis)) == (1009.5, 1)
+    np.testing.assert_array_equal(pool.get_freq_band(freq_id, 101.0, 110.0), values[1:6])
+    block_indices, block_stats = pool.find_blocks(temp_id, lambda stats: stats.max >= 1999)
+    assert list(block_indices) == [0] and block_stats.block_range(0) == (0, 2000)
+    assert pool.get_global_stats(freq_id)['sum'] == values.sum(dtype=np.float64)
+    times, minimums, maximums, means = pool.get_envelope(temp_id, 10.0, 1009.5, 4)
+    np.testing.assert_array_equal(minimums, [0, 500, 1000, 1500])
+    np.testing.assert_array_equal(maximums, [499, 999, 1499, 1999])
+    with pytest.raises(ValueError):
+        pool.get_freq_band(temp_id, 0.0, 1.0)
+
+    pool.delete_data(temp_id)
+    pool.delete_data(freq_id)
+
+
+def test_ffts_limit_compliance():
+    pool = DataPool()
+    folder = "test_folder"
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    limit_id = pool.register_data(Data_Type.FREQ_LIMIT, "Limite", "source_1", unit="dB")
+    pool.data_registry[limit_id]['data_object'].set_interpolation_type('linear')
+    pool.store_data(limit_id, [(0.0, 10.0), (100.0, 0.0)], "source_1")
+    ffts_id = pool.register_data(Data_Type.FFTS, "Spectrogramme", "source_1", freq_step=1.0, fmin=0.0, unit="dB")
+    pool.unlock_data(ffts_id)
+    ffts_obj = pool.data_registry[ffts_id]['data_object']
+    frame_ids = []
+    for i in range(5):
+        # Spectres alternativement en RAM et en fichier ; le spectre 3 dépasse la limite à 50 Hz
+        spectrum = np.full(101, -1.0, dtype=np.float32)
+        if i == 3:
+            spectrum[50] = 8.0
+        frame_id = pool.register_data(Data_Type.FREQ_SIGNAL, f"Spectre {i}", "source_1", in_file=i % 2 == 1,
+                                      freq_step=1.0, unit="dB", fmin=0.0, timestamp=0.5 * i)
+        pool.store_data(frame_id, spectrum, "source_1", folder=folder)
+        ffts_obj.add_fft_signal(pool.data_registry[frame_id]['data_object'])
+        frame_ids.append(frame_id)
+
+    result = pool.check_ffts_limit(ffts_id, limit_id, batch_size=2, workers=2)
+    assert len(result) == 5 and not result.passed
+    assert list(result.failed_frames()) == [3] and result.table['timestamp'][3] == 1.5
+    assert result.table['worst_margin'][3] == pytest.approx(-3.0) and result.table['worst_frequency'][3] == 50.0
+    np.testing.assert_allclose(result.table['worst_margin'][[0, 1, 2, 4]], 1.0)
+    assert list(result.exceeding[3]) == [50.0] and result.exceeding[0].size == 0
+    assert list(result.to_dataframe().columns) == ['frame', 'timestamp', 'worst_margin', 'worst_frequency',
+                                                   'violations']
+    np.testing.assert_array_equal(ffts_obj.check_limit(pool.data_registry[limit_id]['data_object']).table,
+                                  result.table)
+
+    for frame_id in frame_ids:
+        pool.delete_data(frame_id)
+
+
+def test_temp_limit_streaming_evaluation():
+    pool = DataPool()
+    folder = "test_folder"
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    limit_id = pool.register_data(Data_Type.TEMP_LIMIT, "Limite", "source_1", unit="V")
+    pool.unlock_data(limit_id)
+    limits = pool.data_registry[limit_id]['data_object']
+    limits.add_limit_point(5.0, 1.0, 8.0)
+    limits.add_limit_point(2.0, 3.0, 4.0)  # Fenêtre plus stricte à l'intérieur de la première
+
+    values = np.zeros(1000, dtype=np.float32)
+    values[150:170] = 6.0  # Dépasse 5 V entre 1.5 s et 1.69 s
+    values[300:420] = 3.0  # Dépasse 2 V seulement entre 3 s et 4 s
+    values[350] = 4.5
+    values[900:] = 9.0  # Hors des fenêtres : pas de limite
+    signal_id = pool.register_data(Data_Type.TEMPORAL_SIGNAL, "Signal", "source_1", in_file=True,
+                                   time_step=0.01, unit="V", tmin=0.0)
+    pool.store_data(signal_id, values, "source_1", folder=folder)
+
+    for chunk_size in (64, 4096):
+        # Les intervalles traversant la frontière entre deux chunks sont réunis
+        result = pool.check_temp_limit(signal_id, limit_id, chunk_size=chunk_size)
+        assert not result.passed and len(result) == 2
+        table = result.table
+        np.testing.assert_allclose(table['start_time'], [1.5, 3.0])
+        np.testing.assert_allclose(table['end_time'], [1.69, 4.0])
+        assert list(table['samples']) == [20, 101]
+        np.testing.assert_allclose(table['worst_time'], [1.5, 3.5])
+        np.testing.assert_allclose(table['limit'], [5.0, 2.0])
+        np.testing.assert_allclose(table['excess'], [1.0, 2.5])
+
+    limits.add_limit_point(10.0, 9.0, 10.0)
+    assert pool.data_registry[signal_id]['data_object'].check_limit(limits).table['samples'].sum() == 121
+    assert list(result.to_dataframe().columns)[:3] == ['start_time', 'end_time', 'samples']
+    pool.delete_data(signal_id)
+
+
 if __name__ == "__main__":
     # test_datapool()
     # test_datapool_all_data_types()
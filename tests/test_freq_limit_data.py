@@ -13,7 +13,7 @@ data_id = data_pool.register_data(
 )
 
 # Ajout des points de limite dans l'objet FreqLimitsData
-data_obj : FreqLimitsData= data_pool.data_registry.loc[data_pool.data_registry['data_id'] == data_id, 'data_object'].values[0]
+data_obj : FreqLimitsData= data_pool.data_registry[data_id]['data_object']
 data_obj.add_limit_point(10, -20)
 data_obj.add_limit_point(20, -10)
 data_obj.add_limit_point(40, -5)
@@ -54,3 +54,42 @@ data_pool.unlock_data(data_id)
 freq_to_interpolate_log = 100
 interpolated_level_log = data_obj.interpolate(freq_to_interpolate_log)
 print(f"Interpolated level at {freq_to_interpolate_log} Hz (logarithmic):", interpolated_level_log)
+
+
+def test_vectorized_interpolation_and_spectrum_check():
+    import numpy as np
+    import pytest
+    from src.PyDataCore import FreqSignalData
+
+    limit = FreqLimitsData("limit_vec", "Limite", 0, 0, "dB")
+    # Points ajoutés dans le désordre, avec une marche à 150 Hz
+    for frequency, level in ((1000, 40), (10, 60), (150, 60), (150, 50)):
+        limit.add_limit_point(frequency, level)
+    limit.set_interpolation_type('linear')
+    assert limit.interpolate(150) == 60 and limit.interpolate(5) == 60 and limit.interpolate(5000) == 40
+    levels = limit.interpolate(np.array([10.0, 80.0, 575.0, 1000.0]))
+    np.testing.assert_allclose(levels, [60.0, 60.0, 45.0, 40.0])
+
+    limit.set_interpolation_type('log')
+    limit.clear_limit_points()
+    limit.add_limit_point(10, -20)
+    limit.add_limit_point(1000, -10)
+    assert limit.interpolate(100) == pytest.approx(-15.0)
+    np.testing.assert_allclose(limit.interpolate([[10.0, 100.0], [1000.0, 1e4]]), [[-20.0, -15.0], [-10.0, -10.0]])
+
+    spectrum = FreqSignalData("spectrum_vec", "Spectre", 0, 0, freq_step=10.0, unit="dB", fmin=10.0)
+    values = np.full(100, -30.0, dtype=np.float32)
+    values[9] = -12.0  # 100 Hz : limite à -15 dB
+    spectrum.store_data_from_object(values)
+    result = limit.check_spectrum(spectrum)
+    assert not result['passed'] and list(result['violations']) == [9]
+    assert result['worst_margin'] == pytest.approx(-3.0) and result['worst_frequency'] == 100.0
+    assert result['margins'].shape == (100,)
+
+    pool = DataPool()
+    limit_id = pool.register_data(Data_Type.FREQ_LIMIT, "Limite", "source_1", unit="dB")
+    pool.data_registry[limit_id]['data_object'].set_interpolation_type('log')
+    pool.store_data(limit_id, [(10, -20), (1000, -10)], "source_1")
+    freq_id = pool.register_data(Data_Type.FREQ_SIGNAL, "Spectre", "source_1", freq_step=10.0, unit="dB", fmin=10.0)
+    pool.store_data(freq_id, values, "source_1")
+    assert list(pool.check_freq_limit(limit_id, freq_id)['violation_frequencies']) == [100.0]
@@ -1,5 +1,10 @@
 import os
 import numpy as np
+import pytest
+from src.PyDataCore.axis import LinearAxis
+from src.PyDataCore.blockstats import BlockStatsBuilder
+from src.PyDataCore.compression import register_codec
+from src.PyDataCore.fileformat import HEADER_SIZE, read_file_header
 from src.PyDataCore.data import TemporalSignalData, FreqSignalData
 
 
@@ -110,6 +115,433 @@ def test_read_specific_chunk_for_freq_signal():
     print("Test pour FreqSignalData terminé avec succès\n")
 
 
+def test_small_frame_file_size(tmp_path):
+    # Une petite trame ne paie que le préfixe fixe et ses métadonnées, pas une page entière
+    frame = np.arange(16, dtype=np.float32)
+    spectrum = FreqSignalData(data_id="small_frame", data_name="Trame", data_size_in_bytes=0, number_of_elements=0,
+                              freq_step=1.0, unit="dB", in_file=True)
+    spectrum.store_data_from_object(frame, folder=str(tmp_path))
+    assert HEADER_SIZE == 32
+    assert os.path.getsize(spectrum.file_path) < HEADER_SIZE + frame.nbytes + 512
+    np.testing.assert_array_equal(FreqSignalData.open(spectrum.file_path).read_data(), frame)
+
+    # Charge utile vide : les sections et les métadonnées ne recouvrent pas le préfixe
+    empty = FreqSignalData(data_id="empty_frame", data_name="Trame", data_size_in_bytes=0, number_of_elements=0,
+                           freq_step=1.0, unit="dB", in_file=True)
+    empty.store_data_from_object(np.empty(0, dtype=np.float32), folder=str(tmp_path))
+    assert read_file_header(empty.file_path)['num_samples'] == 0
+    spectrum.delete_data()
+    empty.delete_data()
+
+
+def test_numeric_reads_return_numpy_arrays():
+    signal_length = 5000
+    signal_data = np.linspace(-1, 1, signal_length)  # float64 converti en float32 au stockage
+    temp_signal = TemporalSignalData("test_numpy_signal", "Test Signal", data_size_in_bytes=signal_length * 4,
+                                     number_of_elements=signal_length, time_step=0.01, unit="V", in_file=True)
+    test_folder = "./test_data_folder"
+    if not os.path.exists(test_folder):
+        os.makedirs(test_folder)
+    temp_signal.store_data_from_object(signal_data, folder=test_folder)
+    # Préfixe + charge utile + statistiques du bloc unique (4 float64) + index des chunks + métadonnées JSON
+    sections = read_file_header(temp_signal.file_path)['sections']
+    assert sections['block_stats']['offset'] == HEADER_SIZE + signal_length * 4
+    assert sections['chunk_index']['offset'] == HEADER_SIZE + signal_length * 4 + 32
+    assert os.path.getsize(temp_signal.file_path) < HEADER_SIZE + signal_length * 4 + 32 + 8 + 1024
+
+    full_data = temp_signal.read_data()
+    assert isinstance(full_data, np.ndarray) and full_data.dtype == np.float32
+    np.testing.assert_array_almost_equal(full_data, signal_data, decimal=6)
+
+    chunks = list(temp_signal.read_chunked_data(chunk_size=1024))
+    assert all(isinstance(chunk, np.ndarray) and chunk.dtype == np.float32 for chunk in chunks)
+    np.testing.assert_array_equal(np.concatenate(chunks), full_data)
+
+    last_chunk = temp_signal.read_specific_chunk(4, 1024)
+    np.testing.assert_array_equal(last_chunk, full_data[4096:])
+    assert temp_signal.read_specific_chunk(5, 1024).size == 0
+
+    # Aller-retour fichier -> RAM -> fichier sans passer par des objets Python
+    temp_signal.convert_file_to_ram()
+    assert isinstance(temp_signal.data, np.ndarray)
+    temp_signal.convert_ram_to_file(test_folder)
+    np.testing.assert_array_equal(temp_signal.read_data(), full_data)
+
+    temp_signal.delete_data()
+    os.rmdir(test_folder)
+
+
+def test_memory_mapped_reads():
+    signal_length = 10500
+    signal_data = np.sin(np.linspace(0, 100, signal_length)).astype(np.float32)
+    freq_signal = FreqSignalData("test_mmap_signal", "Test Freq Signal", data_size_in_bytes=signal_length * 4,
+                                 number_of_elements=signal_length, freq_step=0.1, unit="V", in_file=True,
+                                 use_mmap=True)
+    test_folder = "./test_data_folder"
+    if not os.path.exists(test_folder):
+        os.makedirs(test_folder)
+    freq_signal.store_data_from_object(signal_data, folder=test_folder)
+
+    # Les lectures sont des vues en lecture seule sur une seule projection mémoire
+    full_data = freq_signal.read_data()
+    assert isinstance(full_data, np.memmap) and not full_data.flags.writeable
+    np.testing.assert_array_equal(full_data, signal_data)
+    chunk = freq_signal.read_specific_chunk(3, 1000)
+    assert np.shares_memory(chunk, full_data)
+    np.testing.assert_array_equal(chunk, signal_data[3000:4000])
+    chunks = list(freq_signal.read_chunked_data(chunk_size=4000))
+    assert [len(c) for c in chunks] == [4000, 4000, 2500]
+
+    # Réécriture : les vues existantes restent valides, les nouvelles lectures voient les nouvelles données
+    freq_signal.store_data_from_object(signal_data * 2, folder=test_folder)
+    np.testing.assert_array_equal(chunk, signal_data[3000:4000])
+    np.testing.assert_array_equal(freq_signal.read_specific_chunk(3, 1000), signal_data[3000:4000] * 2)
+
+    del full_data, chunk, chunks
+    freq_signal.delete_data()
+    os.rmdir(test_folder)
+
+
+def expected_windows(data, chunk_size, hop):
+    """ Fenêtres de référence : départ tous les hop samples, arrêt à la première fenêtre atteignant la fin """
+    windows, start = [], 0
+    while start < len(data):
+        windows.append(data[start:start + chunk_size])
+        if start + chunk_size >= len(data):
+            break
+        start += hop
+    return windows
+
+
+def test_overlapped_windows_ram_file_and_mmap():
+    test_folder = "./test_data_folder"
+    if not os.path.exists(test_folder):
+        os.makedirs(test_folder)
+
+    for signal_length in [1000, 1024, 100]:
+        signal_data = np.arange(signal_length, dtype=np.float32)
+        signals = {}
+        for mode in ("ram", "file", "mmap"):
+            signal = TemporalSignalData(f"test_overlap_{mode}", "Test Signal", data_size_in_bytes=signal_length * 4,
+                                        number_of_elements=signal_length, time_step=0.01, unit="V",
+                                        in_file=mode != "ram", use_mmap=mode == "mmap")
+            signal.store_data_from_object(signal_data, folder=test_folder)
+            signals[mode] = signal
+
+        for chunk_size, overlap in [(256, 50), (256, 75), (256, 0), (100, 33)]:
+            hop = TemporalSignalData._overlap_hop(chunk_size, overlap)
+            expected = expected_windows(signal_data, chunk_size, hop)
+            full = [w for w in expected if len(w) == chunk_size]
+            for mode, signal in signals.items():
+                windows = list(signal.read_overlapped_chunked_data(chunk_size, overlap=overlap))
+                assert len(windows) == len(expected), (mode, chunk_size, overlap)
+                for window, expected_window in zip(windows, expected):
+                    np.testing.assert_array_equal(window, expected_window)
+
+                # Mode par lots : tableaux 2-D de fenêtres complètes
+                batches = list(signal.read_overlapped_chunked_data(chunk_size, overlap=overlap, batch_size=3))
+                assert all(batch.ndim == 2 and batch.shape[1] == chunk_size for batch in batches)
+                stacked = np.concatenate(batches) if batches else np.empty((0, chunk_size))
+                np.testing.assert_array_equal(stacked, np.array(full).reshape(-1, chunk_size))
+
+        # En RAM, les fenêtres sont des vues sur les données
+        window = next(signals["ram"].read_overlapped_chunked_data(256, overlap=50))
+        assert np.shares_memory(window, signals["ram"].data)
+        for signal in signals.values():
+            if signal.in_file:
+                signal.delete_data()
+
+    with pytest.raises(ValueError):
+        next(signals["ram"].read_overlapped_chunked_data(256, overlap=100))
+    os.rmdir(test_folder)
+
+
+def test_self_describing_file_open():
+    test_folder = "./test_data_folder"
+    if not os.path.exists(test_folder):
+        os.makedirs(test_folder)
+
+    def acquisition():
+        for i in range(4):
+            yield np.arange(i * 250, (i + 1) * 250, dtype=np.float32)
+
+    temp_signal = TemporalSignalData(data_id="temp_header", data_name="Courant", data_size_in_bytes=0,
+                                     number_of_elements=0, time_step=0.001, unit="A", tmin=2.5, in_file=True)
+    temp_signal.store_data_from_data_generator(acquisition(), folder=test_folder)
+    freq_signal = FreqSignalData(data_id="freq_header", data_name="Spectre", data_size_in_bytes=0,
+                                 number_of_elements=0, freq_step=10.0, unit="dBuV", fmin=150.0, timestamp=1.5,
+                                 in_file=True)
+    freq_signal.store_data_from_object(np.linspace(0, 1, 300, dtype=np.float32), folder=test_folder)
+
+    # Réouverture depuis le seul en-tête : métadonnées et lectures identiques
+    reopened = TemporalSignalData.open(temp_signal.file_path)
+    assert (reopened.data_id, reopened.data_name, reopened.dt, reopened.tmin, reopened.unit) == \
+           ("temp_header", "Courant", 0.001, 2.5, "A")
+    assert reopened.num_samples == 1000 and reopened.data_ready.is_set()
+    np.testing.assert_array_equal(reopened.read_data(), np.arange(1000, dtype=np.float32))
+    np.testing.assert_array_equal(reopened.read_chunk_index(), [0, 250, 500, 750])
+    chunks = list(reopened.read_chunked_data(chunk_size=300))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    np.testing.assert_array_equal(reopened.read_specific_chunk(3, 300), np.arange(900, 1000, dtype=np.float32))
+
+    mapped = TemporalSignalData.open(temp_signal.file_path, use_mmap=True)
+    np.testing.assert_array_equal(mapped.read_data(), np.arange(1000, dtype=np.float32))
+    windows = list(mapped.read_overlapped_chunked_data(400, overlap=50))
+    assert [len(window) for window in windows] == [400, 400, 400, 400]
+
+    reopened_freq = FreqSignalData.open(freq_signal.file_path)
+    assert (reopened_freq.df, reopened_freq.fmin, reopened_freq.timestamp, reopened_freq.unit) == \
+           (10.0, 150.0, 1.5, "dBuV")
+    np.testing.assert_allclose(reopened_freq.read_data(), np.linspace(0, 1, 300, dtype=np.float32))
+
+    # Mauvais type de données ou fichier sans en-tête
+    with pytest.raises(ValueError):
+        FreqSignalData.open(temp_signal.file_path)
+    raw_path = os.path.join(test_folder, "raw.dat")
+    np.arange(10, dtype=np.float32).tofile(raw_path)
+    with pytest.raises(ValueError):
+        TemporalSignalData.open(raw_path)
+
+    del mapped, windows
+    os.remove(raw_path)
+    temp_signal.delete_data()
+    freq_signal.delete_data()
+    os.rmdir(test_folder)
+
+
+def test_compressed_block_storage():
+    test_folder = "./test_data_folder"
+    if not os.path.exists(test_folder):
+        os.makedirs(test_folder)
+    values = np.repeat(np.arange(100, dtype=np.float32), 100)  # 10000 samples très compressibles
+
+    def acquisition():
+        for i in range(0, len(values), 700):
+            yield values[i:i + 700]
+
+    signal = TemporalSignalData(data_id="temp_zlib", data_name="Tension", data_size_in_bytes=0, number_of_elements=0,
+                                time_step=0.001, unit="V", in_file=True, compression='zlib', block_size=1000)
+    signal.store_data_from_data_generator(acquisition(), folder=test_folder)
+    assert os.path.getsize(signal.file_path) < HEADER_SIZE + values.nbytes // 4
+    metadata = read_file_header(signal.file_path)
+    assert metadata['compression'] == {'codec': 'zlib', 'block_size': 1000}
+    assert metadata['sections']['block_index']['count'] == 11
+
+    # Accès direct : seuls les blocs touchés sont décompressés (et gardés en cache)
+    np.testing.assert_array_equal(signal.read_specific_chunk(3, 1500), values[4500:6000])
+    assert sorted(signal._block_cache) == [4, 5]
+    np.testing.assert_array_equal(signal.read_range(9990, 20000), values[9990:])
+    np.testing.assert_array_equal(signal.read_data(), values)
+    chunks = list(signal.read_chunked_data(chunk_size=1500))
+    assert [len(chunk) for chunk in chunks] == [1500] * 6 + [1000]
+    np.testing.assert_array_equal(np.concatenate(chunks), values)
+    windows = list(signal.read_overlapped_chunked_data(4000, overlap=50))
+    assert [len(window) for window in windows] == [4000, 4000, 4000, 4000]
+    np.testing.assert_array_equal(windows[-1], values[6000:])
+    batches = list(signal.read_overlapped_chunked_data(4000, overlap=50, batch_size=2))
+    assert [batch.shape for batch in batches] == [(2, 4000), (2, 4000)]
+
+    # Réouverture depuis l'en-tête, codec personnalisé et écriture déportée
+    np.testing.assert_array_equal(TemporalSignalData.open(signal.file_path).read_range(1234, 5678),
+                                  values[1234:5678])
+    register_codec('identity', bytes, bytes)
+    freq_signal = FreqSignalData(data_id="freq_identity", data_name="Spectre", data_size_in_bytes=0,
+                                 number_of_elements=0, freq_step=1.0, unit="dB", in_file=True,
+                                 compression='identity', block_size=64)
+    freq_signal.store_data_from_data_generator(acquisition(), folder=test_folder, write_behind=True).result()
+    np.testing.assert_array_equal(FreqSignalData.open(freq_signal.file_path).read_data(), values)
+    with pytest.raises(ValueError):
+        freq_signal.set_compression('unknown')
+
+    signal.delete_data()
+    freq_signal.delete_data()
+    os.rmdir(test_folder)
+
+
+def test_quantized_storage():
+    test_folder = "./test_data_folder"
+    if not os.path.exists(test_folder):
+        os.makedirs(test_folder)
+    values = (np.sin(np.arange(5000) / 50.0) * 10 + 3).astype(np.float32)
+
+    # En RAM : codes int16 (moitié de la taille float32) et lectures en float32
+    signal = TemporalSignalData(data_id="temp_int16", data_name="Tension", data_size_in_bytes=0, number_of_elements=0,
+                                time_step=0.001, unit="V", quantization='int16', block_size=1000)
+    signal.store_data_from_object(values)
+    assert signal.data.dtype == np.int16
+    assert signal.ram_footprint() < values.nbytes // 2 + 200
+    tolerance = 20 / 65534 + 1e-5  # scale / 2 sur un bloc de 20 V d'amplitude
+    restored = signal.read_data()
+    assert restored.dtype == np.float32
+    np.testing.assert_allclose(restored, values, atol=tolerance)
+    np.testing.assert_allclose(signal.read_range(999, 2001), values[999:2001], atol=tolerance)
+    np.testing.assert_allclose(np.concatenate(list(signal.read_chunked_data(chunk_size=700))), values, atol=tolerance)
+    windows = list(signal.read_overlapped_chunked_data(2000, overlap=50))
+    np.testing.assert_allclose(windows[1], values[1000:3000], atol=tolerance)
+
+    # Fichier (int8, compressé, écrit par générateur) puis retour en RAM sans requantification
+    signal_int8 = TemporalSignalData(data_id="temp_int8", data_name="Tension", data_size_in_bytes=0,
+                                     number_of_elements=0, time_step=0.001, unit="V", in_file=True,
+                                     compression='zlib', block_size=1000, quantization='int8')
+    signal_int8.store_data_from_data_generator((values[i:i + 600] for i in range(0, 5000, 600)), folder=test_folder)
+    tolerance = 20 / 254 + 1e-5
+    reopened = TemporalSignalData.open(signal_int8.file_path)
+    assert reopened.quantization == 'int8' and reopened.compression == 'zlib'
+    np.testing.assert_allclose(reopened.read_data(), values, atol=tolerance)
+    np.testing.assert_allclose(reopened.read_specific_chunk(2, 1500), values[3000:4500], atol=tolerance)
+    signal_int8.convert_file_to_ram()
+    assert signal_int8.data.dtype == np.int8
+    np.testing.assert_allclose(signal_int8.read_data(), values, atol=tolerance)
+    signal_int8.convert_ram_to_file(test_folder)
+    np.testing.assert_array_equal(signal_int8.read_data(), reopened.read_data())
+    with pytest.raises(ValueError):
+        signal_int8.set_quantization('int16')
+
+    signal_int8.delete_data()
+    os.rmdir(test_folder)
+
+
+def test_time_range_and_freq_band():
+    test_folder = "./test_data_folder"
+    if not os.path.exists(test_folder):
+        os.makedirs(test_folder)
+    values = np.arange(1000, dtype=np.float32)
+
+    # Axe généré à la demande : tranches, conversion en indices (bornes incluses), matérialisation
+    axis = LinearAxis(2.0, 0.1, 1000)
+    assert len(axis) == 1000 and axis[-1] == pytest.approx(101.9)
+    assert axis.index_range(2.3, 2.5) == (3, 6)
+    assert axis.index_range(-5, 2.05) == (0, 1) and axis.index_range(500, 600) == (1000, 1000)
+    assert axis[10:20:2] == LinearAxis(3.0, 0.2, 5)
+    np.testing.assert_allclose(np.asarray(axis[:3]), [2.0, 2.1, 2.2])
+    with pytest.raises(ValueError):
+        axis.index_range(3, 2)
+
+    for use_mmap in (False, True):
+        temp_signal = TemporalSignalData(data_id="temp_range", data_name="Tension", data_size_in_bytes=0,
+                                         number_of_elements=0, time_step=0.001, unit="V", tmin=1.0, in_file=True,
+                                         use_mmap=use_mmap)
+        temp_signal.store_data_from_object(values, folder=test_folder)
+        np.testing.assert_array_equal(temp_signal.read_time_range(1.1, 1.2), values[100:201])
+        time_axis, samples = temp_signal.read_time_range(1.5, 5.0, with_axis=True)
+        np.testing.assert_array_equal(samples, values[500:])
+        assert time_axis.start == pytest.approx(1.5) and len(time_axis) == 500
+        temp_signal.delete_data()
+
+    freq_signal = FreqSignalData(data_id="freq_band", data_name="Spectre", data_size_in_bytes=0, number_of_elements=0,
+                                 freq_step=10.0, unit="dB", fmin=150.0)
+    freq_signal.store_data_from_object(values)
+    band_axis, band = freq_signal.read_freq_band(1000.0, 1100.0, with_axis=True)
+    np.testing.assert_array_equal(band, values[85:96])
+    assert (band_axis.start, len(band_axis)) == (1000.0, 11)
+    os.rmdir(test_folder)
+
+
+def test_envelope_pyramid():
+    test_folder = "./test_data_folder"
+    if not os.path.exists(test_folder):
+        os.makedirs(test_folder)
+    values = np.random.default_rng(0).normal(size=200_003).astype(np.float32)
+    values[123_456] = 50.0  # Pic isolé que le résumé doit conserver
+
+    signal = TemporalSignalData(data_id="temp_envelope", data_name="Tension", data_size_in_bytes=0,
+                                number_of_elements=0, time_step=0.001, unit="V", in_file=True, envelope=True)
+    signal.store_data_from_data_generator((values[i:i + 7000] for i in range(0, len(values), 7000)),
+                                          folder=test_folder)
+    metadata = read_file_header(signal.file_path)
+    assert metadata['envelope']['levels'] == 3  # 196, 25 puis 4 points
+    assert metadata['sections']['envelope_0']['count'] == 196 * 3
+
+    def exact_envelope(t0, t1, n_points):
+        start, stop = signal.time_axis().index_range(t0, t1)
+        edges = start + np.arange(n_points + 1) * (stop - start) // n_points
+        parts = [values[edges[i]:edges[i + 1]] for i in range(n_points)]
+        return edges[:-1] * 0.001, [p.min() for p in parts], [p.max() for p in parts], \
+            [p.mean(dtype=np.float64) for p in parts]
+
+    # Plages lues dans la pyramide : chaque point résume exactement sa plage de samples, y compris pour une plage
+    # commençant juste après le pic ou un point se terminant juste avant
+    for t0, t1, n_points in ((0.0, 1000.0, 2), (0.0, 123.455, 1), (123.457, 200.002, 1), (3.2107, 197.5, 2)):
+        times, minimums, maximums, means = signal.read_envelope(t0, t1, n_points)
+        expected = exact_envelope(t0, t1, n_points)
+        np.testing.assert_allclose(times, expected[0])
+        np.testing.assert_array_equal(minimums, expected[1])
+        np.testing.assert_array_equal(maximums, expected[2])
+        np.testing.assert_allclose(means, expected[3], rtol=1e-9, atol=1e-12)
+    assert signal.read_envelope(0.0, 1000.0, 2)[2].tolist() == [values[:100_001].max(), 50.0]
+    assert signal.read_envelope(123.457, 200.002, 1)[2].max() < 50.0
+
+    times, minimums, maximums, means = signal.read_envelope(0.0, 1000.0, 20)
+    assert len(times) == 20 and times[0] == 0.0
+    assert maximums.max() == 50.0 and maximums.argmax() == 123_456 * 20 // 200_003
+    assert minimums.min() == values.min()
+    assert means.mean() == pytest.approx(values.mean(), abs=1e-3)
+
+    # Plage courte : résumé exact calculé sur les samples
+    times, minimums, maximums, means = signal.read_envelope(10.0, 10.009, 5)
+    np.testing.assert_allclose(times, [10.0, 10.002, 10.004, 10.006, 10.008])
+    np.testing.assert_array_equal(maximums, values[10_000:10_010].reshape(5, 2).max(axis=1))
+
+    # La pyramide suit la donnée lors des conversions RAM / fichier et de la réouverture
+    reopened = TemporalSignalData.open(signal.file_path)
+    np.testing.assert_array_equal(reopened.read_envelope(0.0, 1000.0, 20)[2], signal.read_envelope(0.0, 1000.0, 20)[2])
+    signal.convert_file_to_ram()
+    assert signal.read_envelope(0.0, 1000.0, 20)[2].max() == 50.0
+    signal.delete_data()
+    os.rmdir(test_folder)
+
+
+def test_block_stats_index():
+    test_folder = "./test_data_folder"
+    if not os.path.exists(test_folder):
+        os.makedirs(test_folder)
+    values = np.zeros(10_500, dtype=np.float32)
+    values[4321] = 7.5  # Dépassement dans le bloc 4
+    values[9000:9100] = -2.0  # Bloc 9 de RMS élevée
+
+    signal = TemporalSignalData(data_id="temp_stats", data_name="Tension", data_size_in_bytes=0, number_of_elements=0,
+                                time_step=0.001, unit="V", in_file=True, compression='zlib', block_size=1000)
+    signal.store_data_from_data_generator((values[i:i + 1300] for i in range(0, len(values), 1300)),
+                                          folder=test_folder)
+    assert read_file_header(signal.file_path)['block_stats'] == {'block_size': 1000}
+    np.testing.assert_array_equal(signal.find_blocks(lambda stats: stats.max > 5.0), [4])
+    np.testing.assert_array_equal(signal.find_blocks(lambda stats: stats.rms > 0.5), [9])
+    assert signal.block_statistics().count[-1] == 500
+
+    # Seuls les blocs candidats sont lus (et décompressés)
+    signal._block_cache.clear()
+    [(index, samples)] = list(signal.read_blocks(signal.find_blocks(lambda stats: stats.min < -1.0)))
+    assert index == 9 and sorted(signal._block_cache) == [9]
+    np.testing.assert_array_equal(samples, values[9000:10000])
+
+    totals = signal.global_stats()
+    assert totals['count'] == 10_500 and totals['max'] == 7.5 and totals['min'] == -2.0
+    assert totals['mean'] == pytest.approx(values.mean(dtype=np.float64))
+    assert totals['rms'] == pytest.approx(np.sqrt(np.mean(values.astype(np.float64) ** 2)))
+
+    # Réouverture : index relu depuis le fichier ; en RAM : index calculé au besoin
+    reopened = TemporalSignalData.open(signal.file_path)
+    assert reopened.global_stats() == totals
+    freq_signal = FreqSignalData(data_id="freq_stats", data_name="Spectre", data_size_in_bytes=0, number_of_elements=0,
+                                 freq_step=1.0, unit="dB")
+    freq_signal.store_data_from_object(values)
+    np.testing.assert_array_equal(freq_signal.find_blocks(lambda stats: stats.max > 5.0), [0])
+    assert freq_signal.global_stats()['max'] == 7.5
+    with pytest.raises(ValueError):
+        freq_signal.find_blocks(lambda stats: True)
+
+    # Somme des carrés accumulée en float64 même pour des samples float32 décalés
+    offset = (1000.0 + np.random.default_rng(0).standard_normal(3 * 65536)).astype(np.float32)
+    builder = BlockStatsBuilder(65536)
+    builder.write(offset[:100_000])
+    builder.write(offset[100_000:])
+    expected = np.square(offset.astype(np.float64)).reshape(3, -1).sum(axis=1)
+    np.testing.assert_allclose(builder.close().sumsq, expected, rtol=1e-12)
+
+    signal.delete_data()
+    os.rmdir(test_folder)
+
+
 if __name__ == "__main__":
     test_read_specific_chunk_for_temporal_signal()
     test_read_specific_chunk_for_freq_signal()
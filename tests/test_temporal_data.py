@@ -49,3 +49,38 @@ print(tabulate(limits_in_range, headers=["Level", "Transparency Time", "Release
 # Vérifier que les limites min et max sont correctes
 print(f"\nMinimum Transparency Time: {temp_limits_data.time_min}")
 print(f"Maximum Release Time: {temp_limits_data.time_max}")
+
+
+def test_temp_limits_interval_index():
+    import numpy as np
+    import pytest
+
+    limits = TempLimitsData("temp_limits_index", "Limites", 0, 0, "V")
+    for level, transparency_time, release_time in [(1.0, 0.0, 10.0), (2.0, 2.0, 3.0), (3.0, 4.0, 6.0),
+                                                   (4.0, 5.0, 5.5), (5.0, 8.0, 9.0)]:
+        limits.add_limit_point(level, transparency_time, release_time)
+    with pytest.raises(ValueError):
+        limits.add_limit_point(6.0, 12.0, 11.0)
+
+    # Requêtes ponctuelles : une longue fenêtre reste active par-dessus les suivantes
+    assert limits.limits_at(5.2) == [(1.0, 0.0, 10.0), (3.0, 4.0, 6.0), (4.0, 5.0, 5.5)]
+    assert limits.limits_at(11.0) == []
+    assert limits.get_limits_in_range(1.0, 6.0) == [(2.0, 2.0, 3.0), (3.0, 4.0, 6.0), (4.0, 5.0, 5.5)]
+
+    # Formes groupées
+    offsets, indices = limits.windows_at([2.5, 7.0, 20.0])
+    assert list(offsets) == [0, 2, 3, 3] and list(indices) == [0, 1, 0]
+    offsets, indices = limits.get_limits_in_ranges([0.0, 4.5], [3.0, 9.0])
+    assert list(indices[offsets[0]:offsets[1]]) == [1] and list(indices[offsets[1]:offsets[2]]) == [3, 4]
+    offsets, indices = limits.windows_overlapping([6.5], [8.5])
+    assert list(indices) == [0, 4]
+    levels, transparency_times, release_times = limits.limit_columns()
+    np.testing.assert_array_equal(levels, [1.0, 2.0, 3.0, 4.0, 5.0])
+    with pytest.raises(ValueError):
+        levels[0] = 0.0
+
+    # Liste remplacée (store_data) : l'index est reconstruit
+    limits.data = [(7.0, 1.0, 2.0), (8.0, 1.5, 4.0)]
+    assert limits.limits_at(1.8) == [(7.0, 1.0, 2.0), (8.0, 1.5, 4.0)]
+    limits.clear_limit_points()
+    assert limits.limits_at(1.8) == []